@@ -25,12 +25,129 @@ bl_info = {
 }
 
 import bpy
+import bmesh  # after bpy: bmesh is only importable once bpy is loaded
+import concurrent.futures
+import contextlib
+import csv
+import gc
+import gzip
+import hashlib
+import io
+import json
+import math
 import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from typing import NamedTuple
+
+import numpy as np
 
 SEQ_PAD = 4                   # digits for sequence index (per-frame mode)
 USE_SYSTEM_PROGRESS_HUD = False
+REDRAW_INTERVAL = 0.1         # seconds between progress redraws while exporting
+DEDUP_FILE = "fbxseq_dedup.json"  # skipped-frame manifest (dedup 'MANIFEST' method)
+MANIFEST_FILE = "fbxseq_manifest.jsonl"  # per-folder record of exported files
+MANIFEST_FLUSH_INTERVAL = 2.0  # seconds between manifest flushes to disk
+ARCHIVE_INDEX = "fbxseq_index.json"  # frame index stored inside each sequence archive
+REPORT_FILE = "fbxseq_report"  # performance report (.json / .csv) per export folder
+TIMING_FILE = "fbxseq_timing.csv"  # source frame of every file written with adaptive sampling
+MEMORY_CHECK_INTERVAL = 0.5   # seconds between process memory checks while exporting
+SCRATCH_COPY_DIR = "fbxseq_scratch_copies"  # scratch folder keeping the 'COPY' commit action's local copies
+SCRATCH_COPY_LIMIT = 256      # local copies kept there (oldest evicted first)
 
 # --------------------- Properties ---------------------
+_APPLY_SCALINGS_ITEMS = [
+    ('ALL_LOCAL', "All Local", "Apply scaling to object transforms (FBX scale stays 1.0)"),
+    ('FBX_ALL',   "FBX All",   "Apply custom + units scaling to FBX scale"),
+    ('FBX_UNITS', "FBX Units", "Apply units scaling to FBX scale"),
+]
+_AXIS_FORWARD_ITEMS = [('X', "X Forward", ""), ('Y', "Y Forward", ""), ('Z', "Z Forward", ""),
+                       ('-X', "-X Forward", ""), ('-Y', "-Y Forward", ""), ('-Z', "-Z Forward", "")]
+_AXIS_UP_ITEMS = [('X', "X Up", ""), ('Y', "Y Up", ""), ('Z', "Z Up", ""),
+                  ('-X', "-X Up", ""), ('-Y', "-Y Up", ""), ('-Z', "-Z Up", "")]
+
+class FBXExportProfile(bpy.types.PropertyGroup):
+    """One output variant: the same frames written again with its own transform options."""
+    # `name` (the default PropertyGroup name) is the profile label and default sub-folder
+    enabled: bpy.props.BoolProperty(name="Enabled", description="Write this profile", default=True)
+    subfolder: bpy.props.StringProperty(
+        name="Sub-Folder",
+        description="Folder inside the export folder for this profile's files (empty = profile name)",
+        default=""
+    )
+    global_scale: bpy.props.FloatProperty(
+        name="Scale", description="Global scale applied at export",
+        default=1.00, min=0.001, soft_max=100.0
+    )
+    apply_scalings: bpy.props.EnumProperty(
+        name="Apply Scalings", description="How scaling is applied to the generated FBX",
+        items=_APPLY_SCALINGS_ITEMS, default='ALL_LOCAL'
+    )
+    axis_forward: bpy.props.EnumProperty(
+        name="Forward", description="Forward axis", items=_AXIS_FORWARD_ITEMS, default='-Z'
+    )
+    axis_up: bpy.props.EnumProperty(
+        name="Up", description="Up axis", items=_AXIS_UP_ITEMS, default='Y'
+    )
+    bake_space_transform: bpy.props.BoolProperty(
+        name="Apply Transform", description="Bake object/world space transforms into FBX",
+        default=True
+    )
+    use_mesh_modifiers: bpy.props.BoolProperty(
+        name="Apply Modifiers", description="Apply visible modifiers", default=True
+    )
+
+class FBXQueueObject(bpy.types.PropertyGroup):
+    object: bpy.props.PointerProperty(type=bpy.types.Object)
+
+class FBXExportQueueJob(bpy.types.PropertyGroup):
+    """One queued export: what to export, and the exporter settings captured when it was added."""
+    # `name` (the default PropertyGroup name) is the job label
+    enabled: bpy.props.BoolProperty(name="Enabled", description="Run this job with the queue", default=True)
+    priority: bpy.props.IntProperty(
+        name="Priority", description="Jobs with a higher priority run first; equal priorities run in queue order",
+        default=0
+    )
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('OBJECTS', "Objects", "The objects selected when the job was added"),
+            ('COLLECTION', "Collection", "All exportable objects of a collection when the job runs"),
+        ],
+        default='OBJECTS'
+    )
+    objects: bpy.props.CollectionProperty(type=FBXQueueObject)
+    collection: bpy.props.PointerProperty(type=bpy.types.Collection)
+    settings: bpy.props.StringProperty(
+        name="Settings", description="Exporter settings captured when the job was added (JSON)", default="{}"
+    )
+    status: bpy.props.EnumProperty(
+        name="Status",
+        items=[
+            ('QUEUED', "Queued", ""),
+            ('RUNNING', "Running", ""),
+            ('DONE', "Done", ""),
+            ('FAILED', "Failed", ""),
+            ('CANCELLED', "Cancelled", ""),
+        ],
+        default='QUEUED'
+    )
+    message: bpy.props.StringProperty(name="Result", default="")
+
+# Exporter settings a profile replaces
+_PROFILE_KEYS = (
+    "global_scale", "apply_scalings", "axis_forward", "axis_up",
+    "bake_space_transform", "use_mesh_modifiers",
+)
+
 class FBXExporterProperties(bpy.types.PropertyGroup):
     # Export mode
     export_mode: bpy.props.EnumProperty(
@@ -39,11 +156,42 @@ class FBXExporterProperties(bpy.types.PropertyGroup):
         items=[
             ('SEQUENCE', "Per-Frame Sequence", "Export a sequence (one FBX per frame per object)"),
             ('PER_OBJECT', "Per-Object (Single FBX each)", "Export one FBX per selected object (current frame)"),
+            ('GROUPED', "Grouped (One FBX per Frame)",
+             "Export all selected objects together into one FBX per frame (or one per top-level collection)"),
+            ('POINT_CACHE', "Point Cache (FBX + Positions)",
+             "Export one full FBX per object, then only vertex positions per frame into a binary cache; "
+             "a new full FBX is written whenever the topology changes"),
+            ('POSE', "Pose Only (Armatures)",
+             "Export each selected armature with its skinned meshes once, then only its pose per frame; "
+             "other selected objects are exported as a sequence"),
         ],
         default='SEQUENCE'
     )
+    pose_format: bpy.props.EnumProperty(
+        name="Pose Format",
+        description="How per-frame poses are written in Pose Only mode",
+        items=[
+            ('TABLE', "Binary Table (.fbxpose)",
+             "One binary file per armature with the local matrix of every bone for every frame"),
+            ('FBX', "Skeleton FBX per Frame", "One FBX per frame containing only the armature"),
+        ],
+        default='TABLE'
+    )
+
+    # GROUPED mode: which selected objects share a file
+    group_by: bpy.props.EnumProperty(
+        name="Group By",
+        description="How selected objects are grouped into files in Grouped mode",
+        items=[
+            ('ALL', "All Selected", "One file per frame with every selected object, named after the scene"),
+            ('COLLECTION', "Top-Level Collection",
+             "One file per frame for each top-level collection, named after the collection"),
+        ],
+        default='ALL'
+    )
 
-    # Object ordering (used in PER_OBJECT mode; also used as iteration order in SEQUENCE)
+    # Object ordering (used in PER_OBJECT mode; also the iteration order in SEQUENCE and
+    # the object order inside each file in GROUPED)
     object_order: bpy.props.EnumProperty(
         name="Object Order",
         description="Ordering for selected objects",
@@ -104,24 +252,14 @@ class FBXExporterProperties(bpy.types.PropertyGroup):
     apply_scalings: bpy.props.EnumProperty(
         name="Apply Scalings",
         description="How scaling is applied to the generated FBX",
-        items=[
-            ('ALL_LOCAL', "All Local", "Apply scaling to object transforms (FBX scale stays 1.0)"),
-            ('FBX_ALL',   "FBX All",   "Apply custom + units scaling to FBX scale"),
-            ('FBX_UNITS', "FBX Units", "Apply units scaling to FBX scale"),
-        ],
+        items=_APPLY_SCALINGS_ITEMS,
         default='ALL_LOCAL'
     )
     axis_forward: bpy.props.EnumProperty(
-        name="Forward", description="Forward axis",
-        items=[('X', "X Forward", ""), ('Y', "Y Forward", ""), ('Z', "Z Forward", ""),
-               ('-X', "-X Forward", ""), ('-Y', "-Y Forward", ""), ('-Z', "-Z Forward", "")],
-        default='-Z'
+        name="Forward", description="Forward axis", items=_AXIS_FORWARD_ITEMS, default='-Z'
     )
     axis_up: bpy.props.EnumProperty(
-        name="Up", description="Up axis",
-        items=[('X', "X Up", ""), ('Y', "Y Up", ""), ('Z', "Z Up", ""),
-               ('-X', "-X Up", ""), ('-Y', "-Y Up", ""), ('-Z', "-Z Up", "")],
-        default='Y'
+        name="Up", description="Up axis", items=_AXIS_UP_ITEMS, default='Y'
     )
     bake_space_transform: bpy.props.BoolProperty(
         name="Apply Transform", description="Bake object/world space transforms into FBX",
@@ -134,6 +272,234 @@ class FBXExporterProperties(bpy.types.PropertyGroup):
         name="Bake Animation", description="Bake current frame pose when exporting frames", default=True
     )
 
+    # Lean payload: data left out of every exported mesh (source objects are not modified)
+    strip_uvs: bpy.props.BoolProperty(
+        name="UVs", description="Leave UV maps out of exported meshes", default=False
+    )
+    strip_colors: bpy.props.BoolProperty(
+        name="Colors", description="Leave color attributes out of exported meshes", default=False
+    )
+    strip_materials: bpy.props.BoolProperty(
+        name="Materials", description="Leave materials (and their textures) out of exported meshes", default=False
+    )
+    strip_normals: bpy.props.BoolProperty(
+        name="Normals",
+        description="Native Mesh Writer only: write positions and faces without normals "
+                    "(Blender FBX always writes normals)",
+        default=False
+    )
+    export_engine: bpy.props.EnumProperty(
+        name="Engine",
+        description="Exporter used to write each file",
+        items=[
+            ('BLENDER', "Blender FBX", "Blender's FBX exporter (all object types, materials, armatures)"),
+            ('NATIVE', "Native Mesh Writer",
+             "Fast NumPy-based binary FBX writer for mesh-like objects (geometry, normals, active UV only); "
+             "other object types fall back to Blender FBX"),
+        ],
+        default='BLENDER'
+    )
+
+    # Scheduling
+    parallel_export: bpy.props.BoolProperty(
+        name="Parallel Export",
+        description="Export the sequence with several background Blender processes working on a snapshot of this file",
+        default=False
+    )
+    parallel_workers: bpy.props.IntProperty(
+        name="Workers", description="Number of background Blender processes for parallel export",
+        default=4, min=2, soft_max=32
+    )
+    isolate_evaluation: bpy.props.BoolProperty(
+        name="Evaluate Dependencies Only",
+        description="While exporting, exclude the view layer collections that hold neither the exported objects "
+                    "nor anything they depend on (parents, constraint, modifier and driver targets), so frame "
+                    "changes only evaluate those; the view layer is restored afterwards",
+        default=False
+    )
+    # Adaptive sampling (SEQUENCE / GROUPED): skip frames that barely differ from the last exported one
+    adaptive_sampling: bpy.props.BoolProperty(
+        name="Adaptive Sampling",
+        description="Export a frame only when an object has moved more than the tolerance since its last "
+                    f"exported frame; the source frame of every file is written to {TIMING_FILE}",
+        default=False
+    )
+    adaptive_metric: bpy.props.EnumProperty(
+        name="Metric",
+        description="How the point deviation from the last exported frame is measured",
+        items=[
+            ('MAX', "Max", "Largest distance of any vertex (bone head/tail, object axis)"),
+            ('RMS', "RMS", "Root mean square distance over all points"),
+        ],
+        default='MAX'
+    )
+    adaptive_tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="World-space deviation that triggers a new file",
+        default=0.001, min=0.0, soft_max=1.0, precision=4, subtype='DISTANCE'
+    )
+    adaptive_max_gap: bpy.props.IntProperty(
+        name="Max Gap",
+        description="Export at least every N frames even without motion (0 = no limit)",
+        default=10, min=0, soft_max=100
+    )
+
+    # Frame deduplication (SEQUENCE mode)
+    dedup_frames: bpy.props.BoolProperty(
+        name="Skip Unchanged Frames",
+        description="Hash each object's evaluated geometry and transform and reuse the previous file when nothing changed",
+        default=False
+    )
+    dedup_method: bpy.props.EnumProperty(
+        name="Duplicate Frames",
+        description="How skipped frames are represented in the export folder",
+        items=[
+            ('HARDLINK', "Hard Link", "Create a hard link to the earlier file (copy if links are unsupported)"),
+            ('MANIFEST', "Manifest Entry", f"Write no file; record the earlier file in {DEDUP_FILE}"),
+        ],
+        default='HARDLINK'
+    )
+    # Sequence packaging
+    package: bpy.props.EnumProperty(
+        name="Package",
+        description="Write each object's frames as loose files or append them to one ZIP archive per object",
+        items=[
+            ('NONE', "Loose Files", "One .fbx file per frame and object"),
+            ('ZIP_STORED', "ZIP (Stored)", "Append frames uncompressed to <name>.zip as they are exported"),
+            ('ZIP_DEFLATED', "ZIP (Deflate)", "Append frames deflate-compressed to <name>.zip as they are exported"),
+        ],
+        default='NONE'
+    )
+    # Point cache mode
+    cache_normals: bpy.props.BoolProperty(
+        name="Cache Normals", description="Also store per-vertex normals for every frame in the point cache",
+        default=False
+    )
+
+    # Resume / update
+    update_mode: bpy.props.EnumProperty(
+        name="Update",
+        description=f"Which files to write, based on {MANIFEST_FILE} in the export folder",
+        items=[
+            ('ALL', "Export All", "Export every file"),
+            ('MISSING', "Missing Only", "Skip files that exist and were exported with the same settings (resume)"),
+            ('STALE', "Missing or Changed", "Also re-export files whose object changed since they were written"),
+        ],
+        default='ALL'
+    )
+
+    # Write-behind I/O: export to local scratch, commit to the export folder in the background
+    use_scratch: bpy.props.BoolProperty(
+        name="Write Locally First",
+        description="Export each file to a local scratch folder and commit it to the export folder "
+                    "on background threads (for slow or network storage)",
+        default=False
+    )
+    scratch_path: bpy.props.StringProperty(
+        name="Scratch Folder", description="Local folder for files waiting to be committed (empty = system temp)",
+        subtype='DIR_PATH', default=""
+    )
+    commit_action: bpy.props.EnumProperty(
+        name="Commit",
+        description="How a scratch file is committed to the export folder",
+        items=[
+            ('MOVE', "Move", "Move the file to the export folder"),
+            ('COPY', "Copy", "Copy the file and keep the local copy in the scratch folder"),
+            ('COMPRESS', "Compress", "Write a gzip-compressed .fbx.gz to the export folder"),
+        ],
+        default='MOVE'
+    )
+    io_threads: bpy.props.IntProperty(
+        name="I/O Threads", description="Background threads committing files to the export folder",
+        default=4, min=1, soft_max=16
+    )
+    io_queue_size: bpy.props.IntProperty(
+        name="Max Pending Files",
+        description="Files allowed to wait in the scratch folder; export pauses while the queue is full",
+        default=16, min=1, soft_max=256
+    )
+
+    # Live stream (SEQUENCE / GROUPED): send every file to a socket consumer as soon as it is written
+    stream_output: bpy.props.BoolProperty(
+        name="Stream to Socket",
+        description="Send every exported file to a live consumer (e.g. an engine preview) over a TCP or "
+                    "Unix-domain socket instead of leaving it in the export folder; see tools/fbxseq_receiver.py",
+        default=False
+    )
+    stream_address: bpy.props.StringProperty(
+        name="Address", description="Consumer address: host:port for TCP, or unix:/path for a Unix-domain socket",
+        default="127.0.0.1:9877"
+    )
+    stream_window: bpy.props.IntProperty(
+        name="Max Unacknowledged",
+        description="Files sent ahead of the consumer's acknowledgements; the export waits while this many are pending",
+        default=2, min=1, soft_max=64
+    )
+    stream_timeout: bpy.props.FloatProperty(
+        name="Timeout (s)", description="How long a blocked send may wait for the consumer before the export fails",
+        default=30.0, min=1.0, soft_max=600.0
+    )
+    stream_keep_files: bpy.props.BoolProperty(
+        name="Keep Files", description="Also keep the streamed files in the export folder",
+        default=False
+    )
+
+    perf_report: bpy.props.EnumProperty(
+        name="Performance Report",
+        description=f"Write per-stage timings for every file to {REPORT_FILE}.json/.csv in the export folder",
+        items=[
+            ('NONE', "None", "Do not write a report"),
+            ('JSON', "JSON", "Totals, per-object and per-frame breakdowns and every file"),
+            ('CSV', "CSV", "One row per file"),
+            ('BOTH', "JSON + CSV", "Write both reports"),
+        ],
+        default='NONE'
+    )
+
+    # Memory bounds for long jobs
+    suspend_undo: bpy.props.BoolProperty(
+        name="Suspend Undo", description="Turn global undo off while exporting (restored afterwards)",
+        default=True
+    )
+    purge_interval: bpy.props.IntProperty(
+        name="Purge Every N Frames",
+        description="Remove data-blocks orphaned during the export every N frames (0 = only at the end); "
+                    "orphans that existed before the export are never touched",
+        default=50, min=0, soft_max=1000
+    )
+    memory_limit_mb: bpy.props.IntProperty(
+        name="Memory Limit (MB)",
+        description="Process memory ceiling; when reached the exporter compacts and then pauses or aborts (0 = no limit)",
+        default=0, min=0, soft_max=262144
+    )
+    memory_action: bpy.props.EnumProperty(
+        name="At Limit",
+        description="What to do when memory stays above the limit after compacting",
+        items=[
+            ('PAUSE', "Pause", "Pause until memory drops below the limit (cancel or raise the limit to continue)"),
+            ('ABORT', "Abort", "Stop the export cleanly, keeping the files written so far"),
+        ],
+        default='PAUSE'
+    )
+
+    tick_budget_ms: bpy.props.IntProperty(
+        name="Time Budget (ms)",
+        description="Export time spent per UI tick before yielding back to Blender",
+        default=50, min=1, soft_max=1000
+    )
+    plan_samples: bpy.props.IntProperty(
+        name="Plan Samples",
+        description="Files exported to a temporary folder when estimating the cost of an export",
+        default=24, min=1, soft_max=200
+    )
+
+    # Output profiles: when any is enabled, every frame is evaluated once and written
+    # once per enabled profile (into its sub-folder) instead of with the options above
+    profiles: bpy.props.CollectionProperty(type=FBXExportProfile)
+
+    # Export queue (saved with the .blend; run back to back by the queue runner)
+    queue: bpy.props.CollectionProperty(type=FBXExportQueueJob)
+
 # --------------------- Progress (WM state + drawing) ---------------------
 def _ensure_wm_props():
     WM = bpy.types.WindowManager
@@ -147,6 +513,8 @@ def _ensure_wm_props():
         WM.fbxseq_status = bpy.props.StringProperty(default="", options={'HIDDEN'})
     if not hasattr(WM, "fbxseq_cancel"):
         WM.fbxseq_cancel = bpy.props.BoolProperty(default=False, options={'HIDDEN'})
+    if not hasattr(WM, "fbxseq_plan"):
+        WM.fbxseq_plan = bpy.props.StringProperty(default="", options={'HIDDEN'})
 
 def _has_ui_progress() -> bool:
     return hasattr(bpy.types.UILayout, "progress")
@@ -204,37 +572,228 @@ def _build_base_name(obj, props) -> str:
     # PREFIX only
     return prefix if prefix else obj.name
 
+def _setting_names():
+    return list(FBXExporterProperties.__annotations__)
+
+def _coerce_setting(name: str, value):
+    """Convert `value` (e.g. a command-line string) to the type of exporter setting `name`."""
+    rna = FBXExporterProperties.bl_rna.properties.get(name)
+    if rna is None:
+        raise ValueError(f"Unknown setting '{name}'")
+    if rna.type == 'BOOLEAN':
+        if isinstance(value, str):
+            if value.lower() not in {"1", "0", "true", "false", "yes", "no", "on", "off"}:
+                raise ValueError(f"{name}: expected a boolean, got '{value}'")
+            return value.lower() in {"1", "true", "yes", "on"}
+        return bool(value)
+    if rna.type == 'INT':
+        return int(value)
+    if rna.type == 'FLOAT':
+        return float(value)
+    if rna.type == 'ENUM':
+        value = str(value)
+        if value not in rna.enum_items.keys():
+            raise ValueError(f"{name}: '{value}' is not one of {', '.join(rna.enum_items.keys())}")
+        return value
+    if rna.type == 'STRING':
+        return str(value)
+    raise ValueError(f"Setting '{name}' cannot be overridden")
+
+def _settings_snapshot(props) -> dict:
+    """Plain values of every simple exporter setting and the output profiles (for worker specs and queued jobs)."""
+    out = {}
+    for name in _setting_names():
+        value = getattr(props, name, None)
+        if isinstance(value, (bool, int, float, str)):
+            out[name] = value
+    out["profiles"] = [{"name": profile.name, "enabled": profile.enabled, "subfolder": profile.subfolder,
+                        **{k: getattr(profile, k) for k in _PROFILE_KEYS}}
+                       for profile in getattr(props, "profiles", ())]
+    return out
+
+class _ProfileRecord:
+    """Output profile captured as plain values; stands in for an FBXExportProfile."""
+
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+class _PropsOverlay:
+    """
+    Read-only stand-in for FBXExporterProperties with some values replaced.
+    Used wherever a job runs with settings that are not the scene's own
+    (job API / command line overrides, parallel worker specs, queued jobs).
+    A "profiles" override is a list of profile dicts as `_settings_snapshot()`
+    writes them and replaces the scene's output profiles.
+    """
+
+    def __init__(self, base, overrides):
+        overrides = dict(overrides)
+        profiles = overrides.pop("profiles", None)
+        self.__dict__["_base"] = base
+        self.__dict__["_overrides"] = {k: _coerce_setting(k, v) for k, v in overrides.items()}
+        if profiles is not None:
+            if not isinstance(profiles, list) or not all(isinstance(p, dict) for p in profiles):
+                raise ValueError("profiles: expected a list of profile settings")
+            self.__dict__["_overrides"]["profiles"] = [_ProfileRecord(p) for p in profiles]
+
+    def __getattr__(self, name):
+        overrides = self.__dict__["_overrides"]
+        if name in overrides:
+            return overrides[name]
+        return getattr(self.__dict__["_base"], name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("exporter settings overlay is read-only")
+
+def _export_profiles(props):
+    """
+    (sub-folder, settings) for each enabled output profile, or [("", props)]
+    when no profile is enabled. Sub-folders default to the profile name.
+    """
+    out = []
+    for profile in getattr(props, "profiles", ()):
+        if profile.enabled:
+            subfolder = _sanitize((profile.subfolder or profile.name).strip()) or f"profile_{len(out) + 1}"
+            out.append((subfolder, _PropsOverlay(props, {k: getattr(profile, k) for k in _PROFILE_KEYS})))
+    return out or [("", props)]
+
+class _OutlinerOrderIndex:
+    """
+    Cached outliner order (depth-first by Scene Collection, first occurrence) as
+    an integer position per object, so ordering a selection is a sort instead of
+    a tree walk (objects hash by their pointer, so lookups stay in C). The own
+    objects and child collections of every collection are cached separately; the
+    depsgraph handler marks only the collections it reports as updated, and the
+    next lookup re-reads just those before re-flattening the cached tree.
+    """
+
+    def __init__(self):
+        self._entries = {}     # collection pointer -> (objects, child collection pointers)
+        self._refs = {}        # collection pointer -> collection
+        self._dirty = set()
+        self._positions = {}   # scene pointer -> {object: position}
+
+    def clear(self):
+        self.__init__()
+
+    def invalidate(self, depsgraph):
+        changed = False
+        for update in depsgraph.updates:
+            id_data = update.id.original
+            if isinstance(id_data, bpy.types.Collection):
+                key = id_data.as_pointer()
+            elif isinstance(id_data, bpy.types.Scene):
+                key = id_data.collection.as_pointer()
+            else:
+                continue
+            if key in self._entries:  # collections not cached yet are read on first use anyway
+                self._dirty.add(key)
+                changed = True
+        if changed:
+            self._positions.clear()
+
+    def _entry(self, key):
+        entry = self._entries.get(key)
+        if entry is None or key in self._dirty:
+            coll = self._refs[key]
+            try:
+                entry = (tuple(coll.objects), tuple(self._ref(c) for c in coll.children))
+            except ReferenceError:  # removed since it was cached
+                entry = ((), ())
+            self._entries[key] = entry
+            self._dirty.discard(key)
+        return entry
+
+    def _ref(self, coll) -> int:
+        key = coll.as_pointer()
+        self._refs[key] = coll
+        return key
+
+    def positions(self, scene) -> dict:
+        key = scene.as_pointer()
+        positions = self._positions.get(key)
+        if positions is None:
+            positions = {}
+            stack = [self._ref(scene.collection)]
+            while stack:
+                objects, children = self._entry(stack.pop())
+                for obj in objects:
+                    positions.setdefault(obj, len(positions))
+                stack.extend(reversed(children))
+            self._positions[key] = positions
+        return positions
+
+_outliner_index = _OutlinerOrderIndex()
+
+@bpy.app.handlers.persistent
+def _outliner_index_update(scene, depsgraph):
+    _outliner_index.invalidate(depsgraph)
+
+@bpy.app.handlers.persistent
+def _outliner_index_reset(*_args):
+    _outliner_index.clear()
+
 def _ordered_selected_objects(context, order_mode: str):
-    sel = list(context.selected_objects)
+    return _order_objects(context, list(context.selected_objects), order_mode)
+
+def _order_objects(context, sel, order_mode: str):
+    """Sort `sel` by Object Order ('SELECTION' keeps the given order)."""
     if order_mode == 'SELECTION':
-        return sel[:]
+        return sel
 
     if order_mode == 'NAME':
-        return sorted(sel, key=lambda o: o.name)
+        sel.sort(key=lambda o: o.name)
+        return sel
 
-    # OUTLINER order: depth-first traversal of Scene Collection
-    selected_set = set(sel)
-    out = []
-    seen = set()
-
-    def visit_collection(coll):
-        # objects
-        for obj in coll.objects:
-            if obj in selected_set and obj not in seen:
-                out.append(obj)
-                seen.add(obj)
-        # children collections
-        for child in coll.children:
-            visit_collection(child)
-
-    visit_collection(context.scene.collection)
-
-    # any selected objects not found (rare) -> append by name
-    for obj in sorted(selected_set - set(out), key=lambda o: o.name):
-        out.append(obj)
+    # OUTLINER order: cached depth-first positions in Scene Collection. Script edits only
+    # reach the invalidation handler once the depsgraph is updated, so flush them first
+    # (a no-op when nothing changed).
+    context.view_layer.update()
+    positions = _outliner_index.positions(context.scene)
+    out = [o for o in sel if o in positions]
+    out.sort(key=positions.__getitem__)
+    if len(out) < len(sel):
+        # any objects not found (rare) -> append by name
+        found = set(out)
+        out += sorted((o for o in sel if o not in found), key=lambda o: o.name)
     return out
 
-def _export_selected_to_fbx(context, filepath, props):
+class _ObjectGroup(NamedTuple):
+    """Objects exported together into one file per frame (GROUPED mode)."""
+    name: str
+    objects: list
+
+def _group_objects(context, objects, group_by: str):
+    """
+    Split the ordered `objects` into export groups. Groups keep the object order
+    and are ordered by their first object. Objects outside every top-level
+    collection (and group_by ALL) use the scene name.
+    """
+    scene = context.scene
+    if group_by != 'COLLECTION':
+        return [_ObjectGroup(scene.name, list(objects))] if objects else []
+    top = {}
+    for coll in scene.collection.children:
+        for o in coll.all_objects:
+            top.setdefault(o, coll.name)
+    groups = {}
+    for o in objects:
+        groups.setdefault(top.get(o, scene.name), []).append(o)
+    return [_ObjectGroup(name, members) for name, members in groups.items()]
+
+_MESH_LIKE_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+def _select_only(context, obj, *more):
+    """Make `obj` (and `more`) the only selected objects, `obj` active (without operators or undo pushes)."""
+    keep = {obj, *more}
+    for o in context.selected_objects:
+        if o not in keep:
+            o.select_set(False)
+    for o in keep:
+        o.select_set(True)
+    context.view_layer.objects.active = obj
+
+def _export_selected_to_fbx(context, filepath, props, object_types=frozenset({'MESH', 'ARMATURE', 'EMPTY'})):
     """Call FBX export with current selection using props."""
     bpy.ops.export_scene.fbx(
         filepath=filepath,
@@ -248,228 +807,3223 @@ def _export_selected_to_fbx(context, filepath, props):
         bake_anim=props.bake_anim,
         bake_anim_use_nla_strips=False,
         bake_anim_use_all_actions=False,
-        object_types={'MESH', 'ARMATURE', 'EMPTY'},
+        object_types=set(object_types),
     )
 
-def _export_one_with_curve_handling(context, obj, filepath, props):
+# Evaluated types exported through a mesh proxy (plus meshes whose Geometry Nodes generate instances)
+_PROXY_TYPES = {'CURVE', 'SURFACE', 'FONT', 'META'}
+
+def _has_geometry_nodes(obj) -> bool:
+    return any(m.type == 'NODES' for m in obj.modifiers)
+
+def _realizes_instances(context, obj, props, proxies) -> bool:
+    """Whether mesh `obj` is exported through its proxy: its applied modifiers generate mesh instances."""
+    return (obj.type == 'MESH' and props.use_mesh_modifiers
+            and bool(proxies.instance_matrices(context, obj)))
+
+def _needs_mesh_proxy(context, obj, props, proxies) -> bool:
+    return obj.type in _PROXY_TYPES or _realizes_instances(context, obj, props, proxies)
+
+def _corner_normals(mesh):
+    """(loops, 3) float32 corner (split) normals of `mesh`."""
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+def _face_material_indices(mesh):
+    indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", indices)
+    return indices
+
+def _slot_index(materials, material) -> int:
+    """Index of `material` in the merged slot list `materials`, appending it when missing."""
+    if material not in materials:
+        materials.append(material)
+    return materials.index(material)
+
+def _strip_flags(props) -> frozenset:
+    """Mesh data the lean payload options leave out ('UV', 'COLOR', 'MATERIAL')."""
+    return frozenset(flag for flag, name in (("UV", "strip_uvs"), ("COLOR", "strip_colors"),
+                                             ("MATERIAL", "strip_materials")) if getattr(props, name, False))
+
+def _strip_bmesh(bm, strip):
+    if "UV" in strip:
+        for layer in list(bm.loops.layers.uv.values()):
+            bm.loops.layers.uv.remove(layer)
+    if "COLOR" in strip:
+        for layers in (bm.loops.layers.color, bm.loops.layers.float_color,
+                       bm.verts.layers.color, bm.verts.layers.float_color):
+            for layer in list(layers.values()):
+                layers.remove(layer)
+
+def _strip_mesh(mesh, strip):
+    if "UV" in strip:
+        for layer in list(mesh.uv_layers):
+            mesh.uv_layers.remove(layer)
+    if "COLOR" in strip:
+        for attr in list(mesh.color_attributes):
+            mesh.color_attributes.remove(attr)
+    if "MATERIAL" in strip:
+        mesh.materials.clear()
+
+class _MeshProxyCache:
     """
-    如果对象是 CURVE：评估 -> 生成临时 Mesh -> 仅导出该 Mesh -> 删除临时对象与数据
-    否则：按原逻辑选中并导出
+    One persistent `<name>_TMP_MESH` object + mesh per source object for a whole
+    job. Each frame the proxy's geometry is rebuilt in place from the evaluated
+    source (including realized Geometry Nodes instances), so no ID datablocks are
+    created or removed per frame; repeated updates within a frame (one per output
+    profile) reuse it. Regular meshes exported with a lean payload get a
+    persistent `<name>_TMP_LEAN` copy instead (see `lean()`). `clear()` removes
+    everything once at the end.
     """
-    # 确保当前帧已就绪（外部已 frame_set）
-    if obj.type == 'CURVE':
+
+    def __init__(self, strip=frozenset()):
+        self.strip = strip
+        self._proxies = {}
+        self._lean = {}       # source name -> lean copy
+        self._sources = {}    # lean copy -> source object
+        self._updated = {}
+        self._matrices = {}
+        self._matrices_frame = None
+
+    @staticmethod
+    def _iter_instances(depsgraph, obj):
+        # instance objects are only valid while iterating object_instances
+        for inst in depsgraph.object_instances:
+            if (inst.is_instance and inst.parent is not None and inst.object.type == 'MESH'
+                    and inst.parent.original == obj):
+                yield inst
+
+    def instance_matrices(self, context, obj):
+        """(mesh name, world matrix) of the Geometry Nodes instances of `obj`, for hashing."""
+        if not _has_geometry_nodes(obj):
+            return ()
+        frame = (context.scene.frame_current, context.scene.frame_subframe)
+        if self._matrices_frame != frame:
+            self._matrices = {}
+            self._matrices_frame = frame
+        if obj.name not in self._matrices:
+            depsgraph = context.evaluated_depsgraph_get()
+            self._matrices[obj.name] = [(inst.object.data.name, inst.matrix_world.copy())
+                                        for inst in self._iter_instances(depsgraph, obj)]
+        return self._matrices[obj.name]
+
+    def update(self, context, obj):
+        """Rebuild the proxy of `obj` from its evaluated state at the current frame and return it."""
+        frame = (context.scene.frame_current, context.scene.frame_subframe)
+        proxy = self._proxies.get(obj.name)
+        if proxy is not None and self._updated.get(obj.name) == frame:
+            return proxy
         depsgraph = context.evaluated_depsgraph_get()
         eval_obj = obj.evaluated_get(depsgraph)
 
-        # 生成评估后的网格（包含几何节点/实例化后的结果）
-        try:
-            mesh = bpy.data.meshes.new_from_object(
-                eval_obj, depsgraph=depsgraph, preserve_all_data_layers=True
-            )
-        except TypeError:
-            # 兼容早期 Blender 版本签名
-            mesh = bpy.data.meshes.new_from_object(eval_obj, depsgraph=depsgraph)
+        if proxy is None:
+            mesh = bpy.data.meshes.new(f"{obj.name}_TMP_MESH")
+            proxy = bpy.data.objects.new(name=f"{obj.name}_TMP_MESH", object_data=mesh)
+            # 链接到场景（整个导出过程只链接一次）
+            context.scene.collection.objects.link(proxy)
+            self._proxies[obj.name] = proxy
 
-        tmp_obj = bpy.data.objects.new(name=f"{obj.name}_TMP_MESH", object_data=mesh)
-        tmp_obj.matrix_world = obj.matrix_world.copy()
+        keep_materials = "MATERIAL" not in self.strip
+        materials = [slot.material for slot in eval_obj.material_slots] if keep_materials else []
+        material_indices = []  # per part: face material indices into `materials`
+        custom_normals = []    # per part: (first loop, corner normals) of parts with custom normals
+        loop_count = 0
+        realized = False
+        bm = bmesh.new()
+        try:
+            try:
+                mesh = eval_obj.to_mesh(preserve_all_data_layers=not self.strip, depsgraph=depsgraph)
+            except TypeError:
+                # 兼容早期 Blender 版本签名
+                mesh = eval_obj.to_mesh()
+            if mesh is not None:
+                bm.from_mesh(mesh)
+                if mesh.has_custom_normals:
+                    custom_normals.append((0, _corner_normals(mesh)))
+                material_indices.append(_face_material_indices(mesh))
+                loop_count = len(mesh.loops)
+            eval_obj.to_mesh_clear()
 
-        # 链接到场景（或也可链接到 obj 所在的第一个集合）
-        context.scene.collection.objects.link(tmp_obj)
+            if _has_geometry_nodes(obj):
+                # realize instances into the proxy (in the source object's local space), with their
+                # material slots merged into the proxy's and their custom normals carried over
+                to_local = obj.matrix_world.inverted_safe()
+                for inst in self._iter_instances(depsgraph, obj):
+                    data = inst.object.data
+                    matrix = to_local @ inst.matrix_world
+                    realized = True
+                    start = len(bm.verts)
+                    bm.from_mesh(data)
+                    bm.verts.ensure_lookup_table()
+                    bmesh.ops.transform(bm, matrix=matrix, verts=bm.verts[start:])
+                    if data.has_custom_normals:
+                        normals = _corner_normals(data) @ np.array(matrix.to_3x3().inverted_safe(), dtype=np.float32)
+                        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+                        custom_normals.append((loop_count, normals))
+                    if keep_materials:
+                        slots = [_slot_index(materials, slot.material) for slot in inst.object.material_slots]
+                        slots = np.array(slots or [_slot_index(materials, None)], dtype=np.int32)
+                        material_indices.append(slots[np.minimum(_face_material_indices(data), len(slots) - 1)])
+                    loop_count += len(data.loops)
+            _strip_bmesh(bm, self.strip)
+            bm.to_mesh(proxy.data)
+        finally:
+            bm.free()
 
-        # 仅选择临时对象导出
-        bpy.ops.object.select_all(action='DESELECT')
-        tmp_obj.select_set(True)
-        context.view_layer.objects.active = tmp_obj
+        if list(proxy.data.materials) != materials:
+            proxy.data.materials.clear()
+            for mat in materials:
+                proxy.data.materials.append(mat)
+        if keep_materials and realized:
+            proxy.data.polygons.foreach_set("material_index", np.concatenate(material_indices))
+        proxy.data.update()
+        if custom_normals:
+            # parts without custom normals keep the normals the proxy computes for them
+            normals = _corner_normals(proxy.data)
+            for first, part in custom_normals:
+                normals[first:first + len(part)] = part
+            if hasattr(proxy.data, "use_auto_smooth"):
+                proxy.data.use_auto_smooth = True  # custom normals need it before Blender 4.1
+            proxy.data.normals_split_custom_set(normals)
+        proxy.matrix_world = obj.matrix_world.copy()
+        self._updated[obj.name] = frame
+        return proxy
 
-        _export_selected_to_fbx(context, filepath, props)
+    def lean(self, context, obj):
+        """
+        The object to export for mesh `obj`: with a lean payload, an export-only
+        copy of the object (modifiers, shape keys, vertex groups and animation
+        still apply) holding a stripped copy of its data; otherwise `obj`.
+        """
+        if not self.strip or obj.type != 'MESH' or obj.library is not None:
+            return obj
+        copy = self._lean.get(obj.name)
+        if copy is None:
+            copy = obj.copy()
+            copy.data = obj.data.copy()
+            _strip_mesh(copy.data, self.strip)
+            copy.name = copy.data.name = f"{obj.name}_TMP_LEAN"
+            context.scene.collection.objects.link(copy)
+            self._lean[obj.name] = copy
+            self._sources[copy] = obj
+        return copy
 
-        # 清理临时对象与数据
-        try:
-            bpy.data.objects.remove(tmp_obj, do_unlink=True)
-        except RuntimeError:
-            pass
+    @contextlib.contextmanager
+    def source_names(self, objects):
+        """
+        Give the lean copies among `objects` their sources' names while the
+        exporter runs, so files name their nodes after the source objects. The
+        sources are renamed back before the block returns.
+        """
+        swaps = [(copy, self._sources[copy], self._sources[copy].name) for copy in objects if copy in self._sources]
         try:
-            if mesh.users == 0:
-                bpy.data.meshes.remove(mesh)
-        except RuntimeError:
-            pass
-    else:
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        context.view_layer.objects.active = obj
-        _export_selected_to_fbx(context, filepath, props)
+            for copy, source, name in swaps:
+                source.name = f"{name}_TMP_SOURCE"
+                copy.name = name
+            yield
+        finally:
+            for copy, source, name in swaps:
+                copy.name = f"{name}_TMP_LEAN"
+                source.name = name
 
-# --------------------- Export (Modal) ---------------------
-class WM_OT_ExportFbxSequence(bpy.types.Operator):
-    """Export per-frame sequence or per-object FBX with progress"""
-    bl_idname = "wm.fbx_sequence_exporter_modal"
-    bl_label = "Export FBX"
+    def clear(self):
+        for proxy in (*self._proxies.values(), *self._lean.values()):
+            mesh = proxy.data
+            try:
+                bpy.data.objects.remove(proxy, do_unlink=True)
+            except ReferenceError:
+                pass
+            try:
+                key_name = mesh.shape_keys.name if mesh.shape_keys is not None else None
+                bpy.data.meshes.remove(mesh, do_unlink=True)
+            except ReferenceError:
+                continue
+            key = bpy.data.shape_keys.get(key_name) if key_name else None
+            if key is not None and key.users == 0:  # versions that leave the copy's Key behind
+                bpy.data.batch_remove([key])
+        self._proxies.clear()
+        self._lean.clear()
+        self._sources.clear()
+        self._updated.clear()
+        self._matrices = {}
+        self._matrices_frame = None
 
-    _timer = None
-    _props = None
-    _objects = []
-    _export_folder = ""
-    _original_active = None
+def _export_one_with_curve_handling(context, obj, filepath, props, proxies=None, timer=None):
+    """
+    曲线/文字/曲面/元球（以及带几何节点实例的网格）：评估 -> 更新持久代理 Mesh -> 仅导出代理
+    否则：按原逻辑选中并导出
+    `proxies` 为整个导出任务共享的 _MeshProxyCache；为 None 时仅在本次调用内使用并清理。
+    `timer` 为可选的 _StageTimer，用于统计转换 / 选择 / 导出各阶段耗时。
+    """
+    stage = timer.stage if timer else _no_stage
+    # 确保当前帧已就绪（外部已 frame_set）
+    owned = proxies is None
+    if owned:
+        proxies = _MeshProxyCache(_strip_flags(props))
+    try:
+        if _needs_mesh_proxy(context, obj, props, proxies):
+            with stage("convert"):
+                proxy = proxies.update(context, obj)
 
-    # sequence mode state
-    _current_frame = 0
-    _end_frame = 0
-    _step = 1
-    _object_index = 0
+            # 仅选择代理对象导出
+            with stage("select"):
+                _select_only(context, proxy)
+        else:
+            with stage("select"):
+                proxy = proxies.lean(context, obj)
+                _select_only(context, proxy)
+        with stage("export"), proxies.source_names([proxy]):
+            _export_selected_to_fbx(context, filepath, props)
+    finally:
+        if owned:
+            proxies.clear()
 
-    # per-object mode state
-    _obj_single_index = 0
-    _single_frame = 0
+# --------------------- Native FBX Writer (binary, mesh only) ---------------------
+# Minimal binary FBX 7.4 writer for per-frame meshes: one Model + Geometry with
+# vertices, polygons, corner normals and the active UV map. Buffers are read with
+# foreach_get into NumPy and written as zlib-compressed array properties. The
+# transform conventions follow Blender's exporter so both engines produce files
+# that import identically.
+_FBX_VERSION = 7400
+_FBX_HEAD_MAGIC = b"Kaydara FBX Binary\x20\x20\x00\x1a\x00"
+_FBX_FILE_ID = b"\x28\xb3\x2a\xeb\xb6\x24\xcc\xc2\xbf\xc8\xb0\x2a\xa9\x2b\xfc\xf1"
+_FBX_TIME_ID = "1970-01-01 10:00:00:000"
+_FBX_FOOT_ID = b"\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e"
+_FBX_FOOT_MAGIC = b"\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b"
+_FBX_SENTINEL = b"\0" * 13
+_FBX_COMPRESS_MIN = 128  # arrays smaller than this (bytes) are stored uncompressed
+_FBX_ARRAY_TYPES = {np.dtype("<f8"): b"d", np.dtype("<f4"): b"f", np.dtype("<i4"): b"i", np.dtype("<i8"): b"l"}
 
-    # progress
-    _total_files = 0
-    _exported_count = 0
+def _fbx_i(v):
+    return b"I" + struct.pack("<i", v)
 
-    def invoke(self, context, event):
-        self._props = context.scene.fbx_exporter_props
-        self._export_folder = bpy.path.abspath(self._props.export_path)
+def _fbx_l(v):
+    return b"L" + struct.pack("<q", v)
 
-        if not self._export_folder or self._export_folder == "//":
-            self.report({'ERROR'}, "Please set a valid export folder.")
-            return {'CANCELLED'}
-        os.makedirs(self._export_folder, exist_ok=True)
+def _fbx_d(v):
+    return b"D" + struct.pack("<d", v)
 
-        # Prepare ordered selection
-        self._objects = _ordered_selected_objects(context, self._props.object_order)
-        if not self._objects:
-            self.report({'ERROR'}, "Select at least one object.")
-            return {'CANCELLED'}
+def _fbx_s(v):
+    data = v.encode("utf-8") if isinstance(v, str) else v
+    return b"S" + struct.pack("<I", len(data)) + data
 
-        self._original_active = context.view_layer.objects.active
-        wm = context.window_manager
-        wm.fbxseq_cancel = False
-        wm.fbxseq_running = True
-        wm.fbxseq_progress = 0.0
-        self._exported_count = 0
+def _fbx_r(v):
+    return b"R" + struct.pack("<I", len(v)) + v
 
-        if self._props.export_mode == 'SEQUENCE':
-            if self._props.start_frame > self._props.end_frame:
-                self.report({'ERROR'}, "Start frame must be <= End frame.")
-                return {'CANCELLED'}
-            self._current_frame = self._props.start_frame
-            self._end_frame = self._props.end_frame
-            self._step = int(self._props.frame_interval)
-            frames_count = len(range(self._props.start_frame, self._props.end_frame + 1, self._step))
-            self._total_files = len(self._objects) * frames_count
-            self._object_index = 0
-            wm.fbxseq_status = f"Exporting (sequence)… 0/{self._total_files}"
+def _fbx_array(arr):
+    type_code = _FBX_ARRAY_TYPES[arr.dtype]
+    data = np.ascontiguousarray(arr).tobytes()
+    if len(data) >= _FBX_COMPRESS_MIN:
+        data = zlib.compress(data, 1)
+        return type_code + struct.pack("<3I", len(arr), 1, len(data)) + data
+    return type_code + struct.pack("<3I", len(arr), 0, len(data)) + data
+
+_fbx_pool = None
+
+def _fbx_arrays(*arrays):
+    """Encode several arrays at once; zlib releases the GIL, so large ones compress in parallel."""
+    global _fbx_pool
+    if _fbx_pool is None:
+        _fbx_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                                          thread_name_prefix="fbxseq_zlib")
+    return list(_fbx_pool.map(_fbx_array, arrays))
+
+def _fbx_node(name, *props, children=()):
+    return (name, props, list(children))
+
+def _fbx_p(name, type_name, label, flags, *values):
+    """One Properties70 'P' entry."""
+    props = [_fbx_s(name), _fbx_s(type_name), _fbx_s(label), _fbx_s(flags)]
+    for v in values:
+        if isinstance(v, str):
+            props.append(_fbx_s(v))
+        elif isinstance(v, int):
+            props.append(_fbx_i(v))
         else:
-            # PER_OBJECT: export each object once at the current frame
-            self._single_frame = context.scene.frame_current
-            self._obj_single_index = 0
-            self._total_files = len(self._objects)
-            wm.fbxseq_status = f"Exporting (per-object)… 0/{self._total_files} (Frame {self._single_frame})"
+            props.append(_fbx_d(v))
+    return _fbx_node(b"P", *props)
 
-        if USE_SYSTEM_PROGRESS_HUD:
-            context.window_manager.progress_begin(0, self._total_files)
+def _fbx_write_node(out, node, is_last):
+    name, props, children = node
+    start = out.tell()
+    out.write(b"\0" * 12)  # end offset, property count, property bytes: patched below
+    out.write(bytes((len(name),)))
+    out.write(name)
+    props_start = out.tell()
+    for p in props:
+        out.write(p)
+    props_len = out.tell() - props_start
+    if children:
+        for i, child in enumerate(children):
+            _fbx_write_node(out, child, i == len(children) - 1)
+        out.write(_FBX_SENTINEL)
+    elif not props and not is_last:
+        out.write(_FBX_SENTINEL)
+    end = out.tell()
+    out.seek(start)
+    out.write(struct.pack("<3I", end, len(props), props_len))
+    out.seek(end)
 
-        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
-        context.window_manager.modal_handler_add(self)
-        _tag_redraw()
-        return {'RUNNING_MODAL'}
+def _fbx_write_file(filepath, nodes):
+    out = io.BytesIO()
+    out.write(_FBX_HEAD_MAGIC)
+    out.write(struct.pack("<I", _FBX_VERSION))
+    for i, node in enumerate(nodes):
+        _fbx_write_node(out, node, i == len(nodes) - 1)
+    out.write(_FBX_SENTINEL)
+    out.write(_FBX_FOOT_ID)
+    out.write(b"\0" * 4)
+    pad = ((out.tell() + 15) & ~15) - out.tell()
+    out.write(b"\0" * (pad or 16))
+    out.write(struct.pack("<I", _FBX_VERSION))
+    out.write(b"\0" * 120)
+    out.write(_FBX_FOOT_MAGIC)
+    with open(filepath, "wb") as f:
+        f.write(out.getbuffer())
 
-    def modal(self, context, event):
-        wm = context.window_manager
+def _fbx_uid(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little") >> 2
 
-        if event.type == 'ESC' or wm.fbxseq_cancel or not self._objects:
-            self.cancel(context)
-            return {'CANCELLED'}
+def _fbx_axes(axis_up: str, axis_forward: str):
+    """(axis, sign) for FBX UpAxis, FrontAxis and CoordAxis, as a right-handed system."""
+    up = ("XYZ".index(axis_up[-1]), -1 if axis_up[0] == '-' else 1)
+    front = ("XYZ".index(axis_forward[-1]), 1 if axis_forward[0] == '-' else -1)
+    coord_axis = 3 - up[0] - front[0]
+    # pick the coord sign so that coord x up == front
+    basis = np.eye(3)
+    cross = np.cross(basis[coord_axis], up[1] * basis[up[0]])
+    coord = (coord_axis, 1 if cross[front[0]] * front[1] > 0 else -1)
+    return up, front, coord
 
-        if event.type != 'TIMER':
-            return {'RUNNING_MODAL'}
+def _fbx_global_matrix(context, props):
+    """Axis/scale conversion matrix and FBX UnitScaleFactor, as computed by Blender's exporter."""
+    from bpy_extras.io_utils import axis_conversion
+    from mathutils import Matrix
 
-        if self._props.export_mode == 'SEQUENCE':
-            if self._current_frame > self._end_frame:
-                self.finish(context)
-                return {'FINISHED'}
+    global_matrix = axis_conversion(to_forward=props.axis_forward, to_up=props.axis_up).to_4x4()
+    units = context.scene.unit_settings
+    unit_scale = 100.0 if units.system == 'NONE' else 100.0 * units.scale_length
+    mode = _map_apply_scalings(props.apply_scalings)
+    if mode == 'FBX_SCALE_NONE':
+        global_matrix = Matrix.Scale(unit_scale * props.global_scale, 4) @ global_matrix
+        unit_scale = 1.0
+    elif mode in {'FBX_SCALE_UNITS', 'FBX_SCALE_UNIT'}:
+        global_matrix = Matrix.Scale(props.global_scale, 4) @ global_matrix
+    else:  # FBX_SCALE_ALL
+        unit_scale = props.global_scale * unit_scale
+    return global_matrix, unit_scale
 
-            obj = self._objects[self._object_index]
-            context.scene.frame_set(self._current_frame)
+def _read_mesh_buffers(mesh, with_normals=True, with_uv=True):
+    """
+    Vertex positions, polygon vertex indices, loop ranges, corner normals and
+    active UVs (normals / UVs are None when not requested or missing).
+    """
+    n_verts, n_loops, n_polys = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    vert_index = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vert_index)
+    loop_start = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
 
-            base = _sanitize(_build_base_name(obj, self._props))
-            seq_str = f"{(self._exported_count + 1):0{SEQ_PAD}d}"
-            if self._step > 1:
-                name_prefix = f"{base}_frame{self._step - 1}_"
-            else:
-                name_prefix = f"{base}_frame_"
-            filepath = os.path.join(self._export_folder, f"{name_prefix}{seq_str}.fbx")
+    normals = _corner_normals(mesh) if with_normals else None
 
-            # === 改动：支持曲线按帧临时转网格导出 ===
-            _export_one_with_curve_handling(context, obj, filepath, self._props)
+    uv, uv_name = None, ""
+    if with_uv and mesh.uv_layers.active is not None:
+        uv_name = mesh.uv_layers.active.name
+        uv = np.empty(n_loops * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uv)
+    return co.reshape(-1, 3), vert_index, loop_start, loop_total, normals, uv, uv_name
 
-            self._exported_count += 1
-            if USE_SYSTEM_PROGRESS_HUD:
-                context.window_manager.progress_update(self._exported_count)
+def _fbx_geometry_space(obj, co, normals, props, global_matrix):
+    """
+    Vertex positions/normals (N x 3) and the object matrix in FBX space, the way
+    Blender's exporter writes a root object. `normals` may be None.
+    """
+    matrix = obj.matrix_world.copy()
+    if props.bake_space_transform:
+        mat = np.array(global_matrix, dtype=np.float64)
+        co = co.astype(np.float64) @ mat[:3, :3].T + mat[:3, 3]
+        if normals is not None:
+            nor_mat = np.linalg.inv(mat[:3, :3]).T
+            normals = normals.astype(np.float64) @ nor_mat.T
+            normals /= np.maximum(np.linalg.norm(normals, axis=1), 1e-12)[:, None]
+        matrix = matrix @ global_matrix.inverted()
+    return co, normals, global_matrix @ matrix
 
-            wm.fbxseq_progress = self._exported_count / self._total_files
-            wm.fbxseq_status = f"Exporting (sequence)… {self._exported_count}/{self._total_files} (Frame {self._current_frame})"
+def _fbx_mesh_nodes(context, obj, mesh, props, global_matrix):
+    co, vert_index, loop_start, loop_total, normals, uv, uv_name = _read_mesh_buffers(
+        mesh, with_normals=not props.strip_normals, with_uv=not props.strip_uvs)
+    co, normals, matrix = _fbx_geometry_space(obj, co, normals, props, global_matrix)
+    loc, rot, scale = matrix.decompose()
+    rot = [math.degrees(a) for a in rot.to_euler('XYZ')]
 
-            # advance
-            self._object_index += 1
-            if self._object_index >= len(self._objects):
-                self._object_index = 0
-                self._current_frame += self._step
+    # FBX marks the last corner of each polygon with a bitwise-not index
+    poly_index = vert_index.copy()
+    if len(loop_start):
+        ends = loop_start + loop_total - 1
+        poly_index[ends] = ~poly_index[ends]
 
-            _tag_redraw()
-            return {'RUNNING_MODAL'}
+    arrays = [co.astype("<f8").ravel(), poly_index.astype("<i4")]
+    if normals is not None:
+        arrays.append(normals.astype("<f8").ravel())
+    if uv is not None:
+        arrays += [uv.astype("<f8"), np.arange(len(vert_index), dtype="<i4")]
+    p_vertices, p_index, *p_layers = _fbx_arrays(*arrays)
 
-        else:
-            # PER_OBJECT single export (current frame)
-            if self._obj_single_index >= len(self._objects):
-                self.finish(context)
-                return {'FINISHED'}
+    geom_uid = _fbx_uid(f"Geometry::{obj.name}")
+    model_uid = _fbx_uid(f"Model::{obj.name}")
+    layers, layer_refs = [], []
+    if normals is not None:
+        layers.append(_fbx_node(b"LayerElementNormal", _fbx_i(0), children=[
+            _fbx_node(b"Version", _fbx_i(101)),
+            _fbx_node(b"Name", _fbx_s("")),
+            _fbx_node(b"MappingInformationType", _fbx_s("ByPolygonVertex")),
+            _fbx_node(b"ReferenceInformationType", _fbx_s("Direct")),
+            _fbx_node(b"Normals", p_layers.pop(0)),
+        ]))
+        layer_refs.append(_fbx_node(b"LayerElement", children=[
+            _fbx_node(b"Type", _fbx_s("LayerElementNormal")), _fbx_node(b"TypedIndex", _fbx_i(0))]))
+    if uv is not None:
+        p_uv = p_layers
+        layers.append(_fbx_node(b"LayerElementUV", _fbx_i(0), children=[
+            _fbx_node(b"Version", _fbx_i(101)),
+            _fbx_node(b"Name", _fbx_s(uv_name)),
+            _fbx_node(b"MappingInformationType", _fbx_s("ByPolygonVertex")),
+            _fbx_node(b"ReferenceInformationType", _fbx_s("IndexToDirect")),
+            _fbx_node(b"UV", p_uv[0]),
+            _fbx_node(b"UVIndex", p_uv[1]),
+        ]))
+        layer_refs.append(_fbx_node(b"LayerElement", children=[
+            _fbx_node(b"Type", _fbx_s("LayerElementUV")), _fbx_node(b"TypedIndex", _fbx_i(0))]))
 
-            obj = self._objects[self._obj_single_index]
-            context.scene.frame_set(self._single_frame)
+    geometry = _fbx_node(b"Geometry", _fbx_l(geom_uid), _fbx_s(f"{obj.name}\x00\x01Geometry"), _fbx_s("Mesh"),
+                         children=[
+        _fbx_node(b"GeometryVersion", _fbx_i(124)),
+        _fbx_node(b"Vertices", p_vertices),
+        _fbx_node(b"PolygonVertexIndex", p_index),
+        *layers,
+        _fbx_node(b"Layer", _fbx_i(0), children=[_fbx_node(b"Version", _fbx_i(100)), *layer_refs]),
+    ])
+    model = _fbx_node(b"Model", _fbx_l(model_uid), _fbx_s(f"{obj.name}\x00\x01Model"), _fbx_s("Mesh"),
+                      children=[
+        _fbx_node(b"Version", _fbx_i(232)),
+        _fbx_node(b"Properties70", children=[
+            _fbx_p("Lcl Translation", "Lcl Translation", "", "A", *map(float, loc)),
+            _fbx_p("Lcl Rotation", "Lcl Rotation", "", "A", *map(float, rot)),
+            _fbx_p("Lcl Scaling", "Lcl Scaling", "", "A", *map(float, scale)),
+            _fbx_p("DefaultAttributeIndex", "int", "Integer", "", 0),
+            _fbx_p("InheritType", "enum", "", "", 1),
+        ]),
+        _fbx_node(b"MultiLayer", _fbx_i(0)),
+        _fbx_node(b"MultiTake", _fbx_i(0)),
+        _fbx_node(b"Shading", b"C\x01"),
+        _fbx_node(b"Culling", _fbx_s("CullingOff")),
+    ])
+    return geometry, model, geom_uid, model_uid
 
-            base = _sanitize(_build_base_name(obj, self._props))
-            idx = self._obj_single_index + 1
-            idx_str = str(idx).zfill(max(1, self._props.object_index_digits))
-            # pattern: <base>_<idx>.fbx
-            filepath = os.path.join(self._export_folder, f"{base}_{idx_str}.fbx")
+def _write_native_fbx(context, objects, filepath, props, proxies=None, timer=None):
+    """
+    Write the evaluated meshes of `objects` at the current frame as one binary
+    FBX file. Models are written in the given order.
+    """
+    global_matrix, unit_scale = _fbx_global_matrix(context, props)
+    depsgraph = context.evaluated_depsgraph_get()
+    objects_nodes, connections = [], []
+    for obj in objects:
+        with (timer.stage if timer else _no_stage)("convert"):
+            if obj.type == 'MESH' and not props.use_mesh_modifiers:
+                owner, mesh = None, obj.data
+            elif proxies is not None and _realizes_instances(context, obj, props, proxies):
+                # realize Geometry Nodes instances through the persistent proxy
+                owner, mesh = None, proxies.update(context, obj).data
+            else:
+                owner = obj.evaluated_get(depsgraph)
+                mesh = owner.to_mesh()
+        try:
+            geometry, model, geom_uid, model_uid = _fbx_mesh_nodes(context, obj, mesh, props, global_matrix)
+        finally:
+            if owner is not None:
+                owner.to_mesh_clear()
+        objects_nodes += [geometry, model]
+        connections += [
+            _fbx_node(b"C", _fbx_s("OO"), _fbx_l(geom_uid), _fbx_l(model_uid)),
+            _fbx_node(b"C", _fbx_s("OO"), _fbx_l(model_uid), _fbx_l(0)),
+        ]
 
-            # === 改动：PER_OBJECT 也支持曲线临时转网格 ===
-            _export_one_with_curve_handling(context, obj, filepath, self._props)
+    up, front, coord = _fbx_axes(props.axis_up, props.axis_forward)
+    render = context.scene.render
+    scene_name = context.scene.name
+    creator = f"Blender ({bpy.app.version_string}) - FBX Sequence Exporter native writer"
+    nodes = [
+        _fbx_node(b"FBXHeaderExtension", children=[
+            _fbx_node(b"FBXHeaderVersion", _fbx_i(1003)),
+            _fbx_node(b"FBXVersion", _fbx_i(_FBX_VERSION)),
+            _fbx_node(b"EncryptionType", _fbx_i(0)),
+            _fbx_node(b"CreationTimeStamp", children=[
+                _fbx_node(b"Version", _fbx_i(1000)),
+                _fbx_node(b"Year", _fbx_i(1970)), _fbx_node(b"Month", _fbx_i(1)), _fbx_node(b"Day", _fbx_i(1)),
+                _fbx_node(b"Hour", _fbx_i(10)), _fbx_node(b"Minute", _fbx_i(0)),
+                _fbx_node(b"Second", _fbx_i(0)), _fbx_node(b"Millisecond", _fbx_i(0)),
+            ]),
+            _fbx_node(b"Creator", _fbx_s(creator)),
+        ]),
+        _fbx_node(b"FileId", _fbx_r(_FBX_FILE_ID)),
+        _fbx_node(b"CreationTime", _fbx_s(_FBX_TIME_ID)),
+        _fbx_node(b"Creator", _fbx_s(creator)),
+        _fbx_node(b"GlobalSettings", children=[
+            _fbx_node(b"Version", _fbx_i(1000)),
+            _fbx_node(b"Properties70", children=[
+                _fbx_p("UpAxis", "int", "Integer", "", up[0]),
+                _fbx_p("UpAxisSign", "int", "Integer", "", up[1]),
+                _fbx_p("FrontAxis", "int", "Integer", "", front[0]),
+                _fbx_p("FrontAxisSign", "int", "Integer", "", front[1]),
+                _fbx_p("CoordAxis", "int", "Integer", "", coord[0]),
+                _fbx_p("CoordAxisSign", "int", "Integer", "", coord[1]),
+                _fbx_p("OriginalUpAxis", "int", "Integer", "", -1),
+                _fbx_p("OriginalUpAxisSign", "int", "Integer", "", 1),
+                _fbx_p("UnitScaleFactor", "double", "Number", "", float(unit_scale)),
+                _fbx_p("OriginalUnitScaleFactor", "double", "Number", "", float(unit_scale)),
+                _fbx_p("AmbientColor", "ColorRGB", "Color", "", 0.0, 0.0, 0.0),
+                _fbx_p("DefaultCamera", "KString", "", "", "Producer Perspective"),
+                _fbx_p("TimeMode", "enum", "", "", 14),
+                _fbx_p("CustomFrameRate", "double", "Number", "", float(render.fps / render.fps_base)),
+            ]),
+        ]),
+        _fbx_node(b"Documents", children=[
+            _fbx_node(b"Count", _fbx_i(1)),
+            _fbx_node(b"Document", _fbx_l(_fbx_uid(f"Document::{scene_name}")), _fbx_s(scene_name),
+                      _fbx_s(scene_name), children=[
+                _fbx_node(b"Properties70", children=[
+                    _fbx_p("SourceObject", "object", "", ""),
+                    _fbx_p("ActiveAnimStackName", "KString", "", "", ""),
+                ]),
+                _fbx_node(b"RootNode", _fbx_l(0)),
+            ]),
+        ]),
+        _fbx_node(b"References"),
+        _fbx_node(b"Definitions", children=[
+            _fbx_node(b"Version", _fbx_i(100)),
+            _fbx_node(b"Count", _fbx_i(1 + 2 * len(objects))),
+            _fbx_node(b"ObjectType", _fbx_s("GlobalSettings"), children=[_fbx_node(b"Count", _fbx_i(1))]),
+            _fbx_node(b"ObjectType", _fbx_s("Geometry"), children=[_fbx_node(b"Count", _fbx_i(len(objects)))]),
+            _fbx_node(b"ObjectType", _fbx_s("Model"), children=[_fbx_node(b"Count", _fbx_i(len(objects)))]),
+        ]),
+        _fbx_node(b"Objects", children=objects_nodes),
+        _fbx_node(b"Connections", children=connections),
+        _fbx_node(b"Takes", children=[_fbx_node(b"Current", _fbx_s(""))]),
+    ]
+    _fbx_write_file(filepath, nodes)
 
-            self._obj_single_index += 1
-            self._exported_count += 1
-            if USE_SYSTEM_PROGRESS_HUD:
-                context.window_manager.progress_update(self._exported_count)
+# --------------------- Point Cache (topology once, positions per frame) ---------------------
+POINT_CACHE_EXT = ".fbxpc"
+_PC_MAGIC = b"FBXPC\0\0\0"
+_PC_VERSION = 1
+_PC_FLAG_NORMALS = 1
+_PC_ALIGN = 16
+_PC_HEADER = struct.Struct("<8sIIIIQQd16x")  # 64 bytes
+_PC_ENTRY = struct.Struct("<iIIIQ16f")       # 88 bytes
 
-            wm.fbxseq_progress = self._exported_count / self._total_files
-            wm.fbxseq_status = f"Exporting (per-object)… {self._exported_count}/{self._total_files} (Frame {self._single_frame})"
+class _PointCacheWriter:
+    """
+    Per-object vertex cache, little-endian and memory-mappable:
 
-            _tag_redraw()
-            return {'RUNNING_MODAL'}
+    header  magic, version, flags, frame_count, base_count, index_offset, bases_offset, fps
+    data    per frame: float32 positions [V x 3], then float32 vertex normals [V x 3]
+            if flags & 1; every block starts on a 16-byte boundary
+    index   per frame: frame, base, vertex_count, reserved, data_offset and the
+            FBX-space object matrix (4 x 4 float32, row-major)
+    bases   per base: uint32 byte length + UTF-8 name of the full FBX that
+            defines the topology for the frames referencing it
 
-    def finish(self, context):
-        if self._timer:
-            context.window_manager.event_timer_remove(self._timer)
-        if USE_SYSTEM_PROGRESS_HUD:
-            context.window_manager.progress_end()
+    Positions/normals are in the space of the base FBX's Vertices, so a reader can
+    copy them straight into the imported mesh's vertex buffer.
+    """
 
-        bpy.ops.object.select_all(action='DESELECT')
-        for o in self._objects:
-            o.select_set(True)
-        context.view_layer.objects.active = self._original_active
+    def __init__(self, path, with_normals, fps):
+        self.path = path
+        self.with_normals = with_normals
+        self.fps = fps
+        self._f = open(path, "wb")
+        self._f.write(b"\0" * _PC_HEADER.size)
+        self._entries = []
+        self._bases = []
 
-        wm = context.window_manager
-        wm.fbxseq_running = False
-        wm.fbxseq_progress = 1.0
-        wm.fbxseq_status = "Export finished"
-        _tag_redraw()
-        self.report({'INFO'}, f"Exported {self._exported_count} files.")
+    def add_base(self, name: str):
+        self._bases.append(name)
 
-    def cancel(self, context):
-        if self._timer:
-            context.window_manager.event_timer_remove(self._timer)
-        if USE_SYSTEM_PROGRESS_HUD:
-            context.window_manager.progress_end()
+    def _align(self):
+        pad = -self._f.tell() % _PC_ALIGN
+        if pad:
+            self._f.write(b"\0" * pad)
+
+    def add_frame(self, frame, positions, normals, matrix):
+        self._align()
+        offset = self._f.tell()
+        self._f.write(np.ascontiguousarray(positions, dtype="<f4").tobytes())
+        if self.with_normals:
+            self._f.write(np.ascontiguousarray(normals, dtype="<f4").tobytes())
+        flat = [v for row in matrix for v in row]
+        self._entries.append(_PC_ENTRY.pack(frame, len(self._bases) - 1, len(positions), 0, offset, *flat))
+
+    def close(self):
+        if self._f is None:
+            return
+        f = self._f
+        self._align()
+        index_offset = f.tell()
+        f.write(b"".join(self._entries))
+        bases_offset = f.tell()
+        for name in self._bases:
+            data = name.encode("utf-8")
+            f.write(struct.pack("<I", len(data)) + data)
+        f.seek(0)
+        f.write(_PC_HEADER.pack(_PC_MAGIC, _PC_VERSION, _PC_FLAG_NORMALS if self.with_normals else 0,
+                                len(self._entries), len(self._bases), index_offset, bases_offset, self.fps))
+        f.close()
+        self._f = None
+
+# --------------------- Pose Cache (skinned mesh once, bone transforms per frame) ---------------------
+POSE_CACHE_EXT = ".fbxpose"
+POSE_BIND_SUFFIX = "_bind.fbx"
+_POSE_MAGIC = b"FBXPOSE\0"
+_POSE_VERSION = 1
+_POSE_HEADER = struct.Struct("<8sIIIIQQdd8x")  # 64 bytes
+_POSE_FLAG_UNIT_SCALE = 1  # the header carries the bind FBX's UnitScaleFactor
+_POSE_ENTRY = struct.Struct("<iIQ16f")         # 80 bytes
+
+class _PoseCacheWriter:
+    """
+    Per-armature pose table, little-endian and memory-mappable:
+
+    header  magic, version, flags (1: unit scale set), frame_count, bone_count,
+            index_offset, names_offset, fps, unit_scale
+    data    per frame: float32 bone matrices [B x 4 x 4], row-major, each relative
+            to its parent bone (root bones: to the armature object); every block
+            starts on a 16-byte boundary
+    index   per frame: frame, reserved, data_offset and the FBX-space armature
+            object matrix (4 x 4 float32, row-major)
+    names   uint32 byte length + UTF-8 name of the bind FBX, then per bone an
+            int32 parent index (-1 for roots), uint32 byte length + UTF-8 name
+
+    The matrices follow the bind FBX's conventions: bone matrices are its bones'
+    local transforms (the exporter's bone axis correction is the identity for
+    its default Y/X bone axes, and it scales only root objects), and the
+    armature matrix includes the axis conversion and global scale it applies to
+    the armature. Like the FBX's UnitScaleFactor, `unit_scale` is not baked in:
+    `armature matrix @ bone chain` is in FBX units, and an importer scales it by
+    `unit_scale / 100` to get metres.
+    """
+
+    def __init__(self, path, bind_name, bones, fps, unit_scale):
+        self.path = path
+        self.fps = fps
+        self.unit_scale = unit_scale
+        index = {bone.name: i for i, bone in enumerate(bones)}
+        self.names = [bone.name for bone in bones]
+        self.parents = np.array([index[b.parent.name] if b.parent else -1 for b in bones], dtype=np.int32)
+        self.bind_name = bind_name
+        self._f = open(path, "wb")
+        self._f.write(b"\0" * _POSE_HEADER.size)
+        self._entries = []
+
+    def _align(self):
+        pad = -self._f.tell() % _PC_ALIGN
+        if pad:
+            self._f.write(b"\0" * pad)
+
+    def add_frame(self, frame, local_matrices, matrix) -> int:
+        """Append one frame; returns the bytes written."""
+        self._align()
+        offset = self._f.tell()
+        data = np.ascontiguousarray(local_matrices, dtype="<f4").tobytes()
+        self._f.write(data)
+        flat = [v for row in matrix for v in row]
+        self._entries.append(_POSE_ENTRY.pack(frame, 0, offset, *flat))
+        return len(data)
+
+    def close(self):
+        if self._f is None:
+            return
+        f = self._f
+        self._align()
+        index_offset = f.tell()
+        f.write(b"".join(self._entries))
+        names_offset = f.tell()
+        data = self.bind_name.encode("utf-8")
+        f.write(struct.pack("<I", len(data)) + data)
+        for parent, name in zip(self.parents.tolist(), self.names):
+            data = name.encode("utf-8")
+            f.write(struct.pack("<iI", parent, len(data)) + data)
+        f.seek(0)
+        f.write(_POSE_HEADER.pack(_POSE_MAGIC, _POSE_VERSION, _POSE_FLAG_UNIT_SCALE, len(self._entries),
+                                  len(self.names), index_offset, names_offset, self.fps, self.unit_scale))
+        f.close()
+        self._f = None
+
+def _pose_local_matrices(pose, parents):
+    """
+    Bone matrices relative to their parent bone (roots: armature space), B x 4 x 4
+    row-major: the local bone transforms Blender's exporter writes.
+    """
+    bones = pose.bones
+    flat = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get("matrix", flat)
+    # foreach_get flattens matrices column by column
+    matrices = flat.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    local = matrices.copy()
+    child = parents >= 0
+    if child.any():
+        local[child] = np.linalg.inv(matrices[parents[child]]) @ matrices[child]
+    return local
+
+def _armature_meshes(context, arm):
+    """Mesh objects of the view layer deformed by, or parented to, armature `arm`."""
+    return [o for o in context.view_layer.objects
+            if o.type == 'MESH' and (o.parent == arm or any(
+                m.type == 'ARMATURE' and m.object == arm for m in o.modifiers))]
+
+def _topology_signature(mesh) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(struct.pack("<I", len(mesh.vertices)))
+    vert_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vert_index)
+    h.update(vert_index.tobytes())
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    h.update(loop_total.tobytes())
+    return h.hexdigest()
+
+def _read_point_cache_frame(context, obj, props, with_normals, proxies, fingerprint=False):
+    """
+    (positions N x 3, vertex normals N x 3 or None, topology signature, state)
+    of the evaluated mesh. With `fingerprint`, state is its `_object_state_hash`,
+    computed from the same mesh read (None otherwise).
+    """
+    if obj.type == 'MESH' and not props.use_mesh_modifiers:
+        owner, mesh = None, obj.data
+    elif _realizes_instances(context, obj, props, proxies):
+        owner, mesh = None, proxies.update(context, obj).data
+    else:
+        owner = obj.evaluated_get(context.evaluated_depsgraph_get())
+        mesh = owner.to_mesh()
+    try:
+        n = len(mesh.vertices)
+        co = np.empty(n * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        normals = None
+        if with_normals:
+            normals = np.empty(n * 3, dtype=np.float32)
+            if hasattr(mesh, "vertex_normals"):
+                mesh.vertex_normals.foreach_get("vector", normals)
+            else:
+                mesh.vertices.foreach_get("normal", normals)
+            normals = normals.reshape(-1, 3)
+        state = None
+        if fingerprint:
+            state = _object_state_hash(context, obj, proxies.instance_matrices(context, obj), proxies.strip, mesh)
+        return co.reshape(-1, 3), normals, _topology_signature(mesh), state
+    finally:
+        if owner is not None:
+            owner.to_mesh_clear()
+
+def _export_object(context, obj, filepath, props, proxies=None, timer=None):
+    """Export one object at the current frame with the configured engine."""
+    if props.export_engine == 'NATIVE' and obj.type in _MESH_LIKE_TYPES:
+        with (timer.stage if timer else _no_stage)("export"):
+            _write_native_fbx(context, [obj], filepath, props, proxies, timer)
+    else:
+        _export_one_with_curve_handling(context, obj, filepath, props, proxies, timer)
+
+def _export_group(context, group, filepath, props, proxies=None, timer=None):
+    """Export every object of `group` at the current frame into one file, in group order."""
+    stage = timer.stage if timer else _no_stage
+    if props.export_engine == 'NATIVE' and all(o.type in _MESH_LIKE_TYPES for o in group.objects):
+        with stage("export"):
+            _write_native_fbx(context, group.objects, filepath, props, proxies, timer)
+        return
+    owned = proxies is None
+    if owned:
+        proxies = _MeshProxyCache(_strip_flags(props))
+    try:
+        with stage("convert"):
+            targets = [proxies.update(context, o) if _needs_mesh_proxy(context, o, props, proxies)
+                       else proxies.lean(context, o) for o in group.objects]
+        with stage("select"):
+            _select_only(context, *targets)
+        with stage("export"), proxies.source_names(targets):
+            _export_selected_to_fbx(context, filepath, props)
+    finally:
+        if owned:
+            proxies.clear()
+
+# --------------------- Frame Deduplication ---------------------
+def _hash_mesh(h, mesh, strip=frozenset()):
+    """Hash the geometry of `mesh` and every data layer an export leaving out `strip` writes."""
+    n_verts, n_loops, n_polys = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    h.update(struct.pack("<3I", n_verts, n_loops, n_polys))
+
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    h.update(co.tobytes())
+
+    vert_index = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vert_index)
+    h.update(vert_index.tobytes())
+
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    h.update(loop_total.tobytes())
+
+    # normals: custom ones, or the shading flags they are derived from
+    smooth = np.empty(n_polys, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    h.update(smooth.tobytes())
+    sharp = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_edge_sharp", sharp)
+    h.update(sharp.tobytes())
+    if mesh.has_custom_normals:
+        h.update(_corner_normals(mesh).tobytes())
+
+    if "MATERIAL" not in strip:
+        mesh.polygons.foreach_get("material_index", loop_total)
+        h.update(loop_total.tobytes())
+    if "UV" not in strip:
+        for layer in mesh.uv_layers:
+            h.update(layer.name.encode("utf-8"))
+            uv = np.empty(n_loops * 2, dtype=np.float32)
+            layer.data.foreach_get("uv", uv)
+            h.update(uv.tobytes())
+    if "COLOR" not in strip:
+        for attr in mesh.color_attributes if hasattr(mesh, "color_attributes") else mesh.vertex_colors:
+            h.update(f"{attr.name}:{getattr(attr, 'domain', '')}:{getattr(attr, 'data_type', '')}".encode("utf-8"))
+            color = np.empty(len(attr.data) * 4, dtype=np.float32)
+            attr.data.foreach_get("color", color)
+            h.update(color.tobytes())
+
+def _object_state_hash(context, obj, instances=(), strip=frozenset(), mesh=None) -> str:
+    """
+    Hash of the evaluated geometry, pose and world transform of `obj` at the
+    current frame, with the mesh data layers and material slots an export
+    leaving out `strip` writes. `instances` are (mesh name, matrix) pairs of
+    generated instances; `mesh` is an evaluated mesh of `obj` the caller has
+    already read, hashed instead of reading it again.
+    """
+    depsgraph = context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.array(eval_obj.matrix_world, dtype=np.float32).tobytes())
+    for name, matrix in instances:
+        h.update(name.encode("utf-8"))
+        h.update(np.array(matrix, dtype=np.float32).tobytes())
+
+    if obj.type in _MESH_LIKE_TYPES:
+        if "MATERIAL" not in strip:
+            h.update("\0".join(slot.material.name if slot.material else "" for slot in eval_obj.material_slots)
+                     .encode("utf-8"))
+        if mesh is not None:
+            _hash_mesh(h, mesh, strip)
+        else:
+            mesh = eval_obj.to_mesh()
+            try:
+                if mesh is not None:
+                    _hash_mesh(h, mesh, strip)
+            finally:
+                eval_obj.to_mesh_clear()
+    elif obj.type == 'ARMATURE' and eval_obj.pose:
+        bones = eval_obj.pose.bones
+        matrices = np.empty(len(bones) * 16, dtype=np.float32)
+        bones.foreach_get("matrix", matrices)
+        h.update(matrices.tobytes())
+    return h.hexdigest()
+
+def _object_sample(context, obj, props, proxies):
+    """
+    World-space points standing for `obj`'s evaluated state, for adaptive
+    sampling: mesh vertices, bone heads and tails, or the object's origin and axes.
+    """
+    eval_obj = obj.evaluated_get(context.evaluated_depsgraph_get())
+    matrix = np.array(eval_obj.matrix_world, dtype=np.float64)
+    if obj.type in _MESH_LIKE_TYPES:
+        if obj.type == 'MESH' and not props.use_mesh_modifiers:
+            owner, mesh = None, obj.data
+        elif _realizes_instances(context, obj, props, proxies):
+            owner, mesh = None, proxies.update(context, obj).data
+        else:
+            owner = eval_obj
+            mesh = owner.to_mesh()
+        try:
+            co = np.empty(len(mesh.vertices) * 3 if mesh is not None else 0, dtype=np.float32)
+            if len(co):
+                mesh.vertices.foreach_get("co", co)
+        finally:
+            if owner is not None:
+                owner.to_mesh_clear()
+        points = co.reshape(-1, 3)
+    elif obj.type == 'ARMATURE' and eval_obj.pose:
+        bones = eval_obj.pose.bones
+        heads = np.empty(len(bones) * 3, dtype=np.float32)
+        tails = np.empty(len(bones) * 3, dtype=np.float32)
+        bones.foreach_get("head", heads)
+        bones.foreach_get("tail", tails)
+        points = np.concatenate([heads, tails]).reshape(-1, 3)
+    else:
+        points = np.eye(4, dtype=np.float32)[:, :3]
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+def _sample_deviation(a, b, metric: str) -> float:
+    """Max or RMS distance between matching points of two samples; inf when they do not match."""
+    if a.shape != b.shape:
+        return math.inf
+    if not len(a):
+        return 0.0
+    dist2 = ((a - b) ** 2).sum(axis=1)
+    return float(np.sqrt(dist2.max() if metric == 'MAX' else dist2.mean()))
+
+class _RecordLog:
+    """
+    Append-only sequence of JSON records spooled to an anonymous temporary file,
+    so side data recorded per file (timing rows, dedup links) does not grow the
+    job's memory with the length of the sequence.
+    """
+
+    def __init__(self):
+        self._file = None
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, record):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n")
+        self._count += 1
+
+    def __iter__(self):
+        if self._file is None:
+            return
+        self._file.seek(0)
+        for line in self._file:
+            yield json.loads(line)
+        self._file.seek(0, os.SEEK_END)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._count = 0
+
+def _write_timing(folder, rows, part=None):
+    """Write TIMING_FILE: file, object, source frame and time in seconds of each exported file."""
+    path = os.path.join(folder, _part_file_name(TIMING_FILE, part))
+    with open(f"{path}.tmp", "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["file", "object", "frame", "time"])
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(f"{path}.tmp", path)
+
+def _merge_timing_parts(folder):
+    """Combine the timing tables written by parallel workers into TIMING_FILE."""
+    parts = _part_files(folder, TIMING_FILE)
+    if not parts:
+        return
+    rows = []
+    for path in parts:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows.extend(csv.DictReader(f))
+        os.remove(path)
+    rows.sort(key=lambda r: (int(r["frame"]), r["file"]))
+    _write_timing(folder, rows)
+
+def _group_state_hash(context, group, proxies) -> str:
+    """Combined `_object_state_hash` of the group members, in group order."""
+    h = hashlib.blake2b(digest_size=16)
+    for obj in group.objects:
+        h.update(obj.name.encode("utf-8"))
+        h.update(_object_state_hash(context, obj, proxies.instance_matrices(context, obj), proxies.strip)
+                 .encode("ascii"))
+    return h.hexdigest()
+
+def _unlink_if_shared(filepath):
+    """Remove `filepath` if it is a hardlink, so a new export does not overwrite its siblings."""
+    try:
+        if os.stat(filepath).st_nlink > 1:
+            os.remove(filepath)
+    except OSError:
+        pass
+
+def _link_duplicate(src, dst):
+    """Make `dst` a hardlink of `src`, falling back to a copy where links are unsupported."""
+    try:
+        os.remove(dst)
+    except OSError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _write_json_atomic(path, data):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+def _part_file_name(name: str, part) -> str:
+    """File name used by parallel worker `part` for a per-folder side file."""
+    if part is None:
+        return name
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.part{part}{ext}"
+
+def _part_files(folder: str, name: str):
+    stem, ext = os.path.splitext(name)
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return []
+    return sorted(os.path.join(folder, n) for n in names
+                  if n.startswith(f"{stem}.part") and n.endswith(ext))
+
+def _merge_dedup_parts(export_folder):
+    """Fold the dedup manifests written by parallel workers into DEDUP_FILE."""
+    parts = _part_files(export_folder, DEDUP_FILE)
+    if not parts:
+        # no worker skipped a frame: drop the links of an earlier run
+        path = os.path.join(export_folder, DEDUP_FILE)
+        if os.path.exists(path):
+            os.remove(path)
+        return
+
+    def links():
+        for path in parts:
+            with open(path, "r", encoding="utf-8") as f:
+                part_links = json.load(f).get("links", {})
+            os.remove(path)
+            yield from part_links.items()
+
+    _write_dedup_links(os.path.join(export_folder, DEDUP_FILE), links())
+
+def _write_dedup_links(path, links):
+    """Write DEDUP_FILE from (file, source) pairs, one link per line, without collecting them first."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write('{\n "links": {')
+        for k, (name, source) in enumerate(links):
+            f.write(f'{"," if k else ""}\n  {json.dumps(name)}: {json.dumps(source)}')
+        f.write('\n },\n "version": 1\n}')
+    os.replace(tmp, path)
+
+# --------------------- Write-Behind Commit (scratch -> export folder) ---------------------
+COMPRESSED_EXT = ".gz"
+
+class _WriteBehindQueue:
+    """
+    Bounded write-behind stage between the exporter and the export folder.
+
+    Files are written to a local scratch folder on the main thread and then
+    moved, copied or gzip-compressed to their destination by a thread pool.
+    `submit()` blocks while `max_pending` files are waiting, which caps both
+    memory and scratch space; the UI loop checks `ready()` first and yields
+    instead. Copies keep their local file in one stable folder per worker part,
+    where only the newest `SCRATCH_COPY_LIMIT` files of every job are kept.
+    Every commit goes through a temporary name and `os.replace`, so a
+    destination is either the old file or the complete new one.
+    """
+
+    def __init__(self, scratch_root, action, threads, max_pending, part=None):
+        root = bpy.path.abspath(scratch_root) if scratch_root else tempfile.gettempdir()
+        os.makedirs(root, exist_ok=True)
+        self.action = action
+        self._copies = {}  # local copies kept by 'COPY', oldest first
+        if action == 'COPY':
+            self.scratch_dir = os.path.join(root, _part_file_name(SCRATCH_COPY_DIR, part))
+            os.makedirs(self.scratch_dir, exist_ok=True)
+            kept = [os.path.join(folder, name) for folder, _dirs, names in os.walk(self.scratch_dir)
+                    for name in names]
+            for path in sorted(kept, key=os.path.getmtime):
+                self._copies[path] = None
+            self._evict_copies()
+        else:
+            self.scratch_dir = tempfile.mkdtemp(prefix="fbxseq_scratch_", dir=root)
+        self.submitted_count = 0
+        self.committed_count = 0
+        self.commit_seconds = 0.0
+        self.errors = []
+
+        self._pool = concurrent.futures.ThreadPoolExecutor(max(1, threads), thread_name_prefix="fbxseq_io")
+        self.max_pending = max(1, max_pending)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = {}  # destination -> future, while not committed
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def ready(self) -> bool:
+        """True when `submit()` would not block."""
+        return self.pending_count < self.max_pending
+
+    def local_path(self, dest, export_folder) -> str:
+        """Scratch path to export `dest` to (mirrors its place below `export_folder`)."""
+        rel = os.path.relpath(dest, export_folder)
+        if self.action == 'COMPRESS' and rel.endswith(COMPRESSED_EXT):
+            rel = rel[:-len(COMPRESSED_EXT)]
+        path = os.path.join(self.scratch_dir, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            self._copies.pop(path, None)  # being rewritten: not evictable until committed again
+        return path
+
+    def submit(self, local, dest):
+        """Queue `local` to be committed as `dest`; blocks while the queue is full."""
+        self._queue(dest, self._commit, local, dest)
+
+    def submit_link(self, src, dest):
+        """Queue `dest` as a hardlink of the (possibly still pending) committed file `src`."""
+        with self._lock:
+            src_future = self._pending.get(src)
+        self._queue(dest, self._link, src_future, src, dest)
+
+    def _queue(self, dest, fn, *args):
+        self._slots.acquire()
+        with self._lock:
+            future = self._pool.submit(fn, *args)
+            self._pending[dest] = future
+            self.submitted_count += 1
+        future.add_done_callback(lambda f, dest=dest: self._done(dest, f))
+
+    def _done(self, dest, future):
+        with self._lock:
+            if self._pending.get(dest) is future:
+                del self._pending[dest]
+            if future.cancelled():
+                pass
+            elif future.exception() is not None:
+                self.errors.append(f"{os.path.basename(dest)}: {future.exception()}")
+            else:
+                self.committed_count += 1
+        self._slots.release()
+
+    def _commit(self, local, dest):
+        tmp = f"{dest}.tmp"
+        start = time.perf_counter()
+        try:
+            if self.action == 'COMPRESS':
+                with open(local, "rb") as src, gzip.open(tmp, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                os.remove(local)
+            elif self.action == 'COPY':
+                shutil.copyfile(local, tmp)
+            else:
+                shutil.move(local, tmp)
+            os.replace(tmp, dest)
+            with self._lock:
+                self.commit_seconds += time.perf_counter() - start
+                if self.action == 'COPY':
+                    self._copies.pop(local, None)
+                    self._copies[local] = None
+                    self._evict_copies()
+        except OSError:
+            # never leave an older file behind that the manifest would take as current
+            for path in (tmp, dest):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            raise
+
+    def _evict_copies(self):
+        while len(self._copies) > SCRATCH_COPY_LIMIT:
+            path = next(iter(self._copies))
+            del self._copies[path]
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _link(src_future, src, dest):
+        if src_future is not None:
+            src_future.result()
+        _link_duplicate(src, dest)
+
+    def close(self):
+        """Wait for every queued file to be committed, then remove the scratch folder (copies keep theirs)."""
+        self._pool.shutdown(wait=True)
+        if self.action != 'COPY':
+            shutil.rmtree(self.scratch_dir, ignore_errors=True)
+
+# --------------------- Live Stream (files -> socket consumer) ---------------------
+# Wire format (little endian), one message per exported file:
+#   header  "<4sBBHH2xiIQ": magic, version, kind, name length, object length, frame, sequence number, payload length
+#   name    UTF-8 file name relative to the export folder ("/" separated)
+#   object  UTF-8 object (or group) name
+#   payload FILE: the FBX bytes; REPEAT: UTF-8 name of the earlier file with identical content; END: empty
+# The consumer answers every message with "<4sI" (ack magic, sequence number) once it has handled it.
+# tools/fbxseq_receiver.py is a reference consumer.
+STREAM_MAGIC = b"FBXS"
+STREAM_ACK_MAGIC = b"FBXA"
+STREAM_VERSION = 1
+STREAM_FILE, STREAM_REPEAT, STREAM_END = 1, 2, 3
+_STREAM_HEADER = struct.Struct("<4sBBHH2xiIQ")
+_STREAM_ACK = struct.Struct("<4sI")
+
+def _parse_stream_address(text):
+    """(socket family, address) for 'unix:/path', '/path', 'host:port' or a bare port (localhost)."""
+    text = text.strip()
+    if text.startswith(("unix:", "/")):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix-domain sockets are not available on this platform")
+        return socket.AF_UNIX, text[len("unix:"):] if text.startswith("unix:") else text
+    host, _sep, port = text.rpartition(":")
+    try:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    except ValueError:
+        raise ValueError(f"Stream address '{text}' is not host:port or unix:/path") from None
+
+class _FrameStream:
+    """
+    Sends exported files to a live consumer over a TCP or Unix-domain socket.
+
+    At most `window` messages are unacknowledged at any time: `send_*()` block
+    (up to `timeout` seconds) until the consumer acknowledges an older one, so a
+    slow consumer paces the export instead of frames piling up in socket
+    buffers. The UI loop polls `ready()` first and yields instead of blocking.
+    """
+
+    def __init__(self, address, window, timeout):
+        family, target = _parse_stream_address(address)
+        if family == socket.AF_INET:
+            self._sock = socket.create_connection(target, timeout=timeout)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self._sock = socket.socket(family, socket.SOCK_STREAM)
+            self._sock.settimeout(timeout)
+            try:
+                self._sock.connect(target)
+            except OSError:
+                self._sock.close()
+                raise
+        self.address = address
+        self.window = max(1, window)
+        self.timeout = timeout
+        self.sent_count = 0
+        self.acked_count = 0
+        self.error = ""
+        self._acks = b""
+
+    @property
+    def in_flight(self) -> int:
+        return self.sent_count - self.acked_count
+
+    def _read_acks(self, block):
+        self._sock.settimeout(self.timeout if block else 0.0)
+        try:
+            data = self._sock.recv(4096)
+        except BlockingIOError:
+            return
+        except socket.timeout:
+            raise OSError(f"stream consumer at {self.address} did not acknowledge within {self.timeout:g} s") from None
+        finally:
+            self._sock.settimeout(self.timeout)
+        if not data:
+            raise ConnectionError(f"stream consumer at {self.address} closed the connection")
+        self._acks += data
+        count = len(self._acks) // _STREAM_ACK.size
+        for i in range(count):
+            magic, seq = _STREAM_ACK.unpack_from(self._acks, i * _STREAM_ACK.size)
+            if magic != STREAM_ACK_MAGIC or seq > self.sent_count:
+                raise OSError(f"stream consumer at {self.address} sent an invalid acknowledgement")
+            self.acked_count = max(self.acked_count, seq)
+        self._acks = self._acks[count * _STREAM_ACK.size:]
+
+    def ready(self) -> bool:
+        """Poll acknowledgements without blocking; True when a send would not wait."""
+        if self.in_flight >= self.window:
+            self._read_acks(block=False)
+        return self.in_flight < self.window
+
+    def _send(self, kind, name, obj_name, frame, payload=b"", path=""):
+        while self.in_flight >= self.window:
+            self._read_acks(block=True)
+        name, obj_name = name.encode("utf-8"), obj_name.encode("utf-8")
+        size = os.path.getsize(path) if path else len(payload)
+        self._sock.sendall(_STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, kind, len(name), len(obj_name),
+                                               frame, self.sent_count + 1, size) + name + obj_name + payload)
+        if path:
+            with open(path, "rb") as f:
+                self._sock.sendfile(f)
+        self.sent_count += 1
+
+    def send_file(self, name, obj_name, frame, path):
+        self._send(STREAM_FILE, name, obj_name, frame, path=path)
+
+    def send_repeat(self, name, obj_name, frame, source):
+        """Announce `name` as a duplicate of the already sent file `source`."""
+        self._send(STREAM_REPEAT, name, obj_name, frame, source.encode("utf-8"))
+
+    def close(self):
+        """Send END and wait until the consumer has acknowledged everything; errors end up in `error`."""
+        if self._sock is None:
+            return
+        try:
+            self._send(STREAM_END, "", "", 0)
+            while self.in_flight:
+                self._read_acks(block=True)
+        except OSError as ex:
+            self.error = str(ex)
+        finally:
+            self._sock.close()
+            self._sock = None
+
+# --------------------- Sequence Packaging (one ZIP per object) ---------------------
+_ZIP_COMPRESSION = {'ZIP_STORED': zipfile.ZIP_STORED, 'ZIP_DEFLATED': zipfile.ZIP_DEFLATED}
+
+class _SequenceArchive:
+    """
+    ZIP archive that frames are appended to as they are exported. The central
+    directory lets readers open any frame directly; ARCHIVE_INDEX (written last)
+    maps every entry to its frame and object, and records unchanged frames as
+    links to the entry holding their data instead of storing them again.
+    """
+
+    def __init__(self, path, package):
+        self.path = path
+        self.zip = zipfile.ZipFile(path, "w", _ZIP_COMPRESSION[package], allowZip64=True, compresslevel=1)
+        self.entries = []
+
+    def add(self, src, arcname, frame, obj_name):
+        self.zip.write(src, arcname)
+        self.entries.append({"file": arcname, "frame": frame, "object": obj_name, "link": None})
+
+    def add_link(self, arcname, source, frame, obj_name):
+        self.entries.append({"file": arcname, "frame": frame, "object": obj_name, "link": source})
+
+    def close(self):
+        self.zip.writestr(ARCHIVE_INDEX, json.dumps({"version": 1, "entries": self.entries}, indent=1))
+        self.zip.close()
+
+# --------------------- Export Manifest (resume / update) ---------------------
+# Properties that change the content of an exported file
+_EXPORT_SETTING_KEYS = (
+    "global_scale", "apply_scalings", "axis_forward", "axis_up",
+    "bake_space_transform", "use_mesh_modifiers", "bake_anim", "export_engine",
+    "strip_uvs", "strip_colors", "strip_materials", "strip_normals",
+)
+
+def _settings_hash(props) -> str:
+    data = {k: getattr(props, k) for k in _EXPORT_SETTING_KEYS}
+    data["blender"] = bpy.app.version_string
+    return hashlib.blake2b(json.dumps(data, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+
+class _Manifest:
+    """
+    Append-only record of the files in an export folder (JSON lines; the last
+    line for a file wins). Each record holds the frame, the object, a hash of
+    the effective export settings and a fingerprint of the source state, which
+    lets a later run re-export only missing or stale files. Parallel workers
+    append to part files that are folded into the main file by `close()`.
+    """
+
+    def __init__(self, export_folder, part=None):
+        self.folder = export_folder
+        self.part = part
+        self.path = os.path.join(export_folder, _part_file_name(MANIFEST_FILE, part))
+        self.files = {}
+        self._fh = None
+        self._last_flush = 0.0
+        for path in [os.path.join(export_folder, MANIFEST_FILE)] + _part_files(export_folder, MANIFEST_FILE):
+            self._read(path)
+
+    def _read(self, path):
+        try:
+            f = open(path, "r", encoding="utf-8")
+        except OSError:
+            return
+        with f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                name = rec.pop("file", None) if isinstance(rec, dict) else None
+                if name:
+                    self.files[name] = rec
+
+    def lookup(self, name, frame, obj_name, settings):
+        """Return the record for `name` if it matches and its file is still on disk."""
+        rec = self.files.get(name)
+        if (not rec or rec.get("frame") != frame or rec.get("object") != obj_name
+                or rec.get("settings") != settings):
+            return None
+        if not os.path.exists(os.path.join(self.folder, rec.get("link") or name)):
+            return None
+        return rec
+
+    def record(self, name, **fields):
+        self.files[name] = fields
+        if self._fh is None:
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps({"file": name, **fields}) + "\n")
+        now = time.perf_counter()
+        if now - self._last_flush >= MANIFEST_FLUSH_INTERVAL:
+            self._fh.flush()
+            self._last_flush = now
+
+    def close(self):
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+        if self.part is not None:
+            return
+        # compact: one line per file, worker parts folded in
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": 1}) + "\n")
+            for name in sorted(self.files):
+                f.write(json.dumps({"file": name, **self.files[name]}) + "\n")
+        os.replace(tmp, self.path)
+        for path in _part_files(self.folder, MANIFEST_FILE):
+            os.remove(path)
+
+# --------------------- Performance Instrumentation ---------------------
+# "evaluate" is the frame change (which evaluates the depsgraph), "fingerprint" the state
+# hash and adaptive-sampling comparison
+_STAGES = ("evaluate", "fingerprint", "convert", "select", "export", "commit", "redraw")
+
+def _no_stage(name):
+    return contextlib.nullcontext()
+
+def _rate_text(done: int, total: int, elapsed: float) -> str:
+    """'12.3 files/s, ETA 0:42' once there is something to extrapolate from."""
+    if done <= 0 or elapsed <= 0.0:
+        return ""
+    rate = done / elapsed
+    eta = int(round((total - done) / rate))
+    return f"{rate:.1f} files/s, ETA {eta // 60}:{eta % 60:02d}"
+
+class _StageTimer:
+    """
+    Exclusive wall-clock time per export stage. Stages nest: entering an inner
+    stage pauses the outer one, so the stage times of a file add up to its total.
+    Time is charged to the file between `begin_file()` and `end_file()` and to the
+    job totals; stages outside a file (UI redraws) only count towards the totals.
+    Per-file records are only kept in `files` with `keep_files` (reports and
+    estimates), so long jobs without a report stay flat in memory.
+    """
+
+    def __init__(self, keep_files=True):
+        self.start = time.perf_counter()
+        self.totals = dict.fromkeys(_STAGES, 0.0)
+        self.keep_files = keep_files
+        self.files = []
+        self.bytes_written = 0
+        self._current = None
+        self._file_start = 0.0
+        self._stack = []
+        self._mark = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def _charge(self, now):
+        name = self._stack[-1]
+        self.totals[name] += now - self._mark
+        if self._current is not None:
+            self._current[name] += now - self._mark
+        self._mark = now
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            self._charge(now)
+        self._stack.append(name)
+        self._mark = now
+        try:
+            yield
+        finally:
+            self._charge(time.perf_counter())
+            self._stack.pop()
+
+    def begin_file(self, name, obj_name, frame):
+        self._current = {"file": name, "object": obj_name, "frame": frame, "bytes": 0,
+                         **dict.fromkeys(_STAGES, 0.0)}
+        self._file_start = time.perf_counter()
+
+    def drop_file(self):
+        """Discard the current file record (nothing was written); its time stays in the totals."""
+        self._current = None
+
+    def end_file(self, nbytes=0):
+        """Close the current file record; `nbytes` is what was written for it."""
+        rec = self._current
+        self._current = None
+        if rec is None:
+            return
+        rec["bytes"] = nbytes
+        rec["seconds"] = time.perf_counter() - self._file_start
+        self.bytes_written += rec["bytes"]
+        if self.keep_files:
+            self.files.append(rec)
+
+    def report(self, **extra) -> dict:
+        elapsed = self.elapsed
+        objects, frames = {}, {}
+        for rec in self.files:
+            for key, group in ((rec["object"], objects), (str(rec["frame"]), frames)):
+                agg = group.setdefault(key, {"files": 0, "seconds": 0.0, "bytes": 0})
+                agg["files"] += 1
+                agg["seconds"] += rec["seconds"]
+                agg["bytes"] += rec["bytes"]
+        return {
+            "version": 1,
+            "blender": bpy.app.version_string,
+            "elapsed": elapsed,
+            "files": len(self.files),
+            "files_per_second": len(self.files) / elapsed if elapsed > 0 else 0.0,
+            "bytes_written": self.bytes_written,
+            "stages": self.totals,
+            **extra,
+            "objects": objects,
+            "frames": frames,
+            "records": self.files,
+        }
+
+def _write_report(folder, fmt, data, part=None):
+    """Write a job report as REPORT_FILE.json and/or .csv (fmt is the perf_report value)."""
+    if fmt in {'JSON', 'BOTH'}:
+        _write_json_atomic(os.path.join(folder, _part_file_name(REPORT_FILE + ".json", part)), data)
+    if fmt in {'CSV', 'BOTH'}:
+        path = os.path.join(folder, _part_file_name(REPORT_FILE + ".csv", part))
+        with open(f"{path}.tmp", "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["file", "object", "frame", "bytes", "seconds", *_STAGES])
+            writer.writeheader()
+            writer.writerows(data["records"])
+        os.replace(f"{path}.tmp", path)
+
+def _merge_report_parts(folder, fmt, elapsed):
+    """Combine the reports written by parallel workers into one job report."""
+    parts = _part_files(folder, REPORT_FILE + ".json")
+    for path in _part_files(folder, REPORT_FILE + ".csv"):
+        os.remove(path)
+    if not parts:
+        return
+    merged = {"stages": dict.fromkeys(_STAGES, 0.0), "records": [], "bytes_written": 0, "workers": len(parts)}
+    for path in parts:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        os.remove(path)
+        for name, seconds in data.get("stages", {}).items():
+            merged["stages"][name] = merged["stages"].get(name, 0.0) + seconds
+        merged["records"].extend(data.get("records", []))
+        merged["bytes_written"] += data.get("bytes_written", 0)
+    timer = _StageTimer()
+    timer.start = time.perf_counter() - elapsed
+    timer.totals = merged["stages"]
+    timer.files = sorted(merged["records"], key=lambda r: r["file"])
+    timer.bytes_written = merged["bytes_written"]
+    _write_report(folder, fmt, timer.report(workers=merged["workers"]))
+
+# --------------------- Evaluation Scope (dependency closure only) ---------------------
+def _referenced_objects(struct):
+    """Objects that `struct`'s pointer and ID properties refer to; collections count with all their objects."""
+    values = [getattr(struct, prop.identifier, None) for prop in struct.bl_rna.properties
+              if prop.type == 'POINTER' and prop.identifier != "rna_type"]
+    try:
+        values += [struct[key] for key in struct.keys()]  # e.g. Geometry Nodes inputs
+    except TypeError:
+        pass  # no ID properties on this type
+    found = []
+    for value in values:
+        if isinstance(value, bpy.types.Object):
+            found.append(value)
+        elif isinstance(value, bpy.types.Collection):
+            found.extend(value.all_objects)
+    return found
+
+def _dependency_closure(objects) -> set:
+    """`objects` plus everything their evaluation depends on: parents, instanced collections,
+    constraint, modifier, particle and object data targets, and driver variable targets."""
+    closure = set()
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if obj in closure:
+            continue
+        closure.add(obj)
+        refs = [obj.parent]
+        if obj.instance_collection is not None:
+            refs.extend(obj.instance_collection.all_objects)
+        structs = [*obj.modifiers, *obj.constraints, *(ps.settings for ps in obj.particle_systems)]
+        if obj.data is not None:
+            structs.append(obj.data)  # curve bevel/taper objects, text on a curve, ...
+        for struct in structs:
+            refs.extend(_referenced_objects(struct))
+        for con in obj.constraints:
+            refs.extend(t.target for t in getattr(con, "targets", ()))  # Armature constraint
+        for id_data in (obj, obj.data, getattr(obj.data, "shape_keys", None)):
+            anim = getattr(id_data, "animation_data", None)
+            if anim is not None:
+                refs.extend(t.id for fcurve in anim.drivers for var in fcurve.driver.variables for t in var.targets)
+        stack.extend(ref for ref in refs if isinstance(ref, bpy.types.Object) and ref not in closure)
+    return closure
+
+class _EvaluationScope:
+    """
+    Restricts what frame changes evaluate to the dependency closure of a job's
+    objects: every view layer collection holding none of it is excluded until
+    `restore()`. Collections that mix needed and unrelated objects stay in, as
+    does the scene collection. Excluding drops the view layer bases, so the hide
+    and selection state of the affected objects is saved and put back too.
+    """
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.excluded_count = 0
+        self._view_layer = None
+        self._excluded = []
+        self._states = {}
+
+    def apply(self, view_layer):
+        closure = _dependency_closure(self.objects)
+        self._view_layer = view_layer
+        stack = list(view_layer.layer_collection.children)
+        while stack:
+            layer = stack.pop()
+            if layer.exclude:
+                continue
+            members = layer.collection.all_objects
+            if not closure.isdisjoint(members):
+                stack.extend(layer.children)
+                continue
+            for obj in members:
+                if obj not in self._states and obj.name in view_layer.objects:
+                    self._states[obj] = (obj.hide_get(view_layer=view_layer), obj.select_get(view_layer=view_layer))
+            layer.exclude = True
+            self._excluded.append(layer)
+        self.excluded_count = len(self._excluded)
+
+    def restore(self):
+        for layer in reversed(self._excluded):
+            try:
+                layer.exclude = False
+            except ReferenceError:
+                pass
+        self._excluded.clear()
+        for obj, (hidden, selected) in self._states.items():
+            try:
+                obj.hide_set(hidden, view_layer=self._view_layer)
+                obj.select_set(selected, view_layer=self._view_layer)
+            except (ReferenceError, RuntimeError):
+                pass
+        self._states.clear()
+
+# --------------------- Memory Bounds ---------------------
+# ID types that exports leave behind (proxy meshes, exporter intermediates)
+_ORPHAN_TYPES = ("objects", "meshes", "shape_keys", "curves", "armatures", "materials", "images", "actions",
+                 "node_groups")
+
+def _process_rss():
+    """Current resident memory of this process in bytes, or None where it cannot be read."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        if ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                    ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return None
+    if sys.platform == "darwin":
+        import ctypes
+
+        class _TaskInfo(ctypes.Structure):  # mach_task_basic_info
+            _fields_ = [("virtual_size", ctypes.c_uint64), ("resident_size", ctypes.c_uint64),
+                        ("resident_size_max", ctypes.c_uint64), ("user_time", ctypes.c_int32 * 2),
+                        ("system_time", ctypes.c_int32 * 2), ("policy", ctypes.c_int32),
+                        ("suspend_count", ctypes.c_int32)]
+
+        try:
+            libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib")
+            task = ctypes.c_uint32.in_dll(libc, "mach_task_self_")
+        except (OSError, ValueError):
+            return None
+        info = _TaskInfo()
+        count = ctypes.c_uint32(ctypes.sizeof(info) // 4)
+        if libc.task_info(task, 20, ctypes.byref(info), ctypes.byref(count)) == 0:  # MACH_TASK_BASIC_INFO
+            return info.resident_size
+        return None
+    # elsewhere only the peak (ru_maxrss) is available, which never drops: no reading, so no pausing
+    return None
+
+def _format_bytes(n) -> str:
+    return f"{n / 2 ** 30:.2f} GB" if n >= 2 ** 30 else f"{n / 2 ** 20:.0f} MB"
+
+def _orphan_ids() -> set:
+    return {id_data for name in _ORPHAN_TYPES for id_data in getattr(bpy.data, name)
+            if id_data.users == 0 and not id_data.use_fake_user}
+
+class _MemoryGuard:
+    """
+    Keeps a job's memory flat: turns global undo off while it runs, removes the
+    data-blocks orphaned since it started (never older orphans), and compares
+    process RSS with the configured ceiling.
+    """
+
+    def __init__(self, props):
+        self.props = props
+        self.message = ""
+        self._active = False
+        self._undo = None
+        self._known_orphans = set()
+        self._last_check = 0.0
+
+    def begin(self):
+        if self._active:
+            return
+        self._active = True
+        self._known_orphans = _orphan_ids()
+        prefs = bpy.context.preferences
+        if self.props.suspend_undo and prefs is not None and prefs.edit.use_global_undo:
+            self._undo = prefs.is_dirty
+            prefs.edit.use_global_undo = False
+            prefs.is_dirty = self._undo  # do not make auto-saved preferences pick this up
+
+    def purge(self) -> int:
+        """Remove orphans created since `begin()`; returns how many were removed."""
+        removed = 0
+        while True:  # removing a mesh can orphan its materials
+            new = _orphan_ids() - self._known_orphans
+            if not new:
+                return removed
+            bpy.data.batch_remove(new)
+            removed += len(new)
+
+    def check(self, compact) -> str:
+        """'' while under the limit; otherwise call `compact()` and describe what is still over."""
+        limit = self.props.memory_limit_mb * 2 ** 20
+        now = time.perf_counter()
+        if not limit or now - self._last_check < MEMORY_CHECK_INTERVAL:
+            return self.message if limit else ""
+        self._last_check = now
+        rss = _process_rss()
+        if rss is not None and rss >= limit:
+            compact()
+            gc.collect()
+            rss = _process_rss()
+        over = rss is not None and rss >= limit
+        self.message = f"Memory {_format_bytes(rss)} over the {self.props.memory_limit_mb} MB limit" if over else ""
+        return self.message
+
+    def end(self):
+        if not self._active:
+            return
+        self._active = False
+        self.purge()
+        if self._undo is not None:
+            prefs = bpy.context.preferences
+            prefs.edit.use_global_undo = True
+            prefs.is_dirty = self._undo
+            self._undo = None
+
+# --------------------- Export Job (frame-major scheduler) ---------------------
+def _job_layout(context, props, objects):
+    """
+    (items, frames, profiles) of an export: the objects or `_ObjectGroup`s it
+    writes, the frames it evaluates and its output profiles. Free of side
+    effects, so an export can be sized without creating its job.
+    """
+    mode = props.export_mode
+    if mode == 'POSE':
+        # skinned meshes of selected armatures are written with their armature's bind file
+        skinned = {m for o in objects if o.type == 'ARMATURE' for m in _armature_meshes(context, o)}
+        objects = [o for o in objects if o not in skinned]
+    items = _group_objects(context, objects, props.group_by) if mode == 'GROUPED' else list(objects)
+    if mode != 'PER_OBJECT':
+        frames = list(range(props.start_frame, props.end_frame + 1, int(props.frame_interval)))
+    else:
+        # PER_OBJECT: export each object once at the current frame
+        frames = [context.scene.frame_current]
+    # output profiles (point caches and pose tables always use the main settings)
+    profiles = _export_profiles(props) if mode not in {'POINT_CACHE', 'POSE'} else [("", props)]
+    return items, frames, profiles
+
+class _ExportJob:
+    """
+    Frame-major export state machine.
+
+    Each frame is set once and every object is exported for it before moving on,
+    so a job costs one scene evaluation per frame instead of one per file.
+    `step()` exports a single file, which lets the caller decide how much work to
+    do per UI tick. `frame_positions` restricts the job to a shard of the frame
+    list (used by parallel workers); file names are always derived from the
+    position in the full list, so a shard writes exactly the files the serial
+    path would. In GROUPED mode the job's items are `_ObjectGroup`s instead of
+    objects, one file per group and frame. With output profiles, each evaluated
+    object is written once per profile (innermost loop) into the profile's
+    sub-folder; manifest and dedup names are then relative to the export folder.
+    """
+
+    def __init__(self, context, props, objects, export_folder, frame_positions=None, part=None):
+        self.props = props
+        self.mode = props.export_mode
+        self.objects, self.frames, self.profiles = _job_layout(context, props, objects)
+        self.export_folder = export_folder
+        self.step_size = int(props.frame_interval) if self.mode != 'PER_OBJECT' else 1
+
+        if frame_positions is None:
+            frame_positions = range(len(self.frames))
+        self._schedule = list(frame_positions)
+
+        for subfolder, _profile in self.profiles:
+            if subfolder:
+                os.makedirs(os.path.join(export_folder, subfolder), exist_ok=True)
+
+        self.total_files = len(self.objects) * len(self._schedule) * len(self.profiles)
+        self.exported_count = 0
+
+        # frame deduplication: last hash/file per object and profile, and skipped files for the manifest
+        self.dedup = self.mode in {'SEQUENCE', 'GROUPED'} and props.dedup_frames
+        self.deduplicated_count = 0
+        self._last_hash = [None] * (len(self.objects) * len(self.profiles))
+        self._last_file = [None] * (len(self.objects) * len(self.profiles))
+        self._dedup_links = _RecordLog()  # [file, source] pairs
+        self._dedup_file = _part_file_name(DEDUP_FILE, part)
+
+        # persistent mesh proxies for curves, text, surfaces, metaballs and instances, and
+        # export-only stripped copies of regular meshes (lean payload)
+        self.proxies = _MeshProxyCache(_strip_flags(props))
+
+        # evaluate only the objects' dependency closure (applied with the first file)
+        self.scope = None
+        self._scope_applied = False
+        if props.isolate_evaluation and self.mode != 'PER_OBJECT':
+            scope_objects = list(objects)
+            if self.mode == 'POSE':
+                scope_objects += [m for o in objects if o.type == 'ARMATURE' for m in _armature_meshes(context, o)]
+            self.scope = _EvaluationScope(scope_objects)
+
+        # pose mode: one pose table per armature (None for skeleton FBX files); table rows are
+        # counted apart from files, which only the bind FBX and the table itself are
+        self._pose_writers = {}
+        self._pose_files = 0
+        self.pose_frame_count = 0
+
+        # point cache: one writer and the last topology per object
+        self._point_caches = {}
+        self._topology = {}
+        self._global_matrix = None
+
+        # adaptive sampling: last exported sample and frame per object (or group)
+        self.adaptive = self.mode in {'SEQUENCE', 'GROUPED'} and props.adaptive_sampling
+        self.sampled_out_count = 0
+        self._samples = [None] * len(self.objects)
+        self._sample_frames = [None] * len(self.objects)
+        self._keep = True
+        self._timing = _RecordLog()
+        self._fps = context.scene.render.fps / context.scene.render.fps_base
+
+        # sequence archives: one per object base name, plus a local folder for the frame being added
+        self.package = props.package if self.mode in {'SEQUENCE', 'GROUPED'} else 'NONE'
+        self._archives = {}
+        self._package_dir = ""
+
+        # live stream: every file goes to a socket consumer (connected with the first file),
+        # exported through a temporary folder unless the files are kept
+        self.streaming = props.stream_output and self.mode in {'SEQUENCE', 'GROUPED'} and self.package == 'NONE'
+        self.stream = None
+        self._keep_files = not self.streaming or props.stream_keep_files
+        self._stream_dir = ""
+
+        # resume / update from the folder manifest (point caches, archives, streams and adaptive
+        # sampling, which depends on every earlier frame, are always rewritten)
+        self.update_mode = 'ALL'
+        if (self.mode not in {'POINT_CACHE', 'POSE'} and self.package == 'NONE' and not self.adaptive
+                and not self.streaming):
+            self.update_mode = props.update_mode
+        self.skipped_count = 0
+        # the source fingerprint (a full mesh hash) is only computed when deduplication or
+        # change detection compares it; otherwise frame and settings hash key the manifest
+        self._fingerprint = self.dedup or self.update_mode == 'STALE'
+        self.manifest = _Manifest(export_folder, part)
+        self._settings = [_settings_hash(profile) for _subfolder, profile in self.profiles]
+        self.part = part
+
+        # undo suspension, orphan purging and the memory ceiling (started with the first file)
+        self.memory = _MemoryGuard(props)
+        self._frames_since_purge = 0
+
+        # per-stage timings (totals always collected; per-file records only for the report)
+        self.timer = _StageTimer(keep_files=props.perf_report != 'NONE')
+        self._written_bytes = 0
+
+        # optional write-behind: export to local scratch, commit on background threads
+        # (created with the first file, so jobs that only plan or resume need no scratch folder)
+        self.io = None
+
+        self._frame_pos = 0
+        self._object_index = 0
+        self._profile_index = 0
+        self._frame_ready = False
+        # source state of the object being written, shared by its profiles
+        self._state_key = None
+        self._state = None
+
+    @property
+    def current_frame(self) -> int:
+        if not self._schedule:
+            return self.frames[0]
+        return self.frames[self._schedule[min(self._frame_pos, len(self._schedule) - 1)]]
+
+    def is_done(self) -> bool:
+        return self._frame_pos >= len(self._schedule)
+
+    def file_path(self, frame_pos: int, object_index: int, profile_index: int = 0) -> str:
+        obj = self.objects[object_index]
+        base = _sanitize(_build_base_name(obj, self.props))
+        if self.mode != 'PER_OBJECT':
+            seq_str = f"{(frame_pos * len(self.objects) + object_index + 1):0{SEQ_PAD}d}"
+            if self.step_size > 1:
+                name_prefix = f"{base}_frame{self.step_size - 1}_"
+            else:
+                name_prefix = f"{base}_frame_"
+            name = f"{name_prefix}{seq_str}.fbx"
+        else:
+            # pattern: <base>_<idx>.fbx
+            idx_str = str(object_index + 1).zfill(max(1, self.props.object_index_digits))
+            name = f"{base}_{idx_str}.fbx"
+        if self.props.use_scratch and not self.streaming and self.props.commit_action == 'COMPRESS':
+            name += COMPRESSED_EXT
+        return os.path.join(self.export_folder, self.profiles[profile_index][0], name)
+
+    def _rel(self, filepath) -> str:
+        """Name of `filepath` in the manifests: relative to the export folder."""
+        return os.path.relpath(filepath, self.export_folder).replace(os.sep, "/")
+
+    def _slot(self) -> int:
+        """Dedup slot of the current object and profile."""
+        return self._object_index * len(self.profiles) + self._profile_index
+
+    def next_item(self):
+        """(frame, object, file path) that the next `step()` handles, or None when done."""
+        if self.is_done():
+            return None
+        frame_pos = self._schedule[self._frame_pos]
+        return (self.frames[frame_pos], self.objects[self._object_index],
+                self.file_path(frame_pos, self._object_index, self._profile_index))
+
+    def step(self, context) -> bool:
+        """Export the next file. Returns False once every file has been written."""
+        if self.is_done():
+            return False
+
+        self.memory.begin()
+        if self.scope is not None and not self._scope_applied:
+            self.scope.apply(context.view_layer)
+            self._scope_applied = True
+        obj = self.objects[self._object_index]
+        frame = self.frames[self._schedule[self._frame_pos]]
+        filepath = self.file_path(self._schedule[self._frame_pos], self._object_index, self._profile_index)
+        name = self._rel(filepath)
+        settings = self._settings[self._profile_index]
+
+        current = None
+        if self.update_mode != 'ALL':
+            current = self.manifest.lookup(name, frame, obj.name, settings)
+
+        timer = self.timer
+        timer.begin_file(name, obj.name, frame)
+        self._written_bytes = 0
+        if current is not None and self.update_mode == 'MISSING':
+            # resume: the frame is not even evaluated when all its files exist
+            self._reuse_existing(filepath, current)
+        else:
+            if not self._frame_ready:
+                with timer.stage("evaluate"):
+                    context.scene.frame_set(frame)
+                self._frame_ready = True
+            key = (self._frame_pos, self._object_index)
+            if self._state_key != key:
+                with timer.stage("fingerprint"):
+                    if not self._fingerprint or (self.mode == 'POINT_CACHE' and obj.type in _MESH_LIKE_TYPES):
+                        # point cache frames are hashed from the mesh read that fills the cache
+                        self._state = None
+                    elif self.mode == 'GROUPED':
+                        self._state = _group_state_hash(context, obj, self.proxies)
+                    else:
+                        self._state = _object_state_hash(context, obj, self.proxies.instance_matrices(context, obj),
+                                                         self.proxies.strip)
+                    if self.adaptive:
+                        self._keep = self._adaptive_keep(context, obj, frame)
+                self._state_key = key
+            state = self._state
+            if not self._keep:
+                self.sampled_out_count += 1
+                timer.drop_file()
+            elif self.mode == 'POINT_CACHE' and obj.type in _MESH_LIKE_TYPES:
+                self._export_point_cache(context, obj, filepath, frame)
+            elif self.mode == 'POSE' and obj.type == 'ARMATURE':
+                self._export_pose(context, obj, filepath, frame, state)
+            elif current is not None and current.get("source") == state:
+                self._reuse_existing(filepath, current)
+            else:
+                link = self._export_deduplicated(obj, filepath, state)
+                if link is None:
+                    self._write_file(context, obj, filepath)
+                if self._keep_files:
+                    self.manifest.record(name, frame=frame, object=obj.name, settings=settings,
+                                         source=state, link=link or None)
+                if self.adaptive:
+                    self._timing.append({"file": name, "object": obj.name, "frame": frame,
+                                         "time": round(frame / self._fps, 6)})
+        timer.end_file(self._written_bytes)
+        self.exported_count += 1
+
+        # advance: every profile of an object, all objects of this frame, then the next frame
+        self._profile_index += 1
+        if self._profile_index < len(self.profiles):
+            return True
+        self._profile_index = 0
+        self._object_index += 1
+        if self._object_index >= len(self.objects):
+            self._object_index = 0
+            self._frame_pos += 1
+            self._frame_ready = False
+            self._frames_since_purge += 1
+            if self.props.purge_interval and self._frames_since_purge >= self.props.purge_interval:
+                self.memory.purge()
+                self._frames_since_purge = 0
+        return True
+
+    def _adaptive_keep(self, context, obj, frame) -> bool:
+        """
+        Whether the current frame of `obj` is exported: always for its first
+        frame and the last frame of the range, when the max gap is reached, or
+        when its points moved more than the tolerance since its last exported frame.
+        """
+        members = obj.objects if self.mode == 'GROUPED' else [obj]
+        sample = np.concatenate([_object_sample(context, o, self.props, self.proxies) for o in members])
+        i = self._object_index
+        last = self._samples[i]
+        max_gap = self.props.adaptive_max_gap
+        keep = (last is None
+                or self._schedule[self._frame_pos] == len(self.frames) - 1
+                or (max_gap and frame - self._sample_frames[i] >= max_gap)
+                or _sample_deviation(sample, last, self.props.adaptive_metric) > self.props.adaptive_tolerance)
+        if keep:
+            self._samples[i] = sample
+            self._sample_frames[i] = frame
+        return keep
+
+    def compact(self):
+        """Free what the job can rebuild: proxy meshes and data-blocks orphaned by the export."""
+        self.proxies.clear()
+        self.memory.purge()
+
+    def memory_check(self) -> str:
+        """'' while under the memory limit; otherwise a message (after trying to compact)."""
+        return self.memory.check(self.compact)
+
+    def _export_point_cache(self, context, obj, filepath, frame):
+        """Append `obj`'s vertex positions to its cache; write a full FBX when the topology changes."""
+        i = self._object_index
+        with self.timer.stage("convert"):
+            co, normals, topology, state = _read_point_cache_frame(context, obj, self.props,
+                                                                     self.props.cache_normals, self.proxies,
+                                                                     self._fingerprint)
+        cache = self._point_caches.get(i)
+        if cache is None:
+            render = context.scene.render
+            base = _sanitize(_build_base_name(obj, self.props))
+            cache = _PointCacheWriter(os.path.join(self.export_folder, base + POINT_CACHE_EXT),
+                                      self.props.cache_normals, render.fps / render.fps_base)
+            self._point_caches[i] = cache
+            if self._global_matrix is None:
+                self._global_matrix = _fbx_global_matrix(context, self.props)[0]
+
+        if topology != self._topology.get(i):
+            self._write_file(context, obj, filepath)
+            self.manifest.record(self._rel(filepath), frame=frame, object=obj.name,
+                                 settings=self._settings[0], source=state, link=None)
+            cache.add_base(os.path.basename(filepath))
+            self._topology[i] = topology
+
+        with self.timer.stage("export"):
+            co, normals, matrix = _fbx_geometry_space(obj, co, normals, self.props, self._global_matrix)
+            cache.add_frame(frame, co, normals, matrix)
+        self._written_bytes += co.nbytes + (normals.nbytes if normals is not None else 0)
+
+    def _export_pose(self, context, obj, filepath, frame, state):
+        """Write the bind FBX of armature `obj` once, then only its pose for every frame."""
+        i = self._object_index
+        if i not in self._pose_writers:
+            base = _sanitize(_build_base_name(obj, self.props))
+            bind = os.path.join(self.export_folder, base + POSE_BIND_SUFFIX)
+            _unlink_if_shared(bind)
+            with self.timer.stage("select"):
+                _select_only(context, obj, *_armature_meshes(context, obj))
+            with self.timer.stage("export"):
+                _export_selected_to_fbx(context, bind, self.props)
+            self._written_bytes += os.path.getsize(bind)
+            self.manifest.record(self._rel(bind), frame=frame, object=obj.name,
+                                 settings=self._settings[0], source=state, link=None)
+            writer = None
+            if self.props.pose_format == 'TABLE':
+                render = context.scene.render
+                self._global_matrix, unit_scale = _fbx_global_matrix(context, self.props)
+                writer = _PoseCacheWriter(os.path.join(self.export_folder, base + POSE_CACHE_EXT),
+                                          os.path.basename(bind), obj.pose.bones, render.fps / render.fps_base,
+                                          unit_scale)
+            self._pose_writers[i] = writer
+            self._pose_files += 1 if writer is None else 2
+
+        writer = self._pose_writers[i]
+        if writer is None:
+            self._write_file(context, obj, filepath)
+            self.manifest.record(self._rel(filepath), frame=frame, object=obj.name,
+                                 settings=self._settings[0], source=state, link=None)
+            return
+        eval_obj = obj.evaluated_get(context.evaluated_depsgraph_get())
+        with self.timer.stage("convert"):
+            local = _pose_local_matrices(eval_obj.pose, writer.parents)
+        with self.timer.stage("export"):
+            self._written_bytes += writer.add_frame(frame, local, self._global_matrix @ eval_obj.matrix_world)
+        self.pose_frame_count += 1
+
+    def _archive(self, obj) -> _SequenceArchive:
+        base = _sanitize(_build_base_name(obj, self.props))
+        path = os.path.join(self.export_folder, self.profiles[self._profile_index][0], base + ".zip")
+        archive = self._archives.get(path)
+        if archive is None:
+            archive = _SequenceArchive(path, self.package)
+            self._archives[path] = archive
+        return archive
+
+    def open_stream(self):
+        """Connect to the stream consumer now instead of with the first file (raises OSError)."""
+        if self.streaming and self.stream is None:
+            self.stream = _FrameStream(self.props.stream_address, self.props.stream_window,
+                                       self.props.stream_timeout)
+
+    def stream_ready(self) -> bool:
+        """False while the stream consumer is `stream_window` files behind."""
+        return self.stream is None or self.stream.ready()
+
+    def _write_file(self, context, obj, filepath):
+        """Export `obj` to `filepath`: directly, through the write-behind queue, into its archive or to the stream."""
+        if self.streaming:
+            self.open_stream()
+            if self._keep_files:
+                _unlink_if_shared(filepath)
+                local = filepath
+            else:
+                if not self._stream_dir:
+                    self._stream_dir = tempfile.mkdtemp(prefix="fbxseq_stream_")
+                local = os.path.join(self._stream_dir, os.path.basename(filepath))
+            self._export(context, obj, local)
+            self._written_bytes += os.path.getsize(local)
+            with self.timer.stage("commit"):
+                self.stream.send_file(self._rel(filepath), obj.name, self.current_frame, local)
+            if local != filepath:
+                os.remove(local)
+            return
+        if self.package != 'NONE':
+            if not self._package_dir:
+                self._package_dir = tempfile.mkdtemp(prefix="fbxseq_package_")
+            local = os.path.join(self._package_dir, os.path.basename(filepath))
+            self._export(context, obj, local)
+            self._written_bytes += os.path.getsize(local)
+            with self.timer.stage("commit"):
+                self._archive(obj).add(local, os.path.basename(filepath), self.current_frame, obj.name)
+            os.remove(local)
+            return
+        if self.io is None and self.props.use_scratch:
+            self.io = _WriteBehindQueue(self.props.scratch_path, self.props.commit_action,
+                                        self.props.io_threads, self.props.io_queue_size, self.part)
+        if self.io is None:
+            _unlink_if_shared(filepath)
+            self._export(context, obj, filepath)
+            written = filepath
+        else:
+            written = self.io.local_path(filepath, self.export_folder)
+            self._export(context, obj, written)
+        try:
+            self._written_bytes += os.path.getsize(written)
+        except OSError:
+            pass
+        if self.io is not None:
+            self.io.submit(written, filepath)
+
+    def _export(self, context, obj, filepath):
+        props = self.profiles[self._profile_index][1]
+        if self.mode == 'GROUPED':
+            _export_group(context, obj, filepath, props, self.proxies, self.timer)
+        elif self.mode == 'POSE' and obj.type == 'ARMATURE':
+            # skeleton-only file: the skinned meshes are in the bind file
+            with self.timer.stage("select"):
+                _select_only(context, obj)
+            with self.timer.stage("export"):
+                _export_selected_to_fbx(context, filepath, props, object_types={'ARMATURE'})
+        else:
+            _export_object(context, obj, filepath, props, self.proxies, self.timer)
+
+    def io_ready(self) -> bool:
+        """False while the write-behind queue is full (the next file would wait for a commit)."""
+        return self.io is None or self.io.ready()
+
+    def pending_writes(self) -> int:
+        """Files exported to scratch that are not committed to the export folder yet."""
+        return self.io.pending_count if self.io is not None else 0
+
+    def _reuse_existing(self, filepath, rec):
+        """Count an up-to-date file as done and make it the dedup reference for its object."""
+        i = self._slot()
+        self._last_hash[i] = rec.get("source")
+        self._last_file[i] = os.path.join(self.export_folder, rec["link"]) if rec.get("link") else filepath
+        if rec.get("link"):
+            self._dedup_links.append([self._rel(filepath), rec["link"]])
+        self.skipped_count += 1
+
+    def _export_deduplicated(self, obj, filepath, state):
+        """
+        If `obj` is unchanged since its last file, reuse that file and return its
+        name for the manifest when no file was written ('' for a hardlink).
+        Returns None when the frame has to be exported.
+        """
+        i = self._slot()
+        if not self.dedup or state != self._last_hash[i] or self._last_file[i] is None:
+            self._last_hash[i] = state
+            self._last_file[i] = filepath
+            return None
+
+        self.deduplicated_count += 1
+        if self.package != 'NONE':
+            # archives cannot hard link: index the duplicate as a link to the earlier entry
+            source = os.path.basename(self._last_file[i])
+            self._archive(obj).add_link(os.path.basename(filepath), source, self.current_frame, obj.name)
+            return source
+        if self.streaming:
+            source = self._rel(self._last_file[i])
+            self.open_stream()
+            with self.timer.stage("commit"):
+                self.stream.send_repeat(self._rel(filepath), obj.name, self.current_frame, source)
+            if not self._keep_files:
+                return source
+        if self.props.dedup_method == 'HARDLINK':
+            if self.io is not None:
+                self.io.submit_link(self._last_file[i], filepath)
+            else:
+                _link_duplicate(self._last_file[i], filepath)
+            return ""
+        _unlink_if_shared(filepath)
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
+        source = self._rel(self._last_file[i])
+        self._dedup_links.append([self._rel(filepath), source])
+        return source
+
+    def close(self):
+        """Write job side files. Safe to call on cancel; keeps what was exported so far."""
+        if self.io is not None:
+            self.io.close()
+            self.timer.totals["commit"] = self.io.commit_seconds
+        if self.stream is not None:
+            self.stream.close()
+        if self._stream_dir:
+            shutil.rmtree(self._stream_dir, ignore_errors=True)
+            self._stream_dir = ""
+        self.manifest.close()
+        if self.adaptive:
+            _write_timing(self.export_folder, self._timing, self.part)
+        self._timing.close()
+        if self.props.perf_report != 'NONE':
+            # parallel workers write JSON parts that the main process merges
+            fmt = self.props.perf_report if self.part is None else 'JSON'
+            data = self.timer.report(mode=self.mode, object_count=len(self.objects), total_files=self.total_files)
+            _write_report(self.export_folder, fmt, data, self.part)
+        self.proxies.clear()
+        if self.scope is not None:
+            self.scope.restore()
+        self.memory.end()
+        for cache in self._point_caches.values():
+            cache.close()
+        self._point_caches.clear()
+        for writer in self._pose_writers.values():
+            if writer is not None:
+                writer.close()
+        self._pose_writers.clear()
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
+        if self._package_dir:
+            shutil.rmtree(self._package_dir, ignore_errors=True)
+            self._package_dir = ""
+        path = os.path.join(self.export_folder, self._dedup_file)
+        if self._dedup_links:
+            _write_dedup_links(path, self._dedup_links)
+            self._dedup_links.close()
+        elif self.mode in {'SEQUENCE', 'GROUPED'} and self.package == 'NONE' and os.path.exists(path):
+            # links from an earlier run would point consumers at files this run rewrote
+            os.remove(path)
+
+    def status_text(self) -> str:
+        kind = {'SEQUENCE': "sequence", 'GROUPED': "grouped", 'POINT_CACHE': "point cache",
+                'POSE': "pose"}.get(self.mode, "per-object")
+        details = [f"Frame {self.current_frame}"]
+        if self.update_mode != 'ALL':
+            details.append(f"{self.skipped_count} up to date")
+        if self.dedup:
+            details.append(f"{self.deduplicated_count} reused")
+        if self.adaptive:
+            details.append(f"{self.sampled_out_count} sampled out")
+        if self.pose_frame_count:
+            details.append(f"{self.pose_frame_count} pose frames")
+        if self.io is not None:
+            details.append(f"{self.io.committed_count}/{self.io.submitted_count} committed")
+        if self.stream is not None:
+            details.append(f"{self.stream.acked_count}/{self.stream.sent_count} acknowledged")
+        rate = _rate_text(self.exported_count, self.total_files, self.timer.elapsed)
+        if rate:
+            details.append(rate)
+        if self.is_done() and self.io is not None:
+            return f"Committing ({kind})… {self.io.committed_count}/{self.io.submitted_count}"
+        return f"Exporting ({kind})… {self.exported_count}/{self.total_files} ({', '.join(details)})"
+
+    def summary_text(self) -> str:
+        written = (self.exported_count - self.skipped_count - self.deduplicated_count - self.sampled_out_count
+                   - self.pose_frame_count)
+        written += self._pose_files
+        text = f"Exported {written} files"
+        extra = []
+        if self.pose_frame_count:
+            extra.append(f"{self.pose_frame_count} pose frames")
+        if self.skipped_count:
+            extra.append(f"{self.skipped_count} already up to date")
+        if self.deduplicated_count:
+            extra.append(f"{self.deduplicated_count} unchanged frames reused")
+        if self.sampled_out_count:
+            extra.append(f"{self.sampled_out_count} frames within tolerance skipped")
+        if self.io is not None and self.io.errors:
+            extra.append(f"{len(self.io.errors)} failed to commit, first: {self.io.errors[0]}")
+        if self.stream is not None:
+            extra.append(f"streamed to {self.stream.address}" + (f", {self.stream.error}" if self.stream.error else ""))
+        return f"{text} ({', '.join(extra)})." if extra else f"{text}."
+
+# --------------------- Parallel Export (headless worker pool) ---------------------
+_WORKER_ARG = "--fbxseq-worker"
+_WORKER_PROGRESS_TAG = "FBXSEQ_DONE"
+
+def _split_frame_positions(count: int, shards: int):
+    """Split range(count) into at most `shards` contiguous, non-empty ranges."""
+    shards = max(1, min(shards, count))
+    bounds = [round(i * count / shards) for i in range(shards + 1)]
+    return [range(bounds[i], bounds[i + 1]) for i in range(shards) if bounds[i] < bounds[i + 1]]
+
+def _worker_command(blend_path: str, spec_path: str):
+    script = os.path.abspath(__file__)
+    if bpy.app.binary_path:
+        return [bpy.app.binary_path, "-b", "--factory-startup", blend_path,
+                "--python", script, "--", _WORKER_ARG, spec_path]
+    # bpy running as a Python module: the worker opens the snapshot itself
+    return [sys.executable, script, "--", _WORKER_ARG, spec_path]
+
+class _WorkerPool:
+    """
+    Runs a SEQUENCE job as N `blender -b` subprocesses on a snapshot of the
+    current .blend. Each worker exports a contiguous shard of the frame list for
+    all objects and reports progress on stdout, which is collected by one reader
+    thread per worker.
+    """
+
+    def __init__(self, props, objects, export_folder, worker_count):
+        self.props = props
+        self.objects = objects
+        self.export_folder = export_folder
+        self.worker_count = worker_count
+        self.total_files = 0
+        self.temp_dir = ""
+
+        self._procs = []
+        self._threads = []
+        self._done = []
+        self._lock = threading.Lock()
+
+    def start(self, context, frame_count: int):
+        self.temp_dir = tempfile.mkdtemp(prefix="fbxseq_")
+        blend_path = os.path.join(self.temp_dir, "snapshot.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True, check_existing=False)
+
+        shards = _split_frame_positions(frame_count, self.worker_count)
+        self.worker_count = len(shards)
+        self.total_files = len(self.objects) * frame_count * len(_export_profiles(self.props))
+        self._done = [0] * len(shards)
+
+        for i, shard in enumerate(shards):
+            spec_path = os.path.join(self.temp_dir, f"worker_{i}.json")
+            with open(spec_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "blend": blend_path,
+                    "scene": context.scene.name,
+                    "objects": [o.name for o in self.objects],
+                    "frame_positions": [shard.start, shard.stop],
+                    "part": i,
+                    "export_folder": self.export_folder,
+                    "settings": _settings_snapshot(self.props),
+                }, f)
+            log = open(os.path.join(self.temp_dir, f"worker_{i}.log"), "w", encoding="utf-8")
+            proc = subprocess.Popen(
+                _worker_command(blend_path, spec_path),
+                stdout=subprocess.PIPE, stderr=log, stdin=subprocess.DEVNULL,
+                text=True, encoding="utf-8", errors="replace",
+            )
+            log.close()
+            thread = threading.Thread(target=self._read_progress, args=(i, proc), daemon=True)
+            thread.start()
+            self._procs.append(proc)
+            self._threads.append(thread)
+
+    def _read_progress(self, index, proc):
+        for line in proc.stdout:
+            if line.startswith(_WORKER_PROGRESS_TAG):
+                try:
+                    count = int(line.split()[1])
+                except (IndexError, ValueError):
+                    continue
+                with self._lock:
+                    self._done[index] = count
+        proc.stdout.close()
+
+    @property
+    def exported_count(self) -> int:
+        with self._lock:
+            return sum(self._done)
+
+    def poll(self):
+        """Return (finished, failed_worker_indices)."""
+        codes = [p.poll() for p in self._procs]
+        if any(c is None for c in codes):
+            return False, []
+        for t in self._threads:
+            t.join()
+        return True, [i for i, c in enumerate(codes) if c != 0]
+
+    def kill(self):
+        for p in self._procs:
+            if p.poll() is None:
+                p.kill()
+        for p in self._procs:
+            try:
+                p.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+
+    def cleanup(self):
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = ""
+
+def _worker_main(argv) -> int:
+    """Entry point of a headless worker started by _WorkerPool."""
+    spec_path = argv[argv.index(_WORKER_ARG) + 1]
+    with open(spec_path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+
+    if os.path.normcase(bpy.path.abspath(bpy.data.filepath)) != os.path.normcase(spec["blend"]):
+        bpy.ops.wm.open_mainfile(filepath=spec["blend"])
+    import addon_utils
+    addon_utils.enable("io_scene_fbx", default_set=False)
+    register()
+
+    context = bpy.context
+    if context.scene.name != spec["scene"]:
+        print(f"[FBX Sequence Exporter] Scene '{spec['scene']}' is not active in snapshot", file=sys.stderr)
+        return 1
+    # the caller's settings may differ from the snapshot's (API / command-line overrides)
+    props = _PropsOverlay(context.scene.fbx_exporter_props, spec.get("settings", {}))
+    objects = [bpy.data.objects[name] for name in spec["objects"]]
+    job = _ExportJob(context, props, objects, spec["export_folder"],
+                     frame_positions=range(*spec["frame_positions"]), part=spec["part"])
+    while job.step(context):
+        print(f"{_WORKER_PROGRESS_TAG} {job.exported_count}", flush=True)
+    job.close()
+    return 0
+
+# --------------------- Job API (scripting / command line) ---------------------
+class ExportProgress(NamedTuple):
+    """Progress event yielded by `iter_export()`."""
+    kind: str    # 'FILE' after each file (or progress poll in parallel mode), 'DONE' once at the end,
+                 # 'WAIT' when nothing could be exported yet (only with wait=False)
+    done: int
+    total: int
+    frame: int
+    object: str
+    file: str
+    status: str
+
+def _validate_export(props, objects, export_folder) -> str:
+    """Error message for an export that cannot start, or '' when it can."""
+    if not export_folder or export_folder == "//":
+        return "Please set a valid export folder."
+    if not objects:
+        return "Select at least one object."
+    if props.export_mode != 'PER_OBJECT' and props.start_frame > props.end_frame:
+        return "Start frame must be <= End frame."
+    if props.export_mode == 'POSE' and not any(o.type == 'ARMATURE' for o in objects):
+        return "Pose Only mode needs at least one selected armature."
+    if props.stream_output and props.export_mode in {'SEQUENCE', 'GROUPED'}:
+        try:
+            _parse_stream_address(props.stream_address)
+        except ValueError as ex:
+            return str(ex)
+    return ""
+
+def _resolve_export(context, settings, objects, frame_range, export_folder):
+    """Settings, objects and absolute export folder of a job API call (see `iter_export()`)."""
+    props = context.scene.fbx_exporter_props
+    overrides = {}
+    if isinstance(settings, dict):
+        overrides.update(settings)
+    elif settings is not None:
+        props = settings
+    if frame_range is not None:
+        overrides["start_frame"], overrides["end_frame"] = frame_range
+    if export_folder is not None:
+        overrides["export_path"] = export_folder
+    if overrides:
+        props = _PropsOverlay(props, overrides)
+
+    if objects is None:
+        objects = _ordered_selected_objects(context, props.object_order)
+    else:
+        missing = [o for o in objects if isinstance(o, str) and o not in bpy.data.objects]
+        if missing:
+            raise ValueError(f"Unknown object(s): {', '.join(missing)}")
+        objects = [bpy.data.objects[o] if isinstance(o, str) else o for o in objects]
+    folder = bpy.path.abspath(props.export_path)
+    error = _validate_export(props, objects, folder)
+    if error:
+        raise ValueError(error)
+    return props, objects, folder
+
+def iter_export(context, settings=None, objects=None, frame_range=None, export_folder=None, workers=0,
+                wait=True):
+    """
+    Run an export synchronously (no timer, no redraws) and yield ExportProgress
+    events. This is the same job the panel's operator runs.
+
+    settings:      FBXExporterProperties (default: the scene's), or a dict of
+                   overrides applied on top of the scene's settings
+    objects:       objects or object names (default: the ordered selection)
+    frame_range:   (start, end), overriding the settings' frame range
+    export_folder: overrides the settings' export path
+    workers:       > 1 runs a SEQUENCE export on that many background processes
+    wait:          False yields 'WAIT' events instead of blocking while the
+                   write-behind queue or the stream consumer is busy, and
+                   instead of sleeping between parallel progress polls (for
+                   callers on the UI thread)
+
+    Raises ValueError for invalid input and RuntimeError when workers fail.
+    Selection is restored and job side files are written even if the caller
+    stops iterating early.
+    """
+    props, objects, folder = _resolve_export(context, settings, objects, frame_range, export_folder)
+    os.makedirs(folder, exist_ok=True)
+
+    selected = list(context.selected_objects)
+    active = context.view_layer.objects.active
+    job = _ExportJob(context, props, objects, folder)
+    started = time.perf_counter()
+    pool = None
+    try:
+        if job.mode == 'SEQUENCE' and job.package == 'NONE' and not job.streaming and workers > 1:
+            pool = _WorkerPool(props, objects, folder, workers)
+            pool.start(context, len(job.frames))
+            while True:
+                finished, failed = pool.poll()
+                if finished:
+                    break
+                done = pool.exported_count
+                rate = _rate_text(done, pool.total_files, time.perf_counter() - started)
+                yield ExportProgress('FILE' if wait else 'WAIT', done, pool.total_files, 0, "", "",
+                                     f"Exporting (parallel ×{pool.worker_count})… {done}/{pool.total_files}"
+                                     + (f" ({rate})" if rate else ""))
+                if wait:
+                    time.sleep(0.2)
+            if failed:
+                logs, pool.temp_dir = pool.temp_dir, ""  # keep the logs
+                raise RuntimeError(f"{len(failed)} export worker(s) failed, see logs in {logs}")
+            yield ExportProgress('DONE', pool.exported_count, pool.total_files, 0, "", "",
+                                 f"Exported {pool.exported_count} files.")
+            return
+
+        while True:
+            item = job.next_item()
+            if item is None:
+                break
+            frame, obj, filepath = item
+            message = job.memory_check()
+            if message:
+                # without a UI nobody can free memory or raise the limit, so pausing would hang
+                raise RuntimeError(f"{message}; export stopped.")
+            if not wait and not (job.io_ready() and job.stream_ready()):
+                yield ExportProgress('WAIT', job.exported_count, job.total_files, frame, obj.name,
+                                     filepath, job.status_text())
+                continue
+            job.step(context)
+            yield ExportProgress('FILE', job.exported_count, job.total_files, frame, obj.name,
+                                 filepath, job.status_text())
+        while not wait and job.pending_writes():
+            yield ExportProgress('WAIT', job.exported_count, job.total_files, job.current_frame, "", "",
+                                 job.status_text())
+        job.close()
+        done = ExportProgress('DONE', job.exported_count, job.total_files, job.current_frame, "", "",
+                              job.summary_text())
+        job = None
+        yield done
+    finally:
+        if pool is not None:
+            elapsed = time.perf_counter() - started
+            pool.kill()
+            pool.cleanup()
+            _merge_dedup_parts(folder)
+            _merge_timing_parts(folder)
+            _Manifest(folder).close()
+            if props.perf_report != 'NONE':
+                _merge_report_parts(folder, props.perf_report, elapsed)
+        elif job is not None:
+            job.close()
+        bpy.ops.object.select_all(action='DESELECT')
+        for o in selected:
+            o.select_set(True)
+        context.view_layer.objects.active = active
+
+class ExportEstimate(NamedTuple):
+    """Projected cost of an export, returned by `estimate_export()`."""
+    files: int                 # files the full job writes
+    sampled_files: int         # (object, frame) steps exported to measure it
+    seconds: float
+    bytes: int
+    peak_memory: int           # process memory in bytes (all workers together), None where RSS is unknown
+    free_bytes: int            # free space on the export volume, None when it cannot be read
+    warnings: tuple
+
+def _stratified(count: int, samples: int) -> list:
+    """`samples` indices spread evenly over range(count), one from the middle of each stratum."""
+    if samples >= count:
+        return list(range(count))
+    return sorted({int((i + 0.5) * count / samples) for i in range(samples)})
+
+def _layout_files(props, items, frames: int, profiles) -> int:
+    """
+    Files an export of `items` over `frames` frames writes. Point caches write
+    one base FBX and one cache per mesh, pose tables one bind FBX and one table
+    per armature (pose FBX sequences a bind FBX plus a skeleton file per frame);
+    every other object writes one file per frame and profile.
+    """
+    mode = props.export_mode
+    if mode == 'POINT_CACHE':
+        return sum(2 if o.type in _MESH_LIKE_TYPES else frames for o in items)
+    if mode == 'POSE':
+        per_armature = 2 if props.pose_format == 'TABLE' else 1 + frames
+        return sum(per_armature if o.type == 'ARMATURE' else frames for o in items)
+    return len(items) * frames * len(profiles)
+
+def _free_space(folder):
+    """Free bytes on the volume `folder` is (or will be) created on, or None."""
+    path = os.path.abspath(folder)
+    while not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    try:
+        return shutil.disk_usage(path).free
+    except OSError:
+        return None
+
+def estimate_export(context, settings=None, objects=None, frame_range=None, export_folder=None,
+                    workers=0, samples=24) -> ExportEstimate:
+    """
+    Dry run: export about `samples` (object, frame) pairs, spread over the
+    objects and the frame range, to a temporary folder, and extrapolate the
+    duration, output size and peak memory of the full job from them. Arguments
+    are those of `iter_export()`. The estimate assumes every file is written
+    (no resume, deduplication or adaptive sampling savings) and ideal scaling
+    over `workers`. The scene frame and selection are restored afterwards.
+    """
+    props, objects, folder = _resolve_export(context, settings, objects, frame_range, export_folder)
+    items, frame_list, profiles = _job_layout(context, props, objects)
+    frames = len(frame_list)
+    steps = len(items) * frames * len(profiles)
+    files = _layout_files(props, items, frames, profiles)
+    parallel = (props.export_mode == 'SEQUENCE' and props.package == 'NONE' and not props.stream_output
+                and workers > 1)
+    purge_files = props.purge_interval * len(items) * len(profiles)
+
+    # every sampled file is written once, straight into the temporary folder
+    sample_props = _PropsOverlay(props, {
+        "update_mode": 'ALL', "dedup_frames": False, "adaptive_sampling": False,
+        "package": 'NONE', "use_scratch": False, "perf_report": 'NONE', "stream_output": False,
+    })
+    if props.export_mode in {'GROUPED', 'POSE'}:
+        sample_objects = objects  # groups and skinned meshes need all their members
+    else:
+        per_frame = min(len(objects), max(1, round(math.sqrt(samples))))
+        sample_objects = [objects[i] for i in _stratified(len(objects), per_frame)]
+    per_frame = max(1, len(sample_objects))
+    positions = _stratified(frames, max(1, samples // per_frame))
+
+    selected = list(context.selected_objects)
+    active = context.view_layer.objects.active
+    frame = context.scene.frame_current
+    temp_dir = tempfile.mkdtemp(prefix="fbxseq_plan_")
+    job = None
+    try:
+        job = _ExportJob(context, sample_props, sample_objects, temp_dir, frame_positions=positions)
+        job.timer.keep_files = True
+        rss_start = _process_rss()
+        rss_peak = rss_start
+        while job.step(context):
+            rss = _process_rss()
+            if rss is not None and rss_peak is not None:
+                rss_peak = max(rss_peak, rss)
+        job.close()
+        rss_end = _process_rss()
+        records = job.timer.files
+        job = None
+    finally:
+        if job is not None:
+            job.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        context.scene.frame_set(frame)
+        bpy.ops.object.select_all(action='DESELECT')
+        for o in selected:
+            o.select_set(True)
+        context.view_layer.objects.active = active
+
+    sampled = len(records)
+    warnings = []
+    if not sampled:
+        return ExportEstimate(files, 0, 0.0, 0, rss_peak, _free_space(folder), ("Nothing was exported.",))
+    seconds = [rec["seconds"] for rec in records]
+    nbytes = [rec["bytes"] for rec in records]
+    if props.export_mode in {'POINT_CACHE', 'POSE'}:
+        # an object's first step writes its base or bind FBX, the others append a frame
+        first = {}
+        for i, rec in enumerate(records):
+            first.setdefault(rec["object"], i)
+        opening = sorted(first.values())
+        appends = [i for i in range(sampled) if i not in first.values()] or opening
+        duration = (sum(seconds[i] for i in opening) / len(opening) * len(items)
+                    + sum(seconds[i] for i in appends) / len(appends) * max(0, steps - len(items)))
+        size = int(sum(nbytes[i] for i in opening) / len(opening) * len(items)
+                   + sum(nbytes[i] for i in appends) / len(appends) * max(0, steps - len(items)))
+    else:
+        # the first file also pays one-time costs (exporter import, lean copies)
+        per_file = sum(seconds[1:]) / (sampled - 1) if sampled > 1 else seconds[0]
+        duration = seconds[0] + per_file * max(0, steps - 1)
+        size = int(sum(nbytes) / sampled * steps)
+
+    # memory grows with the steps exported between purges (per worker when parallel)
+    peak = None
+    if rss_start is not None and rss_peak is not None and rss_end is not None:
+        growth = max(0, rss_end - rss_start) / sampled
+        window = min(steps, purge_files) if purge_files else steps
+        if parallel:
+            window = min(window, -(-steps // workers))
+        peak = int(rss_peak + growth * max(0, window - sampled))
+        if parallel:
+            peak *= workers + 1  # every worker loads the file, the caller keeps its own copy
+        if props.memory_limit_mb and peak > props.memory_limit_mb * 2 ** 20:
+            warnings.append(f"Peak memory {_format_bytes(peak)} exceeds the {props.memory_limit_mb} MB limit.")
+    if parallel:
+        duration /= workers
+
+    free = _free_space(folder)
+    if free is not None and size > free:
+        warnings.append(f"Needs about {_format_bytes(size)} but only {_format_bytes(free)} is free "
+                        f"for {folder}.")
+    elif free is not None and size > free * 0.9:
+        warnings.append(f"Leaves less than 10% of the {_format_bytes(free)} free for {folder}.")
+    return ExportEstimate(files, sampled, duration, size, peak, free, tuple(warnings))
+
+def _format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}h {rest // 60:02d}m" if hours else f"{rest // 60}m {rest % 60:02d}s"
+
+def _estimate_lines(est: ExportEstimate) -> list:
+    lines = [f"{est.files} files: about {_format_duration(est.seconds)}, {_format_bytes(est.bytes)} "
+             f"(from {est.sampled_files} sampled)"]
+    details = []
+    if est.peak_memory is not None:
+        details.append(f"Peak memory ~{_format_bytes(est.peak_memory)}")
+    if est.free_bytes is not None:
+        details.append(f"{_format_bytes(est.free_bytes)} free")
+    if details:
+        lines.append(", ".join(details))
+    lines.extend(est.warnings)
+    return lines
+
+def export(context, **kwargs) -> ExportProgress:
+    """Run `iter_export()` to completion and return its final event."""
+    event = None
+    for event in iter_export(context, **kwargs):
+        pass
+    return event
+
+# --------------------- Command Line ---------------------
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+_CLI_USAGE = "blender -b scene.blend --python <add-on>/__init__.py -- [options]"
+
+def _cli_parser():
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="fbx_sequence_exporter", usage=_CLI_USAGE,
+        description="Export FBX sequences without the UI, using the scene's exporter settings.",
+        epilog="Exit codes: 0 done, 1 export failed, 2 invalid arguments, 130 interrupted.",
+    )
+    parser.add_argument("--blend", help="open this .blend first (when bpy runs as a Python module)")
+    parser.add_argument("--scene", help="scene to export from (default: the active scene)")
+    parser.add_argument("--output", help="export folder (default: the scene's Export Folder)")
+    parser.add_argument("--mode", choices=("SEQUENCE", "PER_OBJECT", "GROUPED", "POINT_CACHE", "POSE"), help="export mode")
+    parser.add_argument("--frames", metavar="START:END", help="frame range (default: the scene's settings)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--objects", metavar="NAME[,NAME...]", help="objects to export (default: selection)")
+    group.add_argument("--collection", help="export every object in this collection and its children")
+    parser.add_argument("--set", metavar="SETTING=VALUE", action="append", default=[],
+                        help="override any exporter setting, e.g. --set export_engine=NATIVE (repeatable)")
+    parser.add_argument("--workers", type=int, default=0, help="background processes for SEQUENCE export")
+    parser.add_argument("--plan", nargs="?", type=int, const=24, metavar="SAMPLES",
+                        help="only estimate duration, size and memory from a few sampled files (default 24)")
+    parser.add_argument("--progress-interval", type=float, default=1.0,
+                        help="seconds between progress lines (0 = one line per file)")
+    parser.add_argument("--quiet", action="store_true", help="only print errors and the summary")
+    return parser
+
+def cli_main(argv) -> int:
+    """
+    Command-line entry point; `argv` are the arguments after Blender's `--`.
+    Usable from `--python-expr` as well: `import <add-on>; <add-on>.cli_main([...])`.
+    """
+    parser = _cli_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as ex:
+        return EXIT_OK if ex.code == 0 else EXIT_USAGE
+
+    def fail(code, message):
+        print(f"[FBX Sequence Exporter] {message}", file=sys.stderr)
+        return code
+
+    if args.blend:
+        try:
+            bpy.ops.wm.open_mainfile(filepath=os.path.abspath(args.blend))
+        except RuntimeError as ex:
+            return fail(EXIT_USAGE, f"Cannot open {args.blend}: {ex}")
+    import addon_utils
+    addon_utils.enable("io_scene_fbx", default_set=False)
+    if not hasattr(bpy.types.Scene, "fbx_exporter_props"):
+        register()
+
+    context = bpy.context
+    if args.scene:
+        scene = bpy.data.scenes.get(args.scene)
+        if scene is None:
+            return fail(EXIT_USAGE, f"No scene named '{args.scene}'")
+        if context.window is not None:
+            context.window.scene = scene
+        if context.scene != scene:
+            return fail(EXIT_USAGE, f"Cannot activate scene '{args.scene}' here")
+
+    overrides = {}
+    for item in args.set:
+        name, sep, value = item.partition("=")
+        if not sep:
+            return fail(EXIT_USAGE, f"--set expects SETTING=VALUE, got '{item}'")
+        overrides[name.strip()] = value
+    if args.mode:
+        overrides["export_mode"] = args.mode
+    if args.output:
+        overrides["export_path"] = os.path.abspath(args.output)
+    if args.frames:
+        start, sep, end = args.frames.partition(":")
+        try:
+            overrides["start_frame"], overrides["end_frame"] = int(start), int(end if sep else start)
+        except ValueError:
+            return fail(EXIT_USAGE, f"--frames expects START:END, got '{args.frames}'")
+
+    objects = None
+    if args.objects:
+        objects = [name.strip() for name in args.objects.split(",") if name.strip()]
+    elif args.collection:
+        coll = bpy.data.collections.get(args.collection)
+        if coll is None:
+            return fail(EXIT_USAGE, f"No collection named '{args.collection}'")
+        objects = sorted(set(coll.all_objects), key=lambda o: o.name)
+
+    if args.plan is not None:
+        try:
+            est = estimate_export(context, settings=overrides, objects=objects, workers=args.workers,
+                                  samples=max(1, args.plan))
+        except ValueError as ex:
+            return fail(EXIT_USAGE, str(ex))
+        except (OSError, RuntimeError) as ex:
+            return fail(EXIT_FAILED, f"Estimate failed: {ex}")
+        for line in _estimate_lines(est):
+            print(f"[FBX Sequence Exporter] {line}", flush=True)
+        return EXIT_OK
+
+    last_print = 0.0
+    events = None
+    try:
+        events = iter_export(context, settings=overrides, objects=objects, workers=args.workers)
+        event = None
+        for event in events:
+            now = time.perf_counter()
+            if event.kind == 'DONE' or (not args.quiet and now - last_print >= args.progress_interval):
+                print(f"[FBX Sequence Exporter] {event.status}", flush=True)
+                last_print = now
+    except ValueError as ex:
+        return fail(EXIT_USAGE, str(ex))
+    except KeyboardInterrupt:
+        if events is not None:
+            events.close()
+        return fail(EXIT_CANCELLED, "Export interrupted.")
+    except (OSError, RuntimeError) as ex:
+        return fail(EXIT_FAILED, f"Export failed: {ex}")
+    return EXIT_OK
+
+# --------------------- Export (Modal) ---------------------
+class WM_OT_ExportFbxSequence(bpy.types.Operator):
+    """Export per-frame sequence or per-object FBX with progress"""
+    bl_idname = "wm.fbx_sequence_exporter_modal"
+    bl_label = "Export FBX"
+
+    _timer = None
+    _props = None
+    _objects = []
+    _export_folder = ""
+    _original_active = None
+
+    _job = None
+    _pool = None
+    _last_redraw = 0.0
+
+    def invoke(self, context, event):
+        self._props = context.scene.fbx_exporter_props
+        self._export_folder = bpy.path.abspath(self._props.export_path)
+
+        # Prepare ordered selection
+        self._objects = _ordered_selected_objects(context, self._props.object_order)
+        error = _validate_export(self._props, self._objects, self._export_folder)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        os.makedirs(self._export_folder, exist_ok=True)
+
+        self._original_active = context.view_layer.objects.active
+        self._job = _ExportJob(context, self._props, self._objects, self._export_folder)
+        self._pool = None
+        try:
+            self._job.open_stream()
+        except OSError as ex:
+            self._job.close()
+            self._job = None
+            self.report({'ERROR'}, f"Could not connect to the stream consumer at {self._props.stream_address}: {ex}")
+            return {'CANCELLED'}
+        if (self._job.mode == 'SEQUENCE' and self._job.package == 'NONE' and not self._job.streaming
+                and self._props.parallel_export):
+            self._pool = _WorkerPool(self._props, self._objects, self._export_folder,
+                                     self._props.parallel_workers)
+            try:
+                self._pool.start(context, len(self._job.frames))
+            except (OSError, RuntimeError) as ex:
+                self._pool.kill()
+                self._pool.cleanup()
+                self._pool = None
+                self._job.close()
+                self._job = None
+                self.report({'ERROR'}, f"Could not start export workers: {ex}")
+                return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.fbxseq_cancel = False
+        wm.fbxseq_running = True
+        wm.fbxseq_progress = 0.0
+        if self._pool:
+            wm.fbxseq_status = f"Exporting (parallel ×{self._pool.worker_count})… 0/{self._job.total_files}"
+        elif self._job.mode != 'PER_OBJECT':
+            wm.fbxseq_status = self._job.status_text()
+        else:
+            wm.fbxseq_status = f"Exporting (per-object)… 0/{self._job.total_files} (Frame {self._job.current_frame})"
+
+        if USE_SYSTEM_PROGRESS_HUD:
+            context.window_manager.progress_begin(0, self._job.total_files)
+
+        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        self._last_redraw = time.perf_counter()
+        _tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        wm = context.window_manager
+
+        if event.type == 'ESC' or wm.fbxseq_cancel or not self._objects:
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        if self._pool:
+            return self._modal_parallel(context)
+
+        # Export as many files as fit into the tick budget, then yield to the UI
+        job = self._job
+        deadline = time.perf_counter() + max(1, self._props.tick_budget_ms) / 1000.0
+        try:
+            while True:
+                if job.memory_check():
+                    break
+                if not job.io_ready():
+                    break  # the write-behind queue is full: keep the UI live until a commit finishes
+                if not job.stream_ready():
+                    break  # the stream consumer is behind: keep the UI live until it acknowledges
+                if not job.step(context):
+                    if job.pending_writes():
+                        break  # keep the UI live until the write-behind queue is drained
+                    self.finish(context)
+                    return {'FINISHED'}
+                if time.perf_counter() >= deadline:
+                    break
+        except OSError as ex:
+            self.report({'ERROR'}, f"Export failed: {ex}")
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        message = job.memory_check()
+        if message and self._props.memory_action == 'ABORT':
+            self.report({'ERROR'}, f"{message}; export stopped.")
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        with job.timer.stage("redraw"):
+            if USE_SYSTEM_PROGRESS_HUD:
+                context.window_manager.progress_update(job.exported_count)
+            wm.fbxseq_progress = job.exported_count / job.total_files
+            wm.fbxseq_status = f"Paused: {message}" if message else job.status_text()
+
+            now = time.perf_counter()
+            if now - self._last_redraw >= REDRAW_INTERVAL:
+                self._last_redraw = now
+                _tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _modal_parallel(self, context):
+        wm = context.window_manager
+        pool = self._pool
+        finished, failed = pool.poll()
+        if finished:
+            if failed:
+                self.report({'ERROR'}, f"{len(failed)} export worker(s) failed, see logs in {pool.temp_dir}")
+                pool.temp_dir = ""  # keep the logs
+                self.cancel(context)
+                return {'CANCELLED'}
+            self.finish(context)
+            return {'FINISHED'}
+
+        done = pool.exported_count
+        if USE_SYSTEM_PROGRESS_HUD:
+            context.window_manager.progress_update(done)
+        wm.fbxseq_progress = done / pool.total_files
+        rate = _rate_text(done, pool.total_files, self._job.timer.elapsed)
+        wm.fbxseq_status = f"Exporting (parallel ×{pool.worker_count})… {done}/{pool.total_files}" + \
+            (f" ({rate})" if rate else "")
+
+        now = time.perf_counter()
+        if now - self._last_redraw >= REDRAW_INTERVAL:
+            self._last_redraw = now
+            _tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _exported_count(self) -> int:
+        return self._pool.exported_count if self._pool else self._job.exported_count
+
+    def _close_job(self):
+        if self._pool:
+            self._pool.kill()
+            self._pool.cleanup()
+            _merge_dedup_parts(self._export_folder)
+            _merge_timing_parts(self._export_folder)
+            _Manifest(self._export_folder).close()
+            if self._props.perf_report != 'NONE':
+                _merge_report_parts(self._export_folder, self._props.perf_report, self._job.timer.elapsed)
+        else:
+            self._job.close()
+
+    def finish(self, context):
+        self._close_job()
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+        if USE_SYSTEM_PROGRESS_HUD:
+            context.window_manager.progress_end()
+
+        bpy.ops.object.select_all(action='DESELECT')
+        for o in self._objects:
+            o.select_set(True)
+        context.view_layer.objects.active = self._original_active
+
+        wm = context.window_manager
+        wm.fbxseq_running = False
+        wm.fbxseq_progress = 1.0
+        wm.fbxseq_status = "Export finished"
+        _tag_redraw()
+        if self._pool:
+            self.report({'INFO'}, f"Exported {self._exported_count()} files.")
+        elif self._job.io is not None and self._job.io.errors:
+            self.report({'WARNING'}, self._job.summary_text())
+        else:
+            self.report({'INFO'}, self._job.summary_text())
+
+    def cancel(self, context):
+        self._close_job()
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+        if USE_SYSTEM_PROGRESS_HUD:
+            context.window_manager.progress_end()
 
         bpy.ops.object.select_all(action='DESELECT')
         for o in self._objects:
@@ -482,6 +4036,237 @@ class WM_OT_ExportFbxSequence(bpy.types.Operator):
         _tag_redraw()
         self.report({'WARNING'}, "Export cancelled.")
 
+# --------------------- Plan (dry-run estimate) ---------------------
+class WM_OT_FbxSequencePlan(bpy.types.Operator):
+    """Export a few sampled files to a temporary folder and estimate duration, size and memory of the export"""
+    bl_idname = "wm.fbx_sequence_plan"
+    bl_label = "Estimate Export"
+
+    @classmethod
+    def poll(cls, context):
+        return not context.window_manager.fbxseq_running
+
+    def execute(self, context):
+        props = context.scene.fbx_exporter_props
+        workers = props.parallel_workers if props.parallel_export else 0
+        try:
+            est = estimate_export(context, workers=workers, samples=props.plan_samples)
+        except (ValueError, OSError, RuntimeError) as ex:
+            self.report({'ERROR'}, str(ex))
+            return {'CANCELLED'}
+        lines = _estimate_lines(est)
+        context.window_manager.fbxseq_plan = "\n".join(lines)
+        self.report({'WARNING'} if est.warnings else {'INFO'}, "; ".join(lines))
+        return {'FINISHED'}
+
+# --------------------- Export Queue ---------------------
+# Object types a collection job exports (the exporter skips the rest anyway)
+_QUEUE_OBJECT_TYPES = {'MESH', 'ARMATURE', 'EMPTY'} | _PROXY_TYPES
+
+def _queue_job_objects(context, job, order_mode: str):
+    if job.source == 'COLLECTION':
+        if job.collection is None:
+            return []
+        objects = [o for o in job.collection.all_objects if o.type in _QUEUE_OBJECT_TYPES]
+        return _order_objects(context, objects, order_mode)
+    return [item.object for item in job.objects if item.object is not None]
+
+def _queue_order(queue):
+    """Indices of the jobs to run: enabled and not finished, by priority, then queue position."""
+    pending = [i for i, job in enumerate(queue) if job.enabled and job.status in {'QUEUED', 'RUNNING'}]
+    return sorted(pending, key=lambda i: -queue[i].priority)
+
+class WM_OT_FbxQueueAdd(bpy.types.Operator):
+    bl_idname = "wm.fbx_queue_add"
+    bl_label = "Add Export Job"
+    bl_description = "Queue an export of the current settings, frame range and export folder"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('OBJECTS', "Selected Objects", "Queue the selected objects"),
+            ('COLLECTION', "Active Collection", "Queue the active collection (its objects are read when the job runs)"),
+        ],
+        default='OBJECTS'
+    )
+
+    def execute(self, context):
+        p = context.scene.fbx_exporter_props
+        job = p.queue.add()
+        job.source = self.source
+        if self.source == 'COLLECTION':
+            job.collection = context.view_layer.active_layer_collection.collection
+            label = job.collection.name
+        else:
+            for obj in _ordered_selected_objects(context, p.object_order):
+                job.objects.add().object = obj
+            label = f"{len(job.objects)} object(s)"
+        job.settings = json.dumps(_settings_snapshot(p), sort_keys=True)
+        job.name = f"{label}, {p.start_frame}-{p.end_frame}"
+        return {'FINISHED'}
+
+class WM_OT_FbxQueueRemove(bpy.types.Operator):
+    bl_idname = "wm.fbx_queue_remove"
+    bl_label = "Remove Export Job"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(default=0, options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return not getattr(context.window_manager, "fbxseq_running", False)
+
+    def execute(self, context):
+        p = context.scene.fbx_exporter_props
+        if 0 <= self.index < len(p.queue):
+            p.queue.remove(self.index)
+        return {'FINISHED'}
+
+class WM_OT_FbxQueueReset(bpy.types.Operator):
+    bl_idname = "wm.fbx_queue_reset"
+    bl_label = "Reset Queue"
+    bl_description = "Mark every job as queued again"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return not getattr(context.window_manager, "fbxseq_running", False)
+
+    def execute(self, context):
+        for job in context.scene.fbx_exporter_props.queue:
+            job.status = 'QUEUED'
+            job.message = ""
+        return {'FINISHED'}
+
+class WM_OT_FbxQueueRun(bpy.types.Operator):
+    """Run the queued export jobs back to back"""
+    bl_idname = "wm.fbx_queue_run"
+    bl_label = "Run Queue"
+
+    _timer = None
+    _order = []
+    _position = 0
+    _events = None
+    _last_redraw = 0.0
+
+    @classmethod
+    def poll(cls, context):
+        return not getattr(context.window_manager, "fbxseq_running", False)
+
+    def invoke(self, context, event):
+        queue = context.scene.fbx_exporter_props.queue
+        self._order = _queue_order(queue)
+        if not self._order:
+            self.report({'WARNING'}, "No queued jobs to run.")
+            return {'CANCELLED'}
+        self._position = 0
+        self._events = None
+
+        wm = context.window_manager
+        wm.fbxseq_cancel = False
+        wm.fbxseq_running = True
+        wm.fbxseq_progress = 0.0
+        wm.fbxseq_status = f"Queue 1/{len(self._order)}…"
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        self._last_redraw = time.perf_counter()
+        _tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _job(self, context):
+        return context.scene.fbx_exporter_props.queue[self._order[self._position]]
+
+    def _start_job(self, context):
+        """Create the export generator of the current job; False if it could not start."""
+        job = self._job(context)
+        job.status = 'RUNNING'
+        job.message = ""
+        try:
+            settings = json.loads(job.settings or "{}")
+            settings_view = _PropsOverlay(context.scene.fbx_exporter_props, settings)
+            objects = _queue_job_objects(context, job, settings_view.object_order)
+            workers = settings_view.parallel_workers if settings_view.parallel_export else 0
+            self._events = iter_export(context, settings=settings, objects=objects, workers=workers, wait=False)
+        except Exception as ex:  # a job that cannot start fails alone; the queue goes on
+            self._end_job(context, 'FAILED', str(ex) or type(ex).__name__)
+            return False
+        return True
+
+    def _end_job(self, context, status, message):
+        job = self._job(context)
+        job.status = status
+        job.message = message
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        self._position += 1
+
+    def modal(self, context, event):
+        wm = context.window_manager
+        if event.type == 'ESC' or wm.fbxseq_cancel:
+            if self._events is not None and self._position < len(self._order):
+                self._end_job(context, 'CANCELLED', "Cancelled")
+            self._finish(context, "Queue cancelled")
+            self.report({'WARNING'}, "Export queue cancelled.")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        props = context.scene.fbx_exporter_props
+        deadline = time.perf_counter() + max(1, props.tick_budget_ms) / 1000.0
+        progress = None
+        while time.perf_counter() < deadline:
+            if self._position >= len(self._order):
+                failed = sum(props.queue[i].status == 'FAILED' for i in self._order)
+                self._finish(context, "Queue finished")
+                self.report({'WARNING'} if failed else {'INFO'},
+                            f"Ran {len(self._order)} export job(s)" + (f", {failed} failed." if failed else "."))
+                return {'FINISHED'}
+            if self._events is None and not self._start_job(context):
+                continue
+            try:
+                progress = next(self._events)
+            except StopIteration:
+                self._end_job(context, 'DONE', "")
+                continue
+            except Exception as ex:  # any failure ends this job only; the timer must keep running the queue
+                self._events = None  # the generator has already cleaned up
+                self._end_job(context, 'FAILED', str(ex) or type(ex).__name__)
+                continue
+            if progress.kind == 'WAIT':
+                break  # write-behind queue, stream or workers busy: give the UI the rest of the tick
+            if progress.kind == 'DONE':
+                self._end_job(context, 'DONE', progress.status)
+                break  # let the panel show the finished job
+
+        if progress is not None and self._position < len(self._order):
+            fraction = progress.done / progress.total if progress.kind != 'DONE' and progress.total else 0.0
+            wm.fbxseq_progress = (self._position + fraction) / len(self._order)
+            wm.fbxseq_status = (f"Queue {self._position + 1}/{len(self._order)} "
+                                f"'{self._job(context).name}': {progress.status}")
+        now = time.perf_counter()
+        if now - self._last_redraw >= REDRAW_INTERVAL:
+            self._last_redraw = now
+            _tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def _finish(self, context, status):
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.fbxseq_running = False
+        wm.fbxseq_progress = 1.0
+        wm.fbxseq_status = status
+        _tag_redraw()
+
+    def cancel(self, context):
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+        self._finish(context, "Queue cancelled")
+
 # --------------------- Helper ---------------------
 class WM_OT_SetSceneFrameRange(bpy.types.Operator):
     bl_idname = "wm.fbx_set_scene_frame_range"
@@ -493,6 +4278,52 @@ class WM_OT_SetSceneFrameRange(bpy.types.Operator):
         p.end_frame = context.scene.frame_end
         return {'FINISHED'}
 
+# Starting values for new output profiles
+_PROFILE_PRESETS = {
+    'CUSTOM': {},
+    'UNITY': {"axis_forward": '-Z', "axis_up": 'Y', "apply_scalings": 'ALL_LOCAL', "global_scale": 1.0},
+    'UNREAL': {"axis_forward": 'X', "axis_up": 'Z', "apply_scalings": 'FBX_ALL', "global_scale": 0.01},
+}
+
+class WM_OT_FbxSequenceProfileAdd(bpy.types.Operator):
+    bl_idname = "wm.fbx_sequence_profile_add"
+    bl_label = "Add Output Profile"
+    bl_description = "Add an output profile, starting from the current transform options"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset: bpy.props.EnumProperty(
+        name="Preset",
+        items=[
+            ('CUSTOM', "Current Options", "Copy the current transform options"),
+            ('UNITY', "Unity", "-Z forward, Y up, All Local"),
+            ('UNREAL', "Unreal", "X forward, Z up, FBX All, scale 0.01"),
+        ],
+        default='CUSTOM'
+    )
+
+    def execute(self, context):
+        p = context.scene.fbx_exporter_props
+        profile = p.profiles.add()
+        profile.name = {'UNITY': "Unity", 'UNREAL': "Unreal"}.get(self.preset, f"Profile {len(p.profiles)}")
+        for key in _PROFILE_KEYS:
+            setattr(profile, key, getattr(p, key))
+        for key, value in _PROFILE_PRESETS[self.preset].items():
+            setattr(profile, key, value)
+        return {'FINISHED'}
+
+class WM_OT_FbxSequenceProfileRemove(bpy.types.Operator):
+    bl_idname = "wm.fbx_sequence_profile_remove"
+    bl_label = "Remove Output Profile"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty(default=0, options={'HIDDEN'})
+
+    def execute(self, context):
+        p = context.scene.fbx_exporter_props
+        if 0 <= self.index < len(p.profiles):
+            p.profiles.remove(self.index)
+        return {'FINISHED'}
+
 # --------------------- Panel ---------------------
 class VIEW3D_PT_FBXExporterPanel(bpy.types.Panel):
     bl_space_type = 'VIEW_3D'
@@ -514,6 +4345,9 @@ class VIEW3D_PT_FBXExporterPanel(bpy.types.Panel):
             row.prop(props, "object_order", text="Object Order")
             row = box.row(align=True)
             row.prop(props, "object_index_digits", text="Object Index Digits")
+        elif props.export_mode == 'GROUPED':
+            box.prop(props, "group_by")
+            box.prop(props, "object_order", text="Object Order")
 
         # File naming
         box = layout.box()
@@ -527,16 +4361,71 @@ class VIEW3D_PT_FBXExporterPanel(bpy.types.Panel):
         box.prop(props, "export_path", text="")
         row = box.row()
         row.operator(WM_OT_SetSceneFrameRange.bl_idname, text="Match Scene Frame Range")
-        if props.export_mode == 'SEQUENCE':
+        if props.export_mode != 'PER_OBJECT':
             split = box.split(factor=0.5)
             split.prop(props, "start_frame", text="Start")
             split.prop(props, "end_frame", text="End")
             box.prop(props, "frame_interval", text="Frame Interval")
+        if props.export_mode in {'SEQUENCE', 'GROUPED'}:
+            box.prop(props, "adaptive_sampling")
+            if props.adaptive_sampling:
+                row = box.row(align=True)
+                row.prop(props, "adaptive_metric", text="")
+                row.prop(props, "adaptive_tolerance")
+                row.prop(props, "adaptive_max_gap")
+        if props.export_mode in {'SEQUENCE', 'GROUPED'}:
+            box.prop(props, "package")
+            if props.export_mode == 'SEQUENCE':
+                row = box.row(align=True)
+                row.enabled = props.package == 'NONE'
+                row.prop(props, "parallel_export")
+                sub = row.row(align=True)
+                sub.enabled = props.parallel_export
+                sub.prop(props, "parallel_workers")
+            row = box.row(align=True)
+            row.prop(props, "dedup_frames")
+            sub = row.row(align=True)
+            sub.enabled = props.dedup_frames
+            sub.prop(props, "dedup_method", text="")
+        if props.export_mode == 'POINT_CACHE':
+            box.prop(props, "cache_normals")
+        elif props.export_mode == 'POSE':
+            box.prop(props, "pose_format")
+        elif props.export_mode == 'PER_OBJECT' or (props.package == 'NONE' and not props.adaptive_sampling):
+            box.prop(props, "update_mode")
 
         # Trigger
         row = layout.row()
         row.scale_y = 1.3
         row.operator(WM_OT_ExportFbxSequence.bl_idname, text="Export FBX")
+        row.operator(WM_OT_FbxSequencePlan.bl_idname, text="", icon='TIME')
+        plan = context.window_manager.fbxseq_plan
+        if plan:
+            box = layout.box()
+            box.label(text="Estimate")
+            for i, line in enumerate(plan.split("\n")):
+                box.label(text=line, icon='INFO' if i < 2 else 'ERROR')
+
+        # Export queue
+        box = layout.box()
+        row = box.row()
+        row.label(text=f"Queue ({len(props.queue)})")
+        row.operator_menu_enum(WM_OT_FbxQueueAdd.bl_idname, "source", text="", icon='ADD')
+        status_icons = {'QUEUED': 'TIME', 'RUNNING': 'PLAY', 'DONE': 'CHECKMARK', 'FAILED': 'ERROR',
+                        'CANCELLED': 'CANCEL'}
+        for i, job in enumerate(props.queue):
+            row = box.row(align=True)
+            row.prop(job, "enabled", text="")
+            row.label(text="", icon=status_icons[job.status])
+            row.prop(job, "name", text="")
+            row.prop(job, "priority", text="")
+            row.operator(WM_OT_FbxQueueRemove.bl_idname, text="", icon='X').index = i
+            if job.message and job.status != 'DONE':
+                box.label(text=job.message, icon='INFO')
+        if props.queue:
+            row = box.row(align=True)
+            row.operator(WM_OT_FbxQueueRun.bl_idname, icon='PLAY')
+            row.operator(WM_OT_FbxQueueReset.bl_idname, text="", icon='FILE_REFRESH')
         layout.separator()
 
         # Transform
@@ -548,12 +4437,75 @@ class VIEW3D_PT_FBXExporterPanel(bpy.types.Panel):
         split.prop(props, "axis_forward", text="Forward")
         split.prop(props, "axis_up", text="Up")
         box.prop(props, "bake_space_transform")
+        box.prop(props, "export_engine")
+
+        # Output profiles (replace the transform options above when any is enabled)
+        box = layout.box()
+        row = box.row()
+        row.label(text="Output Profiles")
+        row.operator_menu_enum(WM_OT_FbxSequenceProfileAdd.bl_idname, "preset", text="", icon='ADD')
+        for i, profile in enumerate(props.profiles):
+            sub = box.box()
+            row = sub.row(align=True)
+            row.prop(profile, "enabled", text="")
+            row.prop(profile, "name", text="")
+            row.operator(WM_OT_FbxSequenceProfileRemove.bl_idname, text="", icon='X').index = i
+            if not profile.enabled:
+                continue
+            sub.prop(profile, "subfolder")
+            split = sub.split(factor=0.5, align=True)
+            split.prop(profile, "axis_forward", text="Forward")
+            split.prop(profile, "axis_up", text="Up")
+            row = sub.row(align=True)
+            row.prop(profile, "global_scale")
+            row.prop(profile, "apply_scalings", text="")
+            row = sub.row(align=True)
+            row.prop(profile, "bake_space_transform")
+            row.prop(profile, "use_mesh_modifiers")
 
         # Other
         box = layout.box()
         box.label(text="Other Options")
         box.prop(props, "use_mesh_modifiers")
         box.prop(props, "bake_anim")
+        box.label(text="Leave Out")
+        row = box.row(align=True)
+        row.prop(props, "strip_uvs", toggle=True)
+        row.prop(props, "strip_colors", toggle=True)
+        row.prop(props, "strip_materials", toggle=True)
+        sub = row.row(align=True)
+        sub.enabled = props.export_engine == 'NATIVE'
+        sub.prop(props, "strip_normals", toggle=True)
+        if props.export_mode != 'PER_OBJECT':
+            box.prop(props, "isolate_evaluation")
+        box.prop(props, "tick_budget_ms")
+        box.prop(props, "plan_samples")
+        box.prop(props, "perf_report")
+        box.prop(props, "suspend_undo")
+        box.prop(props, "purge_interval")
+        row = box.row(align=True)
+        row.prop(props, "memory_limit_mb")
+        sub = row.row(align=True)
+        sub.enabled = props.memory_limit_mb > 0
+        sub.prop(props, "memory_action", text="")
+        rss = _process_rss()
+        if rss is not None:
+            box.label(text=f"Memory: {_format_bytes(rss)}", icon='MEMORY')
+        box.prop(props, "use_scratch")
+        if props.use_scratch:
+            box.prop(props, "scratch_path", text="")
+            box.prop(props, "commit_action")
+            row = box.row(align=True)
+            row.prop(props, "io_threads")
+            row.prop(props, "io_queue_size")
+        if props.export_mode in {'SEQUENCE', 'GROUPED'}:
+            box.prop(props, "stream_output")
+            if props.stream_output:
+                box.prop(props, "stream_address")
+                row = box.row(align=True)
+                row.prop(props, "stream_window")
+                row.prop(props, "stream_timeout")
+                box.prop(props, "stream_keep_files")
 
         # Progress
         if wm.fbxseq_running:
@@ -564,10 +4516,20 @@ class VIEW3D_PT_FBXExporterPanel(bpy.types.Panel):
 
 # --------------------- Register / Unregister ---------------------
 classes = (
+    FBXExportProfile,
+    FBXQueueObject,
+    FBXExportQueueJob,
     FBXExporterProperties,
     WM_OT_FbxSequenceCancel,
     WM_OT_ExportFbxSequence,
     WM_OT_SetSceneFrameRange,
+    WM_OT_FbxSequenceProfileAdd,
+    WM_OT_FbxSequenceProfileRemove,
+    WM_OT_FbxQueueAdd,
+    WM_OT_FbxQueueRemove,
+    WM_OT_FbxQueueReset,
+    WM_OT_FbxQueueRun,
+    WM_OT_FbxSequencePlan,
     VIEW3D_PT_FBXExporterPanel,
 )
 
@@ -577,6 +4539,10 @@ def register():
         bpy.utils.register_class(c)
     bpy.types.Scene.fbx_exporter_props = bpy.props.PointerProperty(type=FBXExporterProperties)
     bpy.types.STATUSBAR_HT_header.append(_draw_statusbar)
+    bpy.app.handlers.depsgraph_update_post.append(_outliner_index_update)
+    bpy.app.handlers.load_post.append(_outliner_index_reset)
+    bpy.app.handlers.undo_post.append(_outliner_index_reset)
+    bpy.app.handlers.redo_post.append(_outliner_index_reset)
     print("[FBX Sequence Exporter] Registered v1.7")
 
 def unregister():
@@ -584,9 +4550,20 @@ def unregister():
         bpy.types.STATUSBAR_HT_header.remove(_draw_statusbar)
     except Exception:
         pass
+    for handlers, fn in ((bpy.app.handlers.depsgraph_update_post, _outliner_index_update),
+                         (bpy.app.handlers.load_post, _outliner_index_reset),
+                         (bpy.app.handlers.undo_post, _outliner_index_reset),
+                         (bpy.app.handlers.redo_post, _outliner_index_reset)):
+        if fn in handlers:
+            handlers.remove(fn)
+    _outliner_index.clear()
     del bpy.types.Scene.fbx_exporter_props
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
 
 if __name__ == "__main__":
+    if _WORKER_ARG in sys.argv:
+        sys.exit(_worker_main(sys.argv))
+    if "--" in sys.argv:
+        sys.exit(cli_main(sys.argv[sys.argv.index("--") + 1:]))
     register()
@@ -0,0 +1,301 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless throughput benchmark for the FBX Sequence Exporter.
+
+Generates a stress scene (meshes with modifier stacks, bevelled curves,
+skinned armatures) animated over M frames, exports it with the add-on's
+export job, and records files/s, peak RSS, bytes written and per-stage times.
+
+    blender -b --factory-startup --python tools/fbxseq_benchmark.py -- \
+        --scenario mixed --output bench.json --baseline baseline.json
+
+Exit codes: 0 = ok, 1 = slower than `--threshold` x baseline (or below
+`--min-fps`), 2 = bad arguments / setup error.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import bpy
+
+ADDON_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "__init__.py")
+
+# name -> scene parameters; every value can be overridden on the command line
+SCENARIOS = {
+    "mixed": dict(meshes=8, curves=4, armatures=2, modifiers=2, subdivisions=2, frames=24),
+    "many_small": dict(meshes=64, curves=0, armatures=0, modifiers=0, subdivisions=0, frames=12),
+    "heavy": dict(meshes=4, curves=0, armatures=0, modifiers=3, subdivisions=5, frames=8),
+    "curves": dict(meshes=0, curves=24, armatures=0, modifiers=0, subdivisions=0, frames=24),
+}
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_ERROR = 2
+
+
+def _load_addon():
+    spec = importlib.util.spec_from_file_location("fbxseq_addon", ADDON_FILE)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    module.register()
+    return module
+
+
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _animate(obj, frames, path="location", index=2, amount=2.0):
+    obj.keyframe_insert(path, index=index, frame=1)
+    getattr(obj, path)[index] += amount
+    obj.keyframe_insert(path, index=index, frame=frames)
+
+
+def build_scene(meshes, curves, armatures, modifiers, subdivisions, frames):
+    """Reset to an empty scene and build the stress objects; returns them in creation order."""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    import addon_utils
+    addon_utils.enable("io_scene_fbx", default_set=False)
+
+    scene = bpy.context.scene
+    scene.frame_start, scene.frame_end = 1, frames
+    objects = []
+
+    for i in range(meshes):
+        bpy.ops.mesh.primitive_uv_sphere_add(segments=16, ring_count=8, location=(i * 3.0, 0.0, 0.0))
+        obj = bpy.context.object
+        obj.name = f"Mesh{i:03d}"
+        if subdivisions:
+            obj.modifiers.new("Subdivision", 'SUBSURF').levels = subdivisions
+        for k in range(modifiers):
+            wave = obj.modifiers.new(f"Wave{k}", 'WAVE')
+            wave.height = 0.2
+            wave.width = 0.5 + k
+            wave.speed = 0.1
+        _animate(obj, frames)
+        objects.append(obj)
+
+    for i in range(curves):
+        bpy.ops.curve.primitive_bezier_circle_add(location=(i * 3.0, 6.0, 0.0))
+        obj = bpy.context.object
+        obj.name = f"Curve{i:03d}"
+        obj.data.bevel_depth = 0.2
+        obj.data.bevel_resolution = 4
+        _animate(obj, frames, path="rotation_euler", amount=3.14)
+        objects.append(obj)
+
+    for i in range(armatures):
+        bpy.ops.object.armature_add(location=(i * 4.0, -6.0, 0.0))
+        rig = bpy.context.object
+        rig.name = f"Rig{i:03d}"
+        bpy.ops.object.mode_set(mode='EDIT')
+        parent = rig.data.edit_bones[0]
+        for b in range(1, 4):
+            bone = rig.data.edit_bones.new(f"Bone{b}")
+            bone.head = parent.tail
+            bone.tail = parent.tail + (parent.tail - parent.head)
+            bone.parent = parent
+            parent = bone
+        bpy.ops.object.mode_set(mode='OBJECT')
+        for pose_bone in rig.pose.bones:
+            pose_bone.rotation_mode = 'XYZ'
+            pose_bone.keyframe_insert("rotation_euler", frame=1)
+            pose_bone.rotation_euler.x = 0.6
+            pose_bone.keyframe_insert("rotation_euler", frame=frames)
+
+        bpy.ops.mesh.primitive_cylinder_add(vertices=24, depth=4.0, location=(i * 4.0, -6.0, 2.0))
+        skin = bpy.context.object
+        skin.name = f"Skin{i:03d}"
+        bpy.ops.object.select_all(action='DESELECT')
+        skin.select_set(True)
+        rig.select_set(True)
+        bpy.context.view_layer.objects.active = rig
+        bpy.ops.object.parent_set(type='ARMATURE_AUTO')
+        objects += [rig, skin]
+
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in objects:
+        obj.select_set(True)
+    return objects
+
+
+def run_once(addon, objects, export_folder, settings):
+    """Export `objects` once with the add-on job; returns the measurements of this run."""
+    context = bpy.context
+    props = context.scene.fbx_exporter_props
+    for key, value in settings.items():
+        setattr(props, key, value)
+    props.export_path = export_folder
+    props.start_frame = context.scene.frame_start
+    props.end_frame = context.scene.frame_end
+
+    for obj in objects:
+        obj.select_set(True)
+    ordered = addon._ordered_selected_objects(context, props.object_order)
+    job = addon._ExportJob(context, props, ordered, export_folder)
+    start = time.perf_counter()
+    while job.step(context):
+        pass
+    job.close()
+    elapsed = time.perf_counter() - start
+    return {
+        "files": job.exported_count,
+        "seconds": elapsed,
+        "files_per_second": job.exported_count / elapsed if elapsed > 0 else 0.0,
+        "bytes_written": job.timer.bytes_written,
+        "stages": job.timer.totals,
+    }
+
+
+def compare(result, baseline, threshold, min_fps):
+    """Return a list of failure messages (empty when the run passes)."""
+    failures = []
+    fps = result["files_per_second"]
+    if min_fps and fps < min_fps:
+        failures.append(f"{fps:.2f} files/s is below the minimum of {min_fps:.2f}")
+    if baseline:
+        base_fps = baseline["files_per_second"]
+        if fps < base_fps * threshold:
+            failures.append(f"{fps:.2f} files/s is below {threshold:.0%} of the baseline ({base_fps:.2f})")
+    return failures
+
+
+def parse_args(argv):
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+    parser = argparse.ArgumentParser(prog="fbxseq_benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    for key in ("meshes", "curves", "armatures", "modifiers", "subdivisions", "frames"):
+        parser.add_argument(f"--{key}", type=int, help=f"override the scenario's {key}")
+    parser.add_argument("--engine", choices=("BLENDER", "NATIVE"), default="BLENDER")
+    parser.add_argument("--mode", choices=("SEQUENCE", "POINT_CACHE"), default="SEQUENCE")
+    parser.add_argument("--set", metavar="PROP=VALUE", action="append", default=[],
+                        help="extra exporter property, e.g. --set dedup_frames=True")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the fastest one is reported")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run in --baseline")
+    parser.add_argument("--threshold", type=float, default=0.9,
+                        help="fail when files/s drops below this fraction of the baseline")
+    parser.add_argument("--min-fps", type=float, default=0.0, help="fail below this absolute files/s")
+    parser.add_argument("--keep", action="store_true", help="keep the exported files")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv)
+    params = dict(SCENARIOS[args.scenario])
+    for key in params:
+        if getattr(args, key) is not None:
+            params[key] = getattr(args, key)
+    settings = {"export_mode": args.mode, "export_engine": args.engine}
+    for item in args.set:
+        key, sep, value = item.partition("=")
+        if not sep:
+            print(f"--set expects PROP=VALUE, got {item!r}", file=sys.stderr)
+            return EXIT_ERROR
+        settings[key.strip()] = value
+
+    addon = _load_addon()
+    objects = build_scene(**params)
+    # same conversion as the add-on's command line; values RNA still rejects are argument errors too
+    props = bpy.context.scene.fbx_exporter_props
+    try:
+        settings = {k: addon._coerce_setting(k, v) for k, v in settings.items()}
+        for k, v in settings.items():
+            setattr(props, k, v)
+    except (TypeError, ValueError) as ex:
+        print(f"Invalid --set value: {ex}", file=sys.stderr)
+        return EXIT_ERROR
+    # name of this configuration in the baseline file
+    key = "-".join([args.scenario, args.mode.lower(), args.engine.lower()]
+                   + [f"{k}={v}" for k, v in sorted(params.items()) if v != SCENARIOS[args.scenario][k]]
+                   + sorted(args.set))
+
+    runs = []
+    work = tempfile.mkdtemp(prefix="fbxseq_bench_")
+    try:
+        for i in range(max(1, args.repeat)):
+            folder = os.path.join(work, f"run{i}")
+            os.makedirs(folder)
+            runs.append(run_once(addon, objects, folder, settings))
+            print(f"[fbxseq_benchmark] {key} run {i + 1}: {runs[-1]['files']} files, "
+                  f"{runs[-1]['files_per_second']:.2f} files/s, {runs[-1]['bytes_written'] / 1e6:.1f} MB")
+            if not args.keep:
+                shutil.rmtree(folder, ignore_errors=True)
+    finally:
+        if not args.keep:
+            shutil.rmtree(work, ignore_errors=True)
+
+    best = max(runs, key=lambda r: r["files_per_second"])
+    result = {
+        "version": 1,
+        "addon_version": list(addon.bl_info["version"]),
+        "blender": bpy.app.version_string,
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+        "scenario": args.scenario,
+        "params": params,
+        "settings": settings,
+        "objects": len(objects),
+        "peak_rss_bytes": _peak_rss_bytes(),
+        "runs": runs,
+        **{k: best[k] for k in ("files", "seconds", "files_per_second", "bytes_written", "stages")},
+    }
+
+    baselines = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+    failures = compare(result, baselines.get(key), args.threshold, args.min_fps)
+    result["baseline_files_per_second"] = baselines.get(key, {}).get("files_per_second")
+    result["passed"] = not failures
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({key: result}, f, indent=1, sort_keys=True)
+    if args.save_baseline:
+        if not args.baseline:
+            print("--save-baseline needs --baseline", file=sys.stderr)
+            return EXIT_ERROR
+        baselines[key] = result
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=1, sort_keys=True)
+
+    stages = ", ".join(f"{k} {v:.2f}s" for k, v in result["stages"].items() if v)
+    print(f"[fbxseq_benchmark] {key}: {result['files_per_second']:.2f} files/s (best of {len(runs)}), {stages}")
+    for message in failures:
+        print(f"[fbxseq_benchmark] FAIL: {message}", file=sys.stderr)
+    return EXIT_REGRESSION if failures else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
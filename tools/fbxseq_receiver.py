@@ -0,0 +1,162 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Reference consumer for the FBX Sequence Exporter's live stream.
+
+Listens on a TCP or Unix-domain socket, reads the length-prefixed file
+messages the exporter sends with "Stream to Socket" enabled, optionally writes
+them to a folder, and acknowledges each one. `--delay` simulates a slow
+consumer to check that the export is paced by the acknowledgements.
+
+    python tools/fbxseq_receiver.py --listen 127.0.0.1:9877 --output preview/
+
+Plain Python (no Blender needed). Exit codes: 0 = ok, 2 = bad arguments /
+protocol error.
+"""
+
+import argparse
+import os
+import socket
+import struct
+import sys
+import time
+
+# must match the add-on's stream constants (see "Live Stream" in __init__.py)
+STREAM_MAGIC = b"FBXS"
+STREAM_ACK_MAGIC = b"FBXA"
+STREAM_VERSION = 1
+STREAM_FILE, STREAM_REPEAT, STREAM_END = 1, 2, 3
+HEADER = struct.Struct("<4sBBHH2xiIQ")
+ACK = struct.Struct("<4sI")
+
+EXIT_OK = 0
+EXIT_ERROR = 2
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def _recv_exact(conn, size):
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 1 << 20))
+        if not chunk:
+            raise EOFError
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _listen(address):
+    if address.startswith(("unix:", "/")):
+        path = address[len("unix:"):] if address.startswith("unix:") else address
+        if os.path.exists(path):
+            os.remove(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+    else:
+        host, _sep, port = address.rpartition(":")
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host or "127.0.0.1", int(port)))
+    server.listen(1)
+    return server
+
+
+def _output_path(output, name):
+    """Path of the sent file `name` under `output`; names resolving outside it are rejected."""
+    root = os.path.realpath(output)
+    path = os.path.realpath(os.path.join(root, *name.split("/")))
+    if os.path.commonpath([root, path]) != root or path == root:
+        raise ProtocolError(f"file name {name!r} is outside the output folder")
+    return path
+
+
+def receive(conn, output=None, delay=0.0, log=print):
+    """Handle one exporter connection until END. Returns (files, repeats, payload bytes)."""
+    files = repeats = size = 0
+    started = time.perf_counter()
+    while True:
+        try:
+            header = _recv_exact(conn, HEADER.size)
+        except EOFError:
+            raise ProtocolError("connection closed before END") from None
+        magic, version, kind, name_len, obj_len, frame, seq, payload_len = HEADER.unpack(header)
+        if magic != STREAM_MAGIC or version != STREAM_VERSION:
+            raise ProtocolError(f"unexpected header {magic!r} version {version}")
+        name = _recv_exact(conn, name_len).decode("utf-8")
+        obj_name = _recv_exact(conn, obj_len).decode("utf-8")
+        payload = _recv_exact(conn, payload_len)
+
+        if kind == STREAM_END:
+            conn.sendall(ACK.pack(STREAM_ACK_MAGIC, seq))
+            elapsed = time.perf_counter() - started
+            log(f"[fbxseq_receiver] END: {files} files, {repeats} repeats, {size} bytes in {elapsed:.2f}s")
+            return files, repeats, size
+        if kind == STREAM_FILE:
+            files += 1
+            size += payload_len
+            if output:
+                path = _output_path(output, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(payload)
+            log(f"[fbxseq_receiver] #{seq} frame {frame} {obj_name}: {name} ({payload_len} bytes)")
+        elif kind == STREAM_REPEAT:
+            repeats += 1
+            log(f"[fbxseq_receiver] #{seq} frame {frame} {obj_name}: {name} = {payload.decode('utf-8')}")
+        else:
+            raise ProtocolError(f"unknown message kind {kind}")
+        if delay:
+            time.sleep(delay)
+        conn.sendall(ACK.pack(STREAM_ACK_MAGIC, seq))
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="fbxseq_receiver", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--listen", default="127.0.0.1:9877", help="host:port or unix:/path (default %(default)s)")
+    parser.add_argument("--output", help="write the received files below this folder")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before acknowledging a file")
+    parser.add_argument("--once", action="store_true", help="exit after the first export has ended")
+    return parser.parse_args(argv)
+
+
+def main(argv):
+    args = parse_args(argv[1:])
+    try:
+        server = _listen(args.listen)
+    except (OSError, ValueError) as ex:
+        print(f"[fbxseq_receiver] cannot listen on {args.listen}: {ex}", file=sys.stderr)
+        return EXIT_ERROR
+    print(f"[fbxseq_receiver] listening on {args.listen}", flush=True)
+    with server:
+        while True:
+            conn, _peer = server.accept()
+            with conn:
+                try:
+                    receive(conn, args.output, args.delay)
+                except (ProtocolError, OSError) as ex:
+                    print(f"[fbxseq_receiver] {ex}", file=sys.stderr)
+                    if args.once:
+                        return EXIT_ERROR
+            if args.once:
+                return EXIT_OK
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main(sys.argv))
+    except KeyboardInterrupt:
+        sys.exit(EXIT_OK)